@@ -0,0 +1,95 @@
+"""Measure the startup time and memory use of :func:`qtrio.run` for each
+:class:`qtrio.ApplicationType`.
+
+.. code-block:: bash
+
+   python benchmarks/application_types.py --repeat 5
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import typing
+
+import qtrio
+
+
+child_code = r"""
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+
+import qtrio
+import trio
+
+
+async def main():
+    await trio.sleep(0)
+
+
+qtrio.run(main, application_type=qtrio.ApplicationType[sys.argv[1]])
+end = time.perf_counter()
+
+maximum_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+if sys.platform == "darwin":
+    maximum_rss //= 1024
+
+print(json.dumps({"run": end - start, "maximum_rss_kib": maximum_rss}))
+"""
+"""Run in a new process for each measurement.  :mod:`resource` is not available on
+Windows.
+"""
+
+
+def measure(application_type: qtrio.ApplicationType) -> typing.Dict[str, float]:
+    """Run a trivial async function with :func:`qtrio.run` in a new Python process.
+
+    Args:
+        application_type: The type of application to build.
+
+    Returns:
+        The wall time of the process, the time from importing QTrio to the run being
+        done, both in seconds, and the peak resident set size in KiB.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", child_code, application_type.name],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+
+    result: typing.Dict[str, float] = json.loads(completed.stdout)
+    result["wall"] = wall
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(f"{'':>8} {'wall (ms)':>10} {'run (ms)':>9} {'max RSS (MiB)':>14}")
+
+    for application_type in qtrio.ApplicationType:
+        results = [measure(application_type) for _ in range(arguments.repeat)]
+
+        wall = min(result["wall"] for result in results)
+        run = min(result["run"] for result in results)
+        rss = min(result["maximum_rss_kib"] for result in results)
+
+        print(
+            f"{application_type.name:>8} {wall * 1000:>10.1f} {run * 1000:>9.1f}"
+            f" {rss / 1024:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
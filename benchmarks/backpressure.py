@@ -0,0 +1,144 @@
+"""Measure the emissions buffered and the memory used while a slow consumer reads from a
+fast ``readyRead`` style source with and without :class:`qtrio.Backpressure`.
+
+.. code-block:: bash
+
+   python benchmarks/backpressure.py --duration 3 --delay 0.001
+"""
+import argparse
+import time
+import tracemalloc
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+
+
+class Device(QtCore.QObject):
+    """A stand in for a device which emits ``readyRead`` as data arrives and lets all
+    of the available data be read at once.
+    """
+
+    readyRead = QtCore.Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.available = 0
+        self.written = 0
+
+    def write(self, count: int) -> None:
+        self.available += count
+        self.written += count
+        self.readyRead.emit()
+
+    def read_all(self) -> int:
+        count = self.available
+        self.available = 0
+
+        return count
+
+
+async def measure(
+    duration: float, delay: float, chunk: int, backpressure: bool
+) -> typing.Dict[str, float]:
+    """Write to the device from a zero interval timer while a consumer takes ``delay``
+    seconds to handle each emission.
+
+    Args:
+        duration: The time to write for, in seconds.
+        delay: The time to handle each emission, in seconds.
+        chunk: The number of items written each time the timer fires.
+        backpressure: Whether to pause the device while the consumer is behind.
+
+    Returns:
+        The emissions received, the number left waiting to be received, the peak
+        memory traced in MiB, the pauses, and the fraction of the written items read.
+    """
+    device = Device()
+    timer = QtCore.QTimer()
+    timer.setInterval(0)
+    timer.timeout.connect(lambda: device.write(chunk))
+
+    received = 0
+    read = 0
+    backlog = 0
+
+    tracemalloc.start()
+
+    async with qtrio.enter_emissions_channel(
+        signals=[device.readyRead],
+        backpressure=(
+            qtrio.Backpressure(high_water=1, objects=[device]) if backpressure else None
+        ),
+    ) as emissions:
+        timer.start()
+        end = time.perf_counter() + duration
+
+        async for _ in emissions.channel:
+            received += 1
+            read += device.read_all()
+            await trio.sleep(delay)
+
+            if time.perf_counter() >= end:
+                break
+
+        timer.stop()
+        read += device.read_all()
+
+        while True:
+            try:
+                emissions.channel.receive_nowait()
+            except trio.WouldBlock:
+                break
+
+            backlog += 1
+
+        pauses = emissions.pauses
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "received": received,
+        "backlog": backlog,
+        "peak": peak / 2**20,
+        "pauses": pauses,
+        "read": read / device.written,
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(
+        f"{'':>13} {'received':>9} {'backlog':>8} {'peak (MiB)':>11}"
+        f" {'pauses':>7} {'read':>6}"
+    )
+
+    for name, backpressure in {"unbounded": False, "backpressure": True}.items():
+        result = await measure(
+            duration=arguments.duration,
+            delay=arguments.delay,
+            chunk=arguments.chunk,
+            backpressure=backpressure,
+        )
+
+        print(
+            f"{name:>13} {result['received']:>9,.0f} {result['backlog']:>8,.0f}"
+            f" {result['peak']:>11.1f} {result['pauses']:>7,.0f}"
+            f" {result['read']:>6.1%}"
+        )
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=3)
+    parser.add_argument("--delay", type=float, default=0.001)
+    parser.add_argument("--chunk", type=int, default=10)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,111 @@
+"""Measure the cost of creating :class:`qtrio.Emission` objects compared to
+:class:`qtrio.CompactEmission` objects for a rapidly emitted signal.
+
+.. code-block:: bash
+
+   python benchmarks/compact_emissions.py --count 200000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import typing
+
+from qts import QtCore
+
+import qtrio
+
+
+class Source(QtCore.QObject):
+    """A stand in for an instrument emitting readings."""
+
+    reading = QtCore.Signal(int)
+
+
+async def measure(count: int, compact: bool) -> typing.Dict[str, float]:
+    """Emit ``count`` times into an emissions channel without receiving in between.
+
+    Args:
+        count: The number of emissions.
+        compact: Whether to open the channel in compact mode.
+
+    Returns:
+        The emissions per second, the bytes allocated per buffered emission, and the
+        number of generation zero garbage collections per thousand emissions.
+    """
+    source = Source()
+    collections = 0
+
+    def callback(phase: str, info: typing.Dict[str, int]) -> None:
+        nonlocal collections
+
+        if phase == "start" and info["generation"] == 0:
+            collections += 1
+
+    async with qtrio.enter_emissions_channel(
+        signals=[source.reading], compact=compact
+    ) as emissions:
+        gc.collect()
+        gc.callbacks.append(callback)
+
+        try:
+            start = time.perf_counter()
+
+            for i in range(count):
+                source.reading.emit(i)
+
+            end = time.perf_counter()
+        finally:
+            gc.callbacks.remove(callback)
+
+        await emissions.receive_batch()
+
+        tracemalloc.start()
+
+        try:
+            for i in range(count):
+                source.reading.emit(i)
+
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        await emissions.receive_batch()
+
+    return {
+        "rate": count / (end - start),
+        "bytes": allocated / count,
+        "collections": 1000 * collections / count,
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(
+        f"{'':>8} {'emissions/second':>17} {'bytes/emission':>15}"
+        f" {'gen0 GCs/1000':>14}"
+    )
+
+    for name, compact in {"default": False, "compact": True}.items():
+        results = [
+            await measure(count=arguments.count, compact=compact)
+            for _ in range(arguments.repeat)
+        ]
+
+        rate = max(result["rate"] for result in results)
+        allocated = min(result["bytes"] for result in results)
+        collections = min(result["collections"] for result in results)
+
+        print(f"{name:>8} {rate:>17,.0f} {allocated:>15.1f} {collections:>14.2f}")
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,121 @@
+"""Measure the tasks started and the most running at once for each
+:class:`qtrio.ConcurrencyPolicy` while a search box style signal is emitted faster than
+its slot completes.
+
+.. code-block:: bash
+
+   python benchmarks/concurrency_policies.py --edits 200 --interval 0.005 --query 0.05
+"""
+import argparse
+import time
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+
+
+class SearchBox(QtCore.QObject):
+    """A stand in for a line edit emitting its text as the user types."""
+
+    textChanged = QtCore.Signal(str)
+
+
+async def measure(
+    concurrency: qtrio.ConcurrencyPolicy, edits: int, interval: float, query: float
+) -> typing.Dict[str, object]:
+    """Emit ``edits`` text changes ``interval`` seconds apart to a slot which takes
+    ``query`` seconds.
+
+    Args:
+        concurrency: The policy for the connection.
+        edits: The number of text changes to emit.
+        interval: The time between text changes, in seconds.
+        query: The time the slot takes, in seconds.
+
+    Returns:
+        The number of slot calls started and completed, the most running at once, the
+        text of the last completed call, and the time to settle in seconds.
+    """
+    search_box = SearchBox()
+    started = 0
+    completed = 0
+    running = 0
+    most_running = 0
+    last = ""
+
+    async def search(text: str) -> None:
+        nonlocal started, completed, running, most_running, last
+        started += 1
+        running += 1
+        most_running = max(most_running, running)
+
+        try:
+            await trio.sleep(query)
+            completed += 1
+            last = text
+        finally:
+            running -= 1
+
+    start = time.perf_counter()
+
+    async with qtrio.open_emissions_nursery() as emissions_nursery:
+        emissions_nursery.connect(
+            signal=search_box.textChanged, slot=search, concurrency=concurrency
+        )
+
+        for edit in range(edits):
+            search_box.textChanged.emit(f"query {edit}")
+            await trio.sleep(interval)
+
+    return {
+        "started": started,
+        "completed": completed,
+        "most_running": most_running,
+        "last": last,
+        "settle": time.perf_counter() - start,
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    policies: typing.Dict[str, qtrio.ConcurrencyPolicy] = {
+        "unlimited": qtrio.UnlimitedConcurrency(),
+        "queue": qtrio.QueueWhileBusy(),
+        "queue 4": qtrio.QueueWhileBusy(max_tasks=4),
+        "drop": qtrio.DropWhileBusy(),
+        "cancel": qtrio.CancelPrevious(),
+    }
+
+    print(
+        f"{'':>10} {'started':>8} {'completed':>10} {'most running':>13}"
+        f" {'last':>10} {'settle (s)':>11}"
+    )
+
+    for name, concurrency in policies.items():
+        result = await measure(
+            concurrency=concurrency,
+            edits=arguments.edits,
+            interval=arguments.interval,
+            query=arguments.query,
+        )
+
+        print(
+            f"{name:>10} {result['started']:>8} {result['completed']:>10}"
+            f" {result['most_running']:>13} {result['last']:>10}"
+            f" {result['settle']:>11.2f}"
+        )
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--query", type=float, default=0.05)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,116 @@
+"""Measure dispatching emissions from many signals with a chain of
+:meth:`qtrio.Emission.is_from` checks compared to a :class:`qtrio.EmissionRouter`.
+
+.. code-block:: bash
+
+   python benchmarks/emission_router.py --signals 10 100 500
+"""
+import argparse
+import time
+import typing
+
+from qts import QtCore
+
+import qtrio
+
+
+class Source(QtCore.QObject):
+    """One of many objects, such as rows of a table, each with a signal."""
+
+    changed = QtCore.Signal(int)
+
+
+async def collect(
+    router: qtrio.EmissionRouter, sources: typing.List[Source], count: int
+) -> typing.List[qtrio.Emission]:
+    """Emit ``count`` times round robin across the sources and collect the emissions.
+
+    Args:
+        router: The router providing the signals to connect to.
+        sources: The objects to emit from.
+        count: The number of emissions.
+
+    Returns:
+        The emissions, as received from the channel.
+    """
+    async with qtrio.enter_emissions_channel(signals=router.signals) as emissions:
+        for i in range(count):
+            sources[i % len(sources)].changed.emit(i)
+
+        return await emissions.receive_batch()
+
+
+def chained(
+    emissions: typing.List[qtrio.Emission],
+    signals: typing.Sequence["QtCore.SignalInstance"],
+    handle: typing.Callable[[int], object],
+) -> float:
+    """Dispatch by checking each signal in turn as an if/elif chain would.
+
+    Returns:
+        The number of emissions dispatched per second.
+    """
+    start = time.perf_counter()
+
+    for emission in emissions:
+        for signal in signals:
+            if emission.is_from(signal):
+                handle(*emission.args)
+                break
+
+    return len(emissions) / (time.perf_counter() - start)
+
+
+def routed(
+    emissions: typing.List[qtrio.Emission], router: qtrio.EmissionRouter
+) -> float:
+    """Dispatch with :meth:`qtrio.EmissionRouter.dispatch`.
+
+    Returns:
+        The number of emissions dispatched per second.
+    """
+    start = time.perf_counter()
+
+    for emission in emissions:
+        router.dispatch(emission)
+
+    return len(emissions) / (time.perf_counter() - start)
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(f"{'signals':>8} {'is_from chain (/s)':>19} {'router (/s)':>12}")
+
+    for signal_count in arguments.signals:
+        handled = 0
+
+        def handle(value: int) -> None:
+            nonlocal handled
+            handled += 1
+
+        sources = [Source() for _ in range(signal_count)]
+        router = qtrio.EmissionRouter()
+
+        for source in sources:
+            router.add(source.changed, handle)
+
+        # hold the signal instances as a consumer would rather than recreating them
+        signals = list(router.signals)
+        emissions = await collect(router=router, sources=sources, count=arguments.count)
+
+        chain_rate = chained(emissions=emissions, signals=signals, handle=handle)
+        router_rate = routed(emissions=emissions, router=router)
+
+        print(f"{signal_count:>8} {chain_rate:>19,.0f} {router_rate:>12,.0f}")
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--signals", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--count", type=int, default=20_000)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,107 @@
+"""Measure the throughput of consuming a rapidly emitted signal one emission at a time
+compared to with :meth:`qtrio.Emissions.receive_batch`.
+
+.. code-block:: bash
+
+   python benchmarks/emissions_batch.py --count 200000 --burst 1000
+"""
+import argparse
+import time
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+
+
+class Source(QtCore.QObject):
+    """A stand in for an instrument emitting readings."""
+
+    reading = QtCore.Signal(int)
+
+
+async def measure(
+    count: int,
+    burst: int,
+    consume: typing.Callable[[qtrio.Emissions, int], typing.Awaitable[None]],
+) -> float:
+    """Emit ``count`` readings in bursts of ``burst`` while consuming them.
+
+    Args:
+        count: The total number of emissions.
+        burst: The number of emissions between each yield to Trio by the producer.
+        consume: The async function receiving ``count`` emissions.
+
+    Returns:
+        The number of emissions consumed per second.
+    """
+    source = Source()
+
+    async with qtrio.enter_emissions_channel(signals=[source.reading]) as emissions:
+        async with trio.open_nursery() as nursery:
+
+            async def produce() -> None:
+                for i in range(count):
+                    source.reading.emit(i)
+
+                    if i % burst == 0:
+                        await trio.sleep(0)
+
+            start = time.perf_counter()
+            nursery.start_soon(produce)
+            await consume(emissions, count)
+            end = time.perf_counter()
+
+    return count / (end - start)
+
+
+async def per_item(emissions: qtrio.Emissions, count: int) -> None:
+    """Receive emissions one at a time from :attr:`qtrio.Emissions.channel`."""
+    received = 0
+
+    async for _ in emissions.channel:
+        received += 1
+
+        if received == count:
+            return
+
+
+async def batched(emissions: qtrio.Emissions, count: int) -> None:
+    """Receive emissions with :meth:`qtrio.Emissions.batches`."""
+    received = 0
+
+    async for batch in emissions.batches():
+        received += len(batch)
+
+        if received == count:
+            return
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(f"{'':>9} {'emissions/second':>17}")
+
+    for name, consume in {"per item": per_item, "batched": batched}.items():
+        rate = max(
+            [
+                await measure(
+                    count=arguments.count, burst=arguments.burst, consume=consume
+                )
+                for _ in range(arguments.repeat)
+            ]
+        )
+        print(f"{name:>9} {rate:>17,.0f}")
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,68 @@
+"""Measure the cold start time of ``import qtrio``, the ``qtrio --help`` command line
+interface, and reaching :func:`qtrio.run`.
+
+.. code-block:: bash
+
+   python benchmarks/import_time.py --repeat 10
+"""
+import argparse
+import re
+import subprocess
+import sys
+import time
+import typing
+
+
+scenarios: typing.Dict[str, typing.List[str]] = {
+    "import qtrio": ["-c", "import qtrio"],
+    "qtrio --help": ["-m", "qtrio", "--help"],
+    "qtrio.run": ["-c", "import qtrio; qtrio.run"],
+}
+"""The Python arguments to run for each scenario."""
+
+
+def measure(arguments: typing.List[str]) -> typing.Tuple[float, float]:
+    """Run a new Python process with ``-X importtime``.
+
+    Args:
+        arguments: The arguments to pass to Python after ``-X importtime``.
+
+    Returns:
+        The wall time of the process and the total import time reported by Python,
+        both in seconds.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+
+    # import time: self [us] | cumulative | imported package
+    # top level imports have no leading indentation on the package name
+    pattern = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| \S", re.MULTILINE)
+    imports = sum(int(match) for match in pattern.findall(completed.stderr))
+
+    return wall, imports / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(f"{'':>14} {'wall (ms)':>10} {'imports (ms)':>13}")
+
+    for name, python_arguments in scenarios.items():
+        results = [measure(python_arguments) for _ in range(arguments.repeat)]
+        wall = min(wall for wall, _ in results)
+        imports = min(imports for _, imports in results)
+
+        print(f"{name:>14} {wall * 1000:>10.1f} {imports * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
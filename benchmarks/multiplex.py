@@ -0,0 +1,82 @@
+"""Measure entering and exiting :func:`qtrio.enter_emissions_channel` for thousands of
+signals with and without ``multiplex=True``.
+
+.. code-block:: bash
+
+   python benchmarks/multiplex.py --signals 1000 5000 20000
+"""
+import argparse
+import time
+import typing
+
+from qts import QtCore
+
+import qtrio
+
+
+class Row(QtCore.QObject):
+    """A stand in for a per row widget."""
+
+    changed = QtCore.Signal(int)
+
+
+async def measure(
+    rows: typing.List[Row], multiplex: bool
+) -> typing.Tuple[float, float, float]:
+    """Connect to the signal of each row, emit from each row once, and disconnect.
+
+    Args:
+        rows: The objects whose signals to watch.
+        multiplex: Whether to use a multiplexed channel.
+
+    Returns:
+        The time to connect, receive one emission per row, and disconnect, in seconds.
+    """
+    signals = [row.changed for row in rows]
+
+    start = time.perf_counter()
+
+    async with qtrio.enter_emissions_channel(
+        signals=signals, multiplex=multiplex
+    ) as emissions:
+        connected = time.perf_counter()
+
+        for i, row in enumerate(rows):
+            row.changed.emit(i)
+
+        await emissions.receive_batch()
+        received = time.perf_counter()
+
+    end = time.perf_counter()
+
+    return connected - start, received - connected, end - received
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(
+        f"{'signals':>8} {'':>10} {'connect (ms)':>13} {'emit (ms)':>10}"
+        f" {'disconnect (ms)':>16}"
+    )
+
+    for signal_count in arguments.signals:
+        rows = [Row() for _ in range(signal_count)]
+
+        for name, multiplex in {"separate": False, "multiplex": True}.items():
+            connect, emit, disconnect = await measure(rows=rows, multiplex=multiplex)
+
+            print(
+                f"{signal_count:>8} {name:>10} {connect * 1000:>13.1f}"
+                f" {emit * 1000:>10.1f} {disconnect * 1000:>16.1f}"
+            )
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--signals", type=int, nargs="+", default=[1000, 5000, 20000])
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,84 @@
+"""Measure the rate at which callbacks passed to
+:meth:`qtrio.Runner.run_sync_soon_threadsafe` are dispatched in the Qt host thread.
+
+.. code-block:: bash
+
+   python benchmarks/reenter.py --count 100000
+"""
+import argparse
+import threading
+import time
+import typing
+
+from qts import QtCore
+
+import qtrio
+
+
+def measure(
+    application: "QtCore.QCoreApplication",
+    count: int,
+    **runner_kwargs: typing.Any,
+) -> float:
+    """Post ``count`` callbacks from a worker thread and process Qt events in the main
+    thread until all of them have been run.
+
+    Args:
+        application: The Qt application to post the reenter events to.
+        count: The number of callbacks to post.
+        runner_kwargs: Keyword arguments used to configure the :class:`qtrio.Runner`.
+
+    Returns:
+        The number of callbacks run per second.
+    """
+    runner = qtrio.Runner(application=application, **runner_kwargs)
+    remaining = count
+
+    def callback() -> None:
+        nonlocal remaining
+        remaining -= 1
+
+    def post() -> None:
+        for _ in range(count):
+            runner.run_sync_soon_threadsafe(callback)
+
+    thread = threading.Thread(target=post)
+
+    start = time.perf_counter()
+    thread.start()
+
+    while remaining > 0:
+        application.processEvents()
+
+    end = time.perf_counter()
+    thread.join()
+
+    return count / (end - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    application = QtCore.QCoreApplication([])
+    qtrio.register_event_type()
+
+    configurations = {
+        "unbatched": {"batch_reenter": False},
+        "batched": {"batch_reenter": True},
+        "budgeted": {"reenter_budget": 0.008},
+        "with stats": {"stats": qtrio.ReenterStatistics()},
+    }
+
+    for name, runner_kwargs in configurations.items():
+        rate = max(
+            measure(application=application, count=arguments.count, **runner_kwargs)
+            for _ in range(arguments.repeat)
+        )
+        print(f"{name:>12}: {rate:12,.0f} callbacks/second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure how the overhead of each Trio run scales with the number of concurrent
+sessions hosted by a :class:`qtrio.SessionManager`.
+
+.. code-block:: bash
+
+   python benchmarks/sessions.py --sessions 1 2 4 8 16
+"""
+import argparse
+import time
+
+from qts import QtCore
+import trio
+
+import qtrio
+
+
+def measure(
+    application: "QtCore.QCoreApplication",
+    sessions: int,
+    checkpoints: int,
+) -> float:
+    """Run ``sessions`` concurrent sessions which each pass ``checkpoints`` Trio
+    checkpoints.
+
+    Args:
+        application: The Qt application to host the sessions.
+        sessions: The number of concurrent sessions.
+        checkpoints: The number of checkpoints for each session to pass.
+
+    Returns:
+        The time taken, in seconds, from starting the first session until all are done.
+    """
+
+    async def main() -> None:
+        for _ in range(checkpoints):
+            await trio.sleep(0)
+
+    manager = qtrio.SessionManager(application=application, collect_stats=False)
+
+    start = time.perf_counter()
+
+    for index in range(sessions):
+        manager.start(str(index), main)
+
+    manager.run()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--checkpoints", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    application = QtCore.QCoreApplication([])
+
+    print(
+        f"{'sessions':>8} {'startup/session':>16} {'checkpoints/second':>19}"
+        f" {'per session':>12}"
+    )
+
+    for sessions in arguments.sessions:
+        startup = min(
+            measure(application=application, sessions=sessions, checkpoints=0)
+            for _ in range(arguments.repeat)
+        )
+        elapsed = min(
+            measure(
+                application=application,
+                sessions=sessions,
+                checkpoints=arguments.checkpoints,
+            )
+            for _ in range(arguments.repeat)
+        )
+        total_rate = sessions * arguments.checkpoints / elapsed
+
+        print(
+            f"{sessions:>8} {startup / sessions * 1000:>13.2f} ms"
+            f" {total_rate:>19,.0f} {total_rate / sessions:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
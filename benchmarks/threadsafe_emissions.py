@@ -0,0 +1,130 @@
+"""Measure the rate at which emissions of signals emitted from several threads reach
+Trio with and without ``threadsafe=True``.
+
+.. code-block:: bash
+
+   python benchmarks/threadsafe_emissions.py --threads 4 --rate 100000
+"""
+import argparse
+import threading
+import time
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+
+
+class Source(QtCore.QObject):
+    """A stand in for an acquisition device read from a worker thread."""
+
+    reading = QtCore.Signal(int)
+
+
+def produce(source: Source, count: int, rate: float, start: float) -> None:
+    """Emit ``count`` readings paced to ``rate`` per second.
+
+    Args:
+        source: The object to emit from.
+        count: The number of readings.
+        rate: The target emissions per second for this thread.
+        start: The :func:`time.perf_counter` time to pace from.
+    """
+    for i in range(count):
+        target = start + i / rate
+        delay = target - time.perf_counter()
+
+        if delay > 0.001:
+            time.sleep(delay)
+
+        source.reading.emit(i)
+
+
+async def measure(
+    threads: int, rate: float, duration: float, threadsafe: bool
+) -> typing.Dict[str, float]:
+    """Emit from worker threads at a combined ``rate`` while receiving in Trio.
+
+    Args:
+        threads: The number of emitting threads.
+        rate: The combined target emissions per second.
+        duration: The time to emit for, in seconds.
+        threadsafe: Whether to open the channel in thread safe mode.
+
+    Returns:
+        The emissions received per second, the median batch size, and the fraction of
+        the emissions received.
+    """
+    sources = [Source() for _ in range(threads)]
+    count = int(rate * duration / threads)
+    total = count * threads
+    received = 0
+    batch_sizes = []
+
+    async with qtrio.enter_emissions_channel(
+        signals=[source.reading for source in sources], threadsafe=threadsafe
+    ) as emissions:
+        start = time.perf_counter()
+        workers = [
+            threading.Thread(
+                target=produce, args=(source, count, rate / threads, start)
+            )
+            for source in sources
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        # stop waiting a while after the producers would be done
+        with trio.move_on_after(duration + 10):
+            async for batch in emissions.batches():
+                received += len(batch)
+                batch_sizes.append(len(batch))
+
+                if received == total:
+                    break
+
+        end = time.perf_counter()
+
+        for worker in workers:
+            await trio.to_thread.run_sync(worker.join)
+
+    batch_sizes.sort()
+
+    return {
+        "rate": received / (end - start),
+        "batch": batch_sizes[len(batch_sizes) // 2] if batch_sizes else 0,
+        "received": received / total,
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    print(f"{'':>11} {'emissions/second':>17} {'median batch':>13} {'received':>9}")
+
+    for name, threadsafe in {"queued": False, "threadsafe": True}.items():
+        result = await measure(
+            threads=arguments.threads,
+            rate=arguments.rate,
+            duration=arguments.duration,
+            threadsafe=threadsafe,
+        )
+
+        print(
+            f"{name:>11} {result['rate']:>17,.0f} {result['batch']:>13.0f}"
+            f" {result['received']:>9.1%}"
+        )
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=100_000)
+    parser.add_argument("--duration", type=float, default=3)
+    arguments = parser.parse_args()
+
+    qtrio.run(main, arguments)
+
+
+if __name__ == "__main__":
+    cli()
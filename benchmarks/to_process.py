@@ -0,0 +1,148 @@
+"""Measure the Qt frame rate while CPU heavy work runs inline in Trio compared to in
+:mod:`qtrio.to_process` worker processes.
+
+.. code-block:: bash
+
+   python benchmarks/to_process.py --duration 5
+"""
+import argparse
+import os
+import statistics
+import time
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+import qtrio.to_process
+
+
+def spin(duration: float) -> int:
+    """Keep a core busy for ``duration`` seconds.
+
+    Args:
+        duration: The time to spin for, in seconds.
+
+    Returns:
+        The number of iterations completed.
+    """
+    iterations = 0
+    end = time.perf_counter() + duration
+
+    while time.perf_counter() < end:
+        iterations += 1
+
+    return iterations
+
+
+async def measure_frames(
+    duration: float,
+    work: typing.Callable[[], typing.Awaitable[object]],
+    frame_interval: float,
+) -> typing.List[float]:
+    """Record the intervals between ticks of a timer standing in for frames while
+    ``work`` runs.
+
+    Args:
+        duration: The time to measure for, in seconds.
+        work: The async function to run while measuring.
+        frame_interval: The requested time between frames, in seconds.
+
+    Returns:
+        The intervals between frames, in seconds.
+    """
+    intervals = []
+    last = time.perf_counter()
+
+    def frame() -> None:
+        nonlocal last
+        now = time.perf_counter()
+        intervals.append(now - last)
+        last = now
+
+    timer = QtCore.QTimer()
+    timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+    timer.setInterval(round(frame_interval * 1000))
+    timer.timeout.connect(frame)
+
+    async with trio.open_nursery() as nursery:
+
+        async def run_work() -> None:
+            while True:
+                await work()
+
+        nursery.start_soon(run_work)
+        timer.start()
+        await trio.sleep(duration)
+        timer.stop()
+        nursery.cancel_scope.cancel()
+
+    return intervals
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    pool = qtrio.to_process.ProcessPool(max_workers=arguments.workers)
+    chunk = arguments.chunk
+
+    async def idle() -> None:
+        await trio.sleep_forever()
+
+    async def inline() -> None:
+        spin(chunk)
+        await trio.sleep(0)
+
+    async def processes() -> None:
+        async with trio.open_nursery() as nursery:
+            for _ in range(arguments.workers):
+                nursery.start_soon(pool.run_sync, spin, chunk)
+
+    # start the workers before measuring
+    await processes()
+
+    configurations = {
+        "idle": idle,
+        "inline": inline,
+        "to_process": processes,
+    }
+
+    print(
+        f"{'':>10} {'frames/second':>14} {'median (ms)':>12} {'p99 (ms)':>9}"
+        f" {'max (ms)':>9}"
+    )
+
+    try:
+        for name, work in configurations.items():
+            intervals = await measure_frames(
+                duration=arguments.duration,
+                work=work,
+                frame_interval=1 / arguments.fps,
+            )
+            intervals.sort()
+            p99 = intervals[min(len(intervals) - 1, int(len(intervals) * 0.99))]
+
+            print(
+                f"{name:>10} {len(intervals) / arguments.duration:>14.1f}"
+                f" {statistics.median(intervals) * 1000:>12.1f}"
+                f" {p99 * 1000:>9.1f} {intervals[-1] * 1000:>9.1f}"
+            )
+    finally:
+        pool.close()
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--fps", type=float, default=60)
+    parser.add_argument("--chunk", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+
+    application = QtCore.QCoreApplication([])
+    runner = qtrio.Runner(application=application)
+    runner.run(main, arguments)
+    runner.outcomes.unwrap()
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,167 @@
+"""Compare the :attr:`qtrio.Runner.wakeup` strategies by throughput and wake-up latency.
+
+.. code-block:: bash
+
+   python benchmarks/wakeup.py
+"""
+import argparse
+import statistics
+import threading
+import time
+import typing
+
+from qts import QtCore
+
+import qtrio
+
+
+strategies: typing.Dict[str, typing.Callable[[], qtrio.WakeupStrategy]] = {
+    "post event": qtrio.PostEventWakeup,
+    "socket notifier": qtrio.SocketNotifierWakeup,
+    "signal": qtrio.SignalWakeup,
+    "timer": qtrio.TimerWakeup,
+}
+
+
+def threaded_throughput(
+    application: "QtCore.QCoreApplication",
+    runner: qtrio.Runner,
+    count: int,
+) -> float:
+    """Post ``count`` callbacks from a worker thread, as the Trio I/O thread does, and
+    process Qt events until all of them have been run.
+
+    Returns:
+        The number of callbacks run per second.
+    """
+    remaining = count
+
+    def callback() -> None:
+        nonlocal remaining
+        remaining -= 1
+
+    def post() -> None:
+        for _ in range(count):
+            runner.run_sync_soon_threadsafe(callback)
+
+    thread = threading.Thread(target=post)
+
+    start = time.perf_counter()
+    thread.start()
+
+    while remaining > 0:
+        application.processEvents()
+
+    end = time.perf_counter()
+    thread.join()
+
+    return count / (end - start)
+
+
+def chained_throughput(
+    application: "QtCore.QCoreApplication",
+    runner: qtrio.Runner,
+    count: int,
+) -> float:
+    """Have each callback post the next from the host thread, as consecutive Trio guest
+    ticks do, and run the Qt event loop until the chain completes.
+
+    Returns:
+        The number of callbacks run per second.
+    """
+    loop = QtCore.QEventLoop()
+    remaining = count
+
+    def callback() -> None:
+        nonlocal remaining
+        remaining -= 1
+
+        if remaining > 0:
+            runner.run_sync_soon_threadsafe(callback)
+        else:
+            loop.quit()
+
+    start = time.perf_counter()
+    runner.run_sync_soon_threadsafe(callback)
+    loop.exec()
+    end = time.perf_counter()
+
+    return count / (end - start)
+
+
+def latency(
+    runner: qtrio.Runner,
+    count: int,
+    period: float,
+) -> typing.List[float]:
+    """Post a single callback from a worker thread every ``period`` seconds while the
+    Qt event loop is idle and measure how long each takes to start running.
+
+    Returns:
+        The wake-up latencies, in seconds.
+    """
+    loop = QtCore.QEventLoop()
+    latencies: typing.List[float] = []
+
+    def callback(posted: float) -> None:
+        latencies.append(time.perf_counter() - posted)
+
+        if len(latencies) == count:
+            loop.quit()
+
+    def post() -> None:
+        for _ in range(count):
+            time.sleep(period)
+            posted = time.perf_counter()
+            runner.run_sync_soon_threadsafe(lambda posted=posted: callback(posted))
+
+    thread = threading.Thread(target=post)
+    thread.start()
+    loop.exec()
+    thread.join()
+
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--latency-count", type=int, default=1_000)
+    parser.add_argument("--latency-period", type=float, default=0.001)
+    arguments = parser.parse_args()
+
+    application = QtCore.QCoreApplication([])
+    qtrio.register_event_type()
+
+    print(
+        f"{'strategy':>16} {'threaded/s':>12} {'chained/s':>12}"
+        f" {'median µs':>10} {'p99 µs':>10}"
+    )
+
+    for name, strategy in strategies.items():
+        runner = qtrio.Runner(application=application, wakeup=strategy())
+
+        threaded = threaded_throughput(
+            application=application, runner=runner, count=arguments.count
+        )
+        chained = chained_throughput(
+            application=application, runner=runner, count=arguments.count
+        )
+        latencies = latency(
+            runner=runner,
+            count=arguments.latency_count,
+            period=arguments.latency_period,
+        )
+        percentiles = statistics.quantiles(latencies, n=100)
+
+        runner.wakeup.close()
+
+        print(
+            f"{name:>16} {threaded:12,.0f} {chained:12,.0f}"
+            f" {statistics.median(latencies) * 1e6:10.1f}"
+            f" {percentiles[98] * 1e6:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
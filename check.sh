@@ -18,7 +18,7 @@ if ! black --check .; then
 fi
 
 # Run flake8 without pycodestyle and import-related errors
-flake8 setup.py docs qtrio/ || EXIT_STATUS=$?
+flake8 setup.py benchmarks/ docs qtrio/ || EXIT_STATUS=$?
 
 # Finally, leave a really clear warning of any issues and exit
 if [ $EXIT_STATUS -ne 0 ]; then
@@ -1,4 +1,9 @@
-"""Top-level package for QTrio."""
+"""Top-level package for QTrio.  Everything beyond the exceptions is loaded on first
+access to keep ``import qtrio`` fast for tools that do not need it.
+"""
+
+import importlib
+import typing
 
 from ._version import __version__
 
@@ -15,22 +20,136 @@ from ._exceptions import (
     InvalidInputError,
     InternalError,
     DialogNotActiveError,
+    SessionNameInUseError,
+    WorkerProcessDiedError,
+    EmissionsOverflowError,
     QTrioWarning,
     ApplicationQuitWarning,
 )
 
-from ._core import (
-    enter_emissions_channel,
-    open_emissions_nursery,
-    Emissions,
-    Emission,
-    EmissionsNursery,
-    Outcomes,
-    run,
-    Runner,
-    registered_event_type,
-    register_event_type,
-    register_requested_event_type,
-)
+if typing.TYPE_CHECKING:
+    from ._core import (
+        enter_emissions_channel,
+        open_emissions_nursery,
+        Emissions,
+        Emission,
+        CompactEmission,
+        EmissionRouter,
+        EmissionsNursery,
+        ConcurrencyPolicy,
+        UnlimitedConcurrency,
+        QueueWhileBusy,
+        DropWhileBusy,
+        CancelPrevious,
+        OverflowPolicy,
+        DropNewestOverflow,
+        DropOldestOverflow,
+        SampleOverflow,
+        RaiseOverflow,
+        Backpressure,
+        Outcomes,
+        run,
+        Runner,
+        ApplicationType,
+        ReenterPriorityPolicy,
+        FixedReenterPriority,
+        DepthReenterPriority,
+        Histogram,
+        ReenterStatistics,
+        WakeupStrategy,
+        PostEventWakeup,
+        SocketNotifierWakeup,
+        SignalWakeup,
+        TimerWakeup,
+        registered_event_type,
+        register_event_type,
+        register_requested_event_type,
+        run_sync_in_gui_thread,
+        wait_any,
+        FirstEmission,
+        Session,
+        SessionManager,
+        Frame,
+        next_frame,
+        frames,
+    )
+
+    from ._qt import Signal
+
+
+_lazy_attributes: typing.Dict[str, str] = {
+    "enter_emissions_channel": "._core",
+    "open_emissions_nursery": "._core",
+    "Emissions": "._core",
+    "Emission": "._core",
+    "CompactEmission": "._core",
+    "EmissionRouter": "._core",
+    "EmissionsNursery": "._core",
+    "ConcurrencyPolicy": "._core",
+    "UnlimitedConcurrency": "._core",
+    "QueueWhileBusy": "._core",
+    "DropWhileBusy": "._core",
+    "CancelPrevious": "._core",
+    "OverflowPolicy": "._core",
+    "DropNewestOverflow": "._core",
+    "DropOldestOverflow": "._core",
+    "SampleOverflow": "._core",
+    "RaiseOverflow": "._core",
+    "Backpressure": "._core",
+    "Outcomes": "._core",
+    "run": "._core",
+    "Runner": "._core",
+    "ApplicationType": "._core",
+    "ReenterPriorityPolicy": "._core",
+    "FixedReenterPriority": "._core",
+    "DepthReenterPriority": "._core",
+    "Histogram": "._core",
+    "ReenterStatistics": "._core",
+    "WakeupStrategy": "._core",
+    "PostEventWakeup": "._core",
+    "SocketNotifierWakeup": "._core",
+    "SignalWakeup": "._core",
+    "TimerWakeup": "._core",
+    "registered_event_type": "._core",
+    "register_event_type": "._core",
+    "register_requested_event_type": "._core",
+    "run_sync_in_gui_thread": "._core",
+    "wait_any": "._core",
+    "FirstEmission": "._core",
+    "Session": "._core",
+    "SessionManager": "._core",
+    "Frame": "._core",
+    "next_frame": "._core",
+    "frames": "._core",
+    "Signal": "._qt",
+}
+"""The module to import each lazily loaded attribute from."""
+
+_lazy_submodules: typing.FrozenSet[str] = frozenset({"_core", "_python", "_qt"})
+"""The submodules which were available as attributes after ``import qtrio`` when it
+imported them eagerly.
+"""
+
+
+def __getattr__(name: str) -> object:
+    value: object
+
+    if name in _lazy_submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        try:
+            module_name = _lazy_attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+        value = getattr(importlib.import_module(module_name, __name__), name)
+
+    globals()[name] = value
+
+    return value
+
 
-from ._qt import Signal
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_lazy_attributes, *_lazy_submodules})
@@ -5,9 +5,16 @@ Attributes:
 """
 from __future__ import annotations
 
+import abc
+import collections
 import contextlib
+import enum
+import functools
 import math
+import socket
 import sys
+import threading
+import time
 import typing
 import typing_extensions
 import warnings
@@ -29,6 +36,10 @@ if typing.TYPE_CHECKING or "sphinx_autodoc_typehints" in sys.modules:
     from qts import QtGui
     from qts import QtWidgets
 
+    import qtrio.qt
+
+
+T = typing.TypeVar("T")
 
 _reenter_event_type: typing.Optional["QtCore.QEvent.Type"] = None
 
@@ -171,6 +182,11 @@ class Emission:
     """An instance of the original signal."""
     args: typing.Tuple[object, ...]
     """A tuple of the arguments emitted by the signal."""
+    index: typing.Optional[int] = None
+    """The position of the signal in the collection passed when connecting the
+    channel.  Comparing indexes is much cheaper than :meth:`is_from`, see
+    :class:`qtrio.EmissionRouter`.  Not considered when comparing emissions.
+    """
 
     def is_from(self, signal: "QtCore.SignalInstance") -> bool:
         """Check if this emission came from ``signal``.
@@ -196,268 +212,1620 @@ class Emission:
         return self.is_from(signal=other.signal) and self.args == other.args
 
 
+class CompactEmission(typing.Tuple[typing.Any, ...]):
+    """A lighter weight alternative to :class:`qtrio.Emission` used when opening an
+    emissions channel with ``compact=True``.  It is a single flat tuple of the shared
+    signals, the index of the signal and the emitted arguments so each buffered emission
+    is one object rather than a record plus its arguments tuple.  The signal instance
+    and the arguments are looked up only when accessed.  Use the attributes rather than
+    treating it as a sequence.  Do not construct this class directly.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        signals: typing.Sequence["QtCore.SignalInstance"],
+        index: int,
+        args: typing.Tuple[object, ...],
+    ) -> "CompactEmission":
+        return super().__new__(cls, (signals, index, *args))
+
+    # replaces tuple.index() to match Emission.index
+    @property
+    def index(self) -> int:  # type: ignore[override]
+        """The position of the signal in the collection passed when connecting the
+        channel.
+        """
+        return typing.cast(int, self[1])
+
+    @property
+    def args(self) -> typing.Tuple[object, ...]:
+        """A tuple of the arguments emitted by the signal."""
+        return tuple(self[2:])
+
+    @property
+    def signal(self) -> "QtCore.SignalInstance":
+        """An instance of the original signal."""
+        return self[0][self[1]]
+
+    def is_from(self, signal: "QtCore.SignalInstance") -> bool:
+        """Check if this emission came from ``signal``.
+
+        Args:
+            signal: The signal instance to check for being the source.
+
+        Returns:
+            Whether the passed signal was the source of this emission.
+        """
+        return bool(self.signal == signal)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactEmission):
+            return False
+
+        return self.is_from(signal=other.signal) and self.args == other.args
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CompactEmission(index={self.index!r}, args={self.args!r})"
+
+
+_AnyEmission = typing.Union[Emission, CompactEmission]
+
+_EmissionsTransform = typing.Callable[
+    [int, typing.Tuple[object, ...]], typing.Optional[typing.Tuple[object, ...]]
+]
+"""Called with the signal index and the emitted arguments, returns the arguments to
+use or :obj:`None` to discard the emission.
+"""
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _DropCounts:
+    """Count the emissions dropped from a channel for each signal.  Signals are
+    identified by the signal instance object which :class:`EmissionsChannelSlot` reuses
+    for every emission.
+    """
+
+    _signals: typing.Dict[int, "QtCore.SignalInstance"] = attr.ib(factory=dict)
+    _counts: typing.Dict[int, int] = attr.ib(factory=dict)
+
+    def add(self, emission: _AnyEmission) -> None:
+        key = id(emission.signal)
+        self._signals[key] = emission.signal
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def count(self, signal: typing.Optional["QtCore.SignalInstance"] = None) -> int:
+        if signal is None:
+            return sum(self._counts.values())
+
+        return sum(
+            count for key, count in self._counts.items() if self._signals[key] == signal
+        )
+
+
 @attr.s(auto_attribs=True, frozen=True)
 class EmissionsChannelSlot:
     internal_signal: "QtCore.SignalInstance"
-    send_channel: trio.MemorySendChannel
+    send_channel: typing.Union[
+        trio.MemorySendChannel, _BufferedSendChannel, _ThreadSafeSender
+    ]
+    drops: _DropCounts = attr.ib(factory=_DropCounts)
+    index: typing.Optional[int] = None
+    compact_signals: typing.Optional[typing.Sequence["QtCore.SignalInstance"]] = None
+    transform: typing.Optional[
+        typing.Callable[
+            [typing.Tuple[object, ...]], typing.Optional[typing.Tuple[object, ...]]
+        ]
+    ] = None
 
     def slot(
         self,
         *args: object,
     ) -> None:
-        try:
-            self.send_channel.send_nowait(
-                Emission(signal=self.internal_signal, args=args)
+        if self.transform is not None:
+            transformed = self.transform(args)
+
+            if transformed is None:
+                return
+
+            args = transformed
+
+        emission: _AnyEmission
+
+        if self.compact_signals is None:
+            emission = Emission(
+                signal=self.internal_signal, args=args, index=self.index
+            )
+        else:
+            emission = CompactEmission(
+                self.compact_signals, self.index, args  # type: ignore[arg-type]
             )
-        except (trio.WouldBlock, trio.ClosedResourceError):
-            # TODO: log this or... ?
+
+        try:
+            self.send_channel.send_nowait(emission)
+        except trio.WouldBlock:
+            self.drops.add(emission)
+        except trio.ClosedResourceError:
             pass
 
 
-@attr.s(auto_attribs=True)
-class Emissions:
-    """Hold elements useful for the application to work with emissions from signals.
-    Do not construct this class directly.  Instead, use
-    :func:`qtrio.enter_emissions_channel`.
+@attr.s(auto_attribs=True, frozen=True)
+class _MultiplexedEmissionsSlot:
+    """Like :class:`EmissionsChannelSlot` but for all of the signals of a multiplexed
+    channel, identified by their index.
     """
 
-    channel: trio.MemoryReceiveChannel
-    """A memory receive channel to be fed by signal emissions."""
-    send_channel: trio.MemorySendChannel
-    """A memory send channel collecting signal emissions."""
+    signals: typing.Sequence["QtCore.SignalInstance"]
+    send_channel: typing.Union[
+        trio.MemorySendChannel, _BufferedSendChannel, _ThreadSafeSender
+    ]
+    drops: _DropCounts
+    compact: bool
+    transform: typing.Optional[_EmissionsTransform] = None
+
+    def slot(self, index: int, args: typing.Tuple[object, ...]) -> None:
+        if self.transform is not None:
+            transformed = self.transform(index, args)
 
-    async def aclose(self) -> None:
-        """Asynchronously close the send channel when signal emissions are no longer of
-        interest.
-        """
-        await self.send_channel.aclose()
+            if transformed is None:
+                return
 
+            args = transformed
 
-@async_generator.asynccontextmanager
-async def open_emissions_channel(
-    signals: typing.Collection["QtCore.SignalInstance"],
-    max_buffer_size: float = math.inf,
-) -> typing.AsyncGenerator[Emissions, None]:
-    """Create a memory channel fed by the emissions of the signals.  Each signal
-    emission will be converted to a :class:`qtrio.Emission` object.  On exit the send
-    channel is closed.  Management of the receive channel is left to the caller.
+        emission: _AnyEmission
 
-    Note:
-        Use this only if you need to process emissions *after* exiting the context
-        manager.  Otherwise use :func:`qtrio.enter_emissions_channel`.
+        if self.compact:
+            emission = CompactEmission(self.signals, index, args)
+        else:
+            emission = Emission(signal=self.signals[index], args=args, index=index)
 
-    Args:
-        signals: A collection of signals which will be monitored for emissions.
-        max_buffer_size: When the number of unhandled emissions in the channel reaches
-            this limit then additional emissions will be silently thrown out the window.
+        try:
+            self.send_channel.send_nowait(emission)
+        except trio.WouldBlock:
+            self.drops.add(emission)
+        except trio.ClosedResourceError:
+            pass
 
-    Returns:
-        The emissions manager with the signals connected to it.
+
+class OverflowPolicy(typing_extensions.Protocol):
+    """The interface used by emissions channels to handle an emission arriving while
+    ``max_buffer_size`` emissions are already waiting to be received.
     """
 
-    # Infinite buffer because I don't think there's any use in storing the emission
-    # info in a `slot()` stack frame rather than in the memory channel.  Perhaps in the
-    # future we can implement a limit beyond which events are thrown away to avoid
-    # infinite queueing.  Maybe trio.MemorySendChannel.send_nowait() instead.
-    send_channel, receive_channel = trio.open_memory_channel[Emission](
-        max_buffer_size=max_buffer_size
-    )
+    def overflow(
+        self, buffer: typing.Deque[_AnyEmission], emission: _AnyEmission, overflows: int
+    ) -> _AnyEmission:
+        """Handle an emission arriving while the buffer is full.
 
-    async with send_channel:
-        with contextlib.ExitStack() as stack:
-            emissions = Emissions(channel=receive_channel, send_channel=send_channel)
+        Args:
+            buffer: The emissions waiting to be received, oldest first.  The policy may
+                replace an emission in the buffer with ``emission`` but must not grow
+                it.
+            emission: The newly arrived emission.
+            overflows: The number of emissions that have arrived while the buffer was
+                full, including this one.
 
-            for signal in signals:
-                slot = EmissionsChannelSlot(
-                    internal_signal=signal, send_channel=send_channel
-                )
-                stack.enter_context(qtrio._qt.connection(signal, slot.slot))
+        Returns:
+            The emission that was dropped.  It is counted by
+            :meth:`qtrio.Emissions.dropped`.
 
-            yield emissions
+        Raises:
+            Exception: Any exception raised is raised by the next receive from the
+                channel and ``emission`` is dropped.
+        """
+        ...
 
 
-@async_generator.asynccontextmanager
-async def enter_emissions_channel(
-    signals: typing.Collection["QtCore.SignalInstance"],
-    max_buffer_size: float = math.inf,
-) -> typing.AsyncGenerator[Emissions, None]:
-    """Create a memory channel fed by the emissions of the signals and enter both the
-    send and receive channels' context managers.
+@attr.s(auto_attribs=True, frozen=True)
+class DropNewestOverflow:
+    """Drop emissions that arrive while the buffer is full.  The consumer receives the
+    oldest emissions.  This is the default.
+    """
 
-    Args:
-        signals: A collection of signals which will be monitored for emissions.
-        max_buffer_size: When the number of unhandled emissions in the channel reaches
-            this limit then additional emissions will be silently thrown out the window.
+    def overflow(
+        self, buffer: typing.Deque[_AnyEmission], emission: _AnyEmission, overflows: int
+    ) -> _AnyEmission:
+        """See :meth:`qtrio.OverflowPolicy.overflow`."""
+        return emission
 
-    Returns:
-        The emissions manager.
+
+@attr.s(auto_attribs=True, frozen=True)
+class DropOldestOverflow:
+    """Drop the oldest buffered emission to make room for each new emission so the
+    buffer acts as a ring holding the most recent emissions.
     """
-    async with open_emissions_channel(
-        signals=signals, max_buffer_size=max_buffer_size
-    ) as emissions:
-        async with emissions.channel:
-            async with emissions.send_channel:
-                yield emissions
 
+    def overflow(
+        self, buffer: typing.Deque[_AnyEmission], emission: _AnyEmission, overflows: int
+    ) -> _AnyEmission:
+        """See :meth:`qtrio.OverflowPolicy.overflow`."""
+        if len(buffer) == 0:
+            return emission
 
-class StarterProtocol(typing_extensions.Protocol):
-    def start(self, *args: object) -> None:
-        ...
+        dropped = buffer.popleft()
+        buffer.append(emission)
+
+        return dropped
 
 
 @attr.s(auto_attribs=True, frozen=True)
-class DirectStarter:
-    slot: typing.Callable[..., typing.Awaitable[object]]
-    nursery: trio.Nursery
+class SampleOverflow:
+    """While the buffer is full, keep every :attr:`every`'th emission in place of the
+    oldest buffered emission and drop the others.  The consumer sees a thinned out but
+    ongoing sample of a flood of emissions.
+    """
 
-    def start(self, *args: object) -> None:
-        self.nursery.start_soon(self.slot, *args)
+    every: int = attr.ib()
+    """Keep one of this many emissions arriving while the buffer is full."""
 
+    @every.validator
+    def _check_every(self, attribute: object, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"every must be at least one, got: {value!r}")
 
-@attr.s(auto_attribs=True, frozen=True)
-class WrappedStarter:
-    slot: typing.Callable[..., typing.Awaitable[object]]
-    wrapper: typing.Callable[
-        [typing.Callable[..., typing.Awaitable[object]]], typing.Awaitable[object]
-    ]
-    nursery: trio.Nursery
+    def overflow(
+        self, buffer: typing.Deque[_AnyEmission], emission: _AnyEmission, overflows: int
+    ) -> _AnyEmission:
+        """See :meth:`qtrio.OverflowPolicy.overflow`."""
+        if overflows % self.every != 0 or len(buffer) == 0:
+            return emission
 
-    def start(self, *args: object) -> None:
-        self.nursery.start_soon(self.wrapper, self.slot, *args)
+        dropped = buffer.popleft()
+        buffer.append(emission)
 
+        return dropped
 
-@attr.s(auto_attribs=True)
-class EmissionsNursery:
-    """Holds the nursery, exit stack, and wrapper needed to support connecting signals
-    to both async and sync slots in the nursery.
+
+@attr.s(auto_attribs=True, frozen=True)
+class RaiseOverflow:
+    """Drop emissions that arrive while the buffer is full and raise
+    :class:`qtrio.EmissionsOverflowError` from the next receive.  The buffered emissions
+    can still be received afterwards.
     """
 
-    nursery: trio.Nursery
-    """The Trio nursery that will handle execution of the slots."""
-    exit_stack: contextlib.ExitStack
-    """The exit stack that will manage the connections so they get disconnected."""
-    wrapper: typing.Optional[
-        typing.Callable[
-            [typing.Callable[..., typing.Awaitable[object]]],
-            typing.Awaitable[object],
-        ]
-    ] = None
-    """The wrapper for handling the slots.  This could, for example, handle exceptions
-    and present a dialog to avoid cancelling the entire nursery.
+    def overflow(
+        self, buffer: typing.Deque[_AnyEmission], emission: _AnyEmission, overflows: int
+    ) -> _AnyEmission:
+        """See :meth:`qtrio.OverflowPolicy.overflow`."""
+        raise qtrio.EmissionsOverflowError(emission=emission)
+
+
+class _EmissionBuffer(typing_extensions.Protocol[T]):
+    def put(self, emission: T) -> None:
+        ...
+
+    def take(self) -> T:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Backpressure:
+    """Pause the source of the emissions while the consumer falls behind rather than
+    buffering without bound or dropping emissions.  Once :attr:`high_water` emissions
+    are buffered the source is paused and once the consumer has reduced the buffer to
+    :attr:`low_water` it is resumed.  Emissions from a paused source are lost so this
+    suits sources such as a ``readyRead`` signal where the consumer reads the current
+    state rather than relying on each emission.
     """
 
-    def connect(
-        self,
-        signal: "QtCore.SignalInstance",
-        slot: typing.Callable[..., typing.Awaitable[object]],
-    ) -> None:
-        """Connect an async signal to this emissions nursery so when called the slot
-        will be run in the nursery.
-        """
-        starter: StarterProtocol
+    high_water: int = attr.ib()
+    """Pause the source when this many emissions are buffered."""
+    low_water: int = attr.ib(default=0)
+    """Resume the source when this many or fewer emissions are buffered."""
+    objects: typing.Sequence["QtCore.QObject"] = ()
+    """The objects emitting the signals.  When given, the source is paused by blocking
+    all of their signals with :meth:`QtCore.QObject.blockSignals`.  Otherwise the
+    connections to the signals are suspended, which is not supported when multiplexing
+    or thread safe.
+    """
 
-        if self.wrapper is None:
-            starter = DirectStarter(slot=slot, nursery=self.nursery)
-        else:
-            starter = WrappedStarter(
-                slot=slot, wrapper=self.wrapper, nursery=self.nursery
+    @high_water.validator
+    def _check_high_water(self, attribute: object, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"high_water must be at least one, got: {value!r}")
+
+    @low_water.validator
+    def _check_low_water(self, attribute: object, value: int) -> None:
+        if not 0 <= value < self.high_water:
+            raise ValueError(
+                "low_water must be at least zero and less than high_water"
+                f" ({self.high_water!r}), got: {value!r}"
             )
 
-        self.exit_stack.enter_context(qtrio._qt.connection(signal, starter.start))
 
-    def connect_sync(
+@attr.s(auto_attribs=True, eq=False)
+class _SuspendableConnections:
+    """Connections which can be disconnected and connected again while the channel is
+    open.
+    """
+
+    connection_type: typing.Optional["QtCore.Qt.ConnectionType"] = None
+    _pairs: typing.List[
+        typing.Tuple["QtCore.SignalInstance", typing.Callable[..., object]]
+    ] = attr.ib(factory=list)
+    _stack: typing.Optional[contextlib.ExitStack] = None
+
+    def add(
         self, signal: "QtCore.SignalInstance", slot: typing.Callable[..., object]
     ) -> None:
-        """Connect to a sync slot to this emissions nursery so when called the slot will
-        be run in the nursery.
-        """
+        self._pairs.append((signal, slot))
 
-        async def async_slot(*args: object) -> None:
-            slot(*args)
+    def connect(self) -> None:
+        stack = contextlib.ExitStack()
 
-        self.connect(signal=signal, slot=async_slot)
+        for signal, slot in self._pairs:
+            stack.enter_context(
+                qtrio._qt.connection(signal, slot, connection_type=self.connection_type)
+            )
 
+        self._stack = stack
 
-@async_generator.asynccontextmanager
-async def open_emissions_nursery(
-    until: typing.Optional["QtCore.SignalInstance"] = None,
-    wrapper: typing.Optional[typing.Callable[..., typing.Awaitable[object]]] = None,
-) -> typing.AsyncGenerator[EmissionsNursery, None]:
-    """Open a nursery for handling callbacks triggered by signal emissions.  This allows
-    a 'normal' Qt callback structure while still executing the callbacks within a Trio
-    nursery such that errors have a place to go.  Both async and sync callbacks can be
-    connected.  Sync callbacks will be wrapped in an async call to allow execution in
-    the nursery.
+    def disconnect(self) -> None:
+        if self._stack is not None:
+            stack = self._stack
+            self._stack = None
+            stack.close()
 
-    Arguments:
-        until: Keep the nursery open until this signal is emitted.
-        wrapper: A wrapper for the callbacks such as to process exceptions.
 
-    Returns:
-        The emissions manager.
-    """
-    async with trio.open_nursery() as nursery:
-        with contextlib.ExitStack() as exit_stack:
-            emissions_nursery = EmissionsNursery(
-                nursery=nursery,
-                exit_stack=exit_stack,
-                wrapper=wrapper,
-            )
+@attr.s(auto_attribs=True, eq=False)
+class _BackpressureValve:
+    """Pause and resume the source of emissions for :class:`Backpressure`."""
 
-            if until is not None:
-                async with wait_signal_context(until):
-                    yield emissions_nursery
-            else:
-                yield emissions_nursery
+    objects: typing.Sequence["QtCore.QObject"]
+    connections: _SuspendableConnections
+    paused: bool = False
+    pauses: int = 0
+    resumes: int = 0
+    _closed: bool = False
 
+    def _set_paused(self, paused: bool) -> None:
+        if len(self.objects) > 0:
+            for o in self.objects:
+                o.blockSignals(paused)
+        elif paused:
+            self.connections.disconnect()
+        else:
+            self.connections.connect()
 
-@async_generator.asynccontextmanager
-async def wait_signal_context(
-    signal: "QtCore.SignalInstance",
-) -> typing.AsyncGenerator[None, None]:
-    """Connect a signal during the context and wait for it on exit.  Presently no
-    mechanism is provided for retrieving the emitted arguments.
+        self.paused = paused
 
-    Args:
-        signal: The signal to connect to and wait for.
-    """
-    event = trio.Event()
+    def pause(self) -> None:
+        if not self.paused and not self._closed:
+            self._set_paused(True)
+            self.pauses += 1
 
-    def slot(*args: object, **kwargs: object) -> None:
-        event.set()
+    def resume(self) -> None:
+        if self.paused and not self._closed:
+            self._set_paused(False)
+            self.resumes += 1
 
-    with qtrio._qt.connection(signal=signal, slot=slot):
-        yield
-        await event.wait()
+    def close(self) -> None:
+        """Leave the source unpaused and stop pausing it."""
+        if self.paused and not self._closed:
+            self._set_paused(False)
 
+        self._closed = True
 
-@attr.s(auto_attribs=True, frozen=True, slots=True)
-class Outcomes:
-    """This class holds an :class:`outcome.Outcome` from each of the Trio and the Qt
-    application execution.  Do not construct instances directly.  Instead, an instance
-    will be returned from :func:`qtrio.run` or available on instances of
-    :attr:`qtrio.Runner.outcomes`.
+
+@attr.s(auto_attribs=True, eq=False)
+class _BackpressureBuffer:
+    """Pause the source through the valve when the inner buffer reaches the high water
+    mark and resume it when taking brings the inner buffer down to the low water mark.
     """
 
-    qt: typing.Optional[outcome.Outcome] = None
-    """The Qt application :class:`outcome.Outcome`"""
-    trio: typing.Optional[outcome.Outcome] = None
-    """The Trio async function :class:`outcome.Outcome`"""
+    inner: _EmissionBuffer[_AnyEmission]
+    backpressure: Backpressure
+    valve: _BackpressureValve
 
-    def unwrap(self) -> object:
-        """Unwrap either the Trio or Qt outcome.  First, errors are given priority over
-        success values.  Second, the Trio outcome gets priority over the Qt outcome.
+    def put(self, emission: _AnyEmission) -> None:
+        self.inner.put(emission)
 
-        Returns:
-            Whatever captured value was selected.
+        if len(self.inner) >= self.backpressure.high_water:
+            self.valve.pause()
 
-        Raises:
-            Exception: Whatever captured exception was selected.
-            qtrio.NoOutcomesError: if no value or exception has been captured.
-        """
+    def take(self) -> _AnyEmission:
+        emission = self.inner.take()
 
-        if self.trio is not None:
-            # highest priority to the Trio outcome, if it is an error we are done
+        if len(self.inner) <= self.backpressure.low_water:
+            self.valve.resume()
+
+        return emission
+
+    def __len__(self) -> int:
+        return len(self.inner)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _ConflatingBuffer:
+    """Keep only the latest emission from each signal.  Signals are identified by the
+    signal instance object which :class:`EmissionsChannelSlot` reuses for every
+    emission.  Emissions are taken in the order of their most recent update.
+    """
+
+    _latest: typing.Dict[int, _AnyEmission] = attr.ib(factory=dict)
+
+    def put(self, emission: _AnyEmission) -> None:
+        key = id(emission.signal)
+        # remove first so the updated signal moves to the end of the order
+        self._latest.pop(key, None)
+        self._latest[key] = emission
+
+    def take(self) -> _AnyEmission:
+        return self._latest.pop(next(iter(self._latest)))
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _BoundedBuffer:
+    """Hold up to :attr:`max_size` emissions and apply an :class:`OverflowPolicy`
+    beyond that.
+    """
+
+    max_size: float
+    policy: OverflowPolicy
+    drops: _DropCounts
+    _emissions: typing.Deque[_AnyEmission] = attr.ib(factory=collections.deque)
+    _overflows: int = 0
+    _error: typing.Optional[Exception] = None
+
+    def put(self, emission: _AnyEmission) -> None:
+        if len(self._emissions) < self.max_size:
+            self._emissions.append(emission)
+            return
+
+        self._overflows += 1
+
+        try:
+            dropped = self.policy.overflow(
+                buffer=self._emissions, emission=emission, overflows=self._overflows
+            )
+        except Exception as e:
+            self._error = e
+            dropped = emission
+
+        self.drops.add(dropped)
+
+    def take(self) -> _AnyEmission:
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+        return self._emissions.popleft()
+
+    def __len__(self) -> int:
+        return len(self._emissions) + (self._error is not None)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _BufferedChannelState(typing.Generic[T]):
+    buffer: _EmissionBuffer[T]
+    parking_lot: trio.lowlevel.ParkingLot = attr.ib(factory=trio.lowlevel.ParkingLot)
+    send_closed: bool = False
+    receive_closed: bool = False
+
+
+class _BufferedSendChannel(trio.abc.SendChannel[T]):
+    """The sending side of a channel storing values in an :class:`_EmissionBuffer`.
+    Sending never blocks, the buffer decides what is kept.  Otherwise this behaves
+    like :class:`trio.MemorySendChannel` without support for cloning.
+    """
+
+    def __init__(self, state: _BufferedChannelState[T]) -> None:
+        self._state = state
+        self._closed = False
+
+    def send_nowait(self, value: T) -> None:
+        if self._closed:
+            raise trio.ClosedResourceError()
+
+        if self._state.receive_closed:
+            raise trio.BrokenResourceError()
+
+        self._state.buffer.put(value)
+        self._state.parking_lot.unpark()
+
+    async def send(self, value: T) -> None:
+        await trio.lowlevel.checkpoint_if_cancelled()
+        self.send_nowait(value)
+        await trio.lowlevel.cancel_shielded_checkpoint()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._state.send_closed = True
+        self._state.parking_lot.unpark_all()
+
+    async def aclose(self) -> None:
+        self.close()
+        await trio.lowlevel.checkpoint()
+
+
+class _BufferedReceiveChannel(trio.abc.ReceiveChannel[T]):
+    """The receiving side of a channel storing values in an :class:`_EmissionBuffer`.
+    Otherwise this behaves like :class:`trio.MemoryReceiveChannel` without support for
+    cloning.
+    """
+
+    def __init__(self, state: _BufferedChannelState[T]) -> None:
+        self._state = state
+        self._closed = False
+
+    def receive_nowait(self) -> T:
+        if self._closed:
+            raise trio.ClosedResourceError()
+
+        if len(self._state.buffer) > 0:
+            return self._state.buffer.take()
+
+        if self._state.send_closed:
+            raise trio.EndOfChannel()
+
+        raise trio.WouldBlock()
+
+    async def receive(self) -> T:
+        await trio.lowlevel.checkpoint_if_cancelled()
+
+        try:
+            value = self.receive_nowait()
+        except trio.WouldBlock:
+            pass
+        else:
+            await trio.lowlevel.cancel_shielded_checkpoint()
+            return value
+
+        while True:
+            await self._state.parking_lot.park()
+
+            try:
+                return self.receive_nowait()
+            except trio.WouldBlock:
+                # another receiver took the emission first
+                continue
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._state.receive_closed = True
+        self._state.parking_lot.unpark_all()
+
+    async def aclose(self) -> None:
+        self.close()
+        await trio.lowlevel.checkpoint()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _ThreadSafeSender:
+    """Accept emissions from any thread and forward them to the send channel from the
+    Trio thread.  Emissions are appended to a deque, which is safe without a lock, and
+    a single delivery is scheduled through the Trio token, and thereby the runner's
+    reenter path, for however many arrive before it runs.
+    """
+
+    send_channel: typing.Union[trio.MemorySendChannel, _BufferedSendChannel]
+    drops: _DropCounts
+    token: trio.lowlevel.TrioToken
+    _pending: typing.Deque[_AnyEmission] = attr.ib(factory=collections.deque)
+    _scheduled: bool = False
+
+    def send_nowait(self, value: _AnyEmission) -> None:
+        self._pending.append(value)
+
+        # a racing thread may schedule a second delivery which will find nothing
+        # pending, but no emission can be left behind since the flag is cleared
+        # before the pending emissions are taken
+        if not self._scheduled:
+            self._scheduled = True
+
+            try:
+                self.token.run_sync_soon(self.deliver)
+            except trio.RunFinishedError:
+                pass
+
+    def deliver(self) -> None:
+        """Send the pending emissions.  Must be called from the Trio thread."""
+        self._scheduled = False
+        pending = self._pending
+
+        while len(pending) > 0:
+            emission = pending.popleft()
+
+            try:
+                self.send_channel.send_nowait(emission)
+            except trio.WouldBlock:
+                self.drops.add(emission)
+            except (trio.ClosedResourceError, trio.BrokenResourceError):
+                pending.clear()
+
+
+def _open_buffered_channel(
+    buffer: _EmissionBuffer[T],
+) -> typing.Tuple[_BufferedSendChannel[T], _BufferedReceiveChannel[T]]:
+    state: _BufferedChannelState[T] = _BufferedChannelState(buffer=buffer)
+
+    return _BufferedSendChannel(state=state), _BufferedReceiveChannel(state=state)
+
+
+@attr.s(auto_attribs=True)
+class Emissions:
+    """Hold elements useful for the application to work with emissions from signals.
+    Do not construct this class directly.  Instead, use
+    :func:`qtrio.enter_emissions_channel`.
+    """
+
+    channel: typing.Union[trio.MemoryReceiveChannel, _BufferedReceiveChannel]
+    """A receive channel to be fed by signal emissions.  This is a
+    :class:`trio.MemoryReceiveChannel` unless conflating, using another overflow policy,
+    or applying backpressure.
+    """
+    send_channel: typing.Union[trio.MemorySendChannel, _BufferedSendChannel]
+    """A send channel collecting signal emissions."""
+    _drops: _DropCounts = attr.ib(factory=_DropCounts)
+    _valve: typing.Optional[_BackpressureValve] = None
+    _batch_error: typing.Optional[Exception] = attr.ib(default=None, init=False)
+
+    @property
+    def paused(self) -> bool:
+        """Whether the source is presently paused by :class:`qtrio.Backpressure`."""
+        return self._valve is not None and self._valve.paused
+
+    @property
+    def pauses(self) -> int:
+        """The number of times the source has been paused by
+        :class:`qtrio.Backpressure`.
+        """
+        return 0 if self._valve is None else self._valve.pauses
+
+    @property
+    def resumes(self) -> int:
+        """The number of times the source has been resumed by
+        :class:`qtrio.Backpressure`.
+        """
+        return 0 if self._valve is None else self._valve.resumes
+
+    def dropped(self, signal: typing.Optional["QtCore.SignalInstance"] = None) -> int:
+        """Get the number of emissions dropped due to the buffer being full.  Emissions
+        replaced when conflating are not counted.
+
+        Args:
+            signal: The signal to count the dropped emissions of.  :obj:`None` to count
+                for all signals.
+
+        Returns:
+            The number of emissions dropped.
+        """
+        return self._drops.count(signal=signal)
+
+    async def aclose(self) -> None:
+        """Asynchronously close the send channel when signal emissions are no longer of
+        interest.
+        """
+        await self.send_channel.aclose()
+
+    def _receive_buffered(
+        self, batch: typing.List[_AnyEmission], max_items: float
+    ) -> typing.List[_AnyEmission]:
+        while len(batch) < max_items:
+            try:
+                batch.append(self.channel.receive_nowait())
+            except (trio.WouldBlock, trio.EndOfChannel):
+                break
+            except Exception as e:
+                # keep the emissions already received and raise from the next batch
+                self._batch_error = e
+                break
+
+        return batch
+
+    async def receive_batch(
+        self, max_items: float = math.inf, max_wait: float = 0
+    ) -> typing.List[_AnyEmission]:
+        """Wait for an emission then receive everything already buffered in one step.
+        This avoids a Trio checkpoint and scheduling round trip per emission for
+        signals emitted at high rates.
+
+        Args:
+            max_items: The largest number of emissions to return.
+            max_wait: After the first emission, continue collecting for up to this many
+                seconds until ``max_items`` have been received.  By default only the
+                emissions already buffered are collected.
+
+        Returns:
+            A non-empty list of emissions in the order received.
+
+        Raises:
+            trio.EndOfChannel: if the send channel is closed and no emissions remain.
+            Exception: Whatever receiving from the channel raised, such as
+                :class:`qtrio.EmissionsOverflowError`.  If emissions were already
+                received for the batch they are returned and the exception is raised
+                by the next call instead.
+        """
+        if max_items < 1:
+            raise ValueError(f"max_items must be at least one, got: {max_items!r}")
+
+        if self._batch_error is not None:
+            error = self._batch_error
+            self._batch_error = None
+            raise error
+
+        batch = self._receive_buffered([await self.channel.receive()], max_items)
+
+        if max_wait > 0:
+            with trio.move_on_after(max_wait):
+                while len(batch) < max_items and self._batch_error is None:
+                    try:
+                        batch.append(await self.channel.receive())
+                    except trio.EndOfChannel:
+                        break
+                    except Exception as e:
+                        self._batch_error = e
+                        break
+
+                    self._receive_buffered(batch, max_items)
+
+        return batch
+
+    def batches(
+        self, max_items: float = math.inf, max_wait: float = 0
+    ) -> typing.AsyncIterator[typing.List[_AnyEmission]]:
+        """Iterate over batches from :meth:`receive_batch` until the send channel is
+        closed.
+
+        .. code-block:: python
+
+            async for batch in emissions.batches(max_items=1000):
+                plot.extend([emission.args for emission in batch])
+
+        Args:
+            max_items: See :meth:`receive_batch`.
+            max_wait: See :meth:`receive_batch`.
+
+        Returns:
+            An async iterator of non-empty lists of emissions.
+        """
+        return _EmissionBatches(emissions=self, max_items=max_items, max_wait=max_wait)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _EmissionBatches:
+    emissions: Emissions
+    max_items: float
+    max_wait: float
+
+    def __aiter__(self) -> "_EmissionBatches":
+        return self
+
+    async def __anext__(self) -> typing.List[_AnyEmission]:
+        try:
+            return await self.emissions.receive_batch(
+                max_items=self.max_items, max_wait=self.max_wait
+            )
+        except trio.EndOfChannel:
+            raise StopAsyncIteration()
+
+
+@contextlib.contextmanager
+def _multiplexed_connections(
+    signals: typing.Iterable["QtCore.SignalInstance"],
+    slot: typing.Callable[[int, typing.Tuple[object, ...]], None],
+    connection_type: typing.Optional["QtCore.Qt.ConnectionType"] = None,
+) -> typing.Generator[None, None, None]:
+    """Connect all of the signals to ``slot`` through one shared receiver for the
+    duration of the context manager.
+    """
+    import qtrio.qt
+
+    receiver = qtrio.qt.EmissionsReceiver(slot=slot)
+
+    for index, signal in enumerate(signals):
+        receiver.add(signal=signal, index=index, connection_type=connection_type)
+
+    try:
+        yield
+    finally:
+        # the connections do not keep the receiver alive so dropping the only
+        # reference destroys it and Qt disconnects all of the signals
+        del receiver
+
+
+@async_generator.asynccontextmanager
+async def open_emissions_channel(
+    signals: typing.Collection["QtCore.SignalInstance"],
+    max_buffer_size: float = math.inf,
+    conflate: bool = False,
+    overflow: OverflowPolicy = DropNewestOverflow(),
+    compact: bool = False,
+    multiplex: bool = False,
+    transform: typing.Optional[_EmissionsTransform] = None,
+    threadsafe: bool = False,
+    backpressure: typing.Optional[Backpressure] = None,
+) -> typing.AsyncGenerator[Emissions, None]:
+    """Create a memory channel fed by the emissions of the signals.  Each signal
+    emission will be converted to a :class:`qtrio.Emission` object.  On exit the send
+    channel is closed.  Management of the receive channel is left to the caller.
+
+    Note:
+        Use this only if you need to process emissions *after* exiting the context
+        manager.  Otherwise use :func:`qtrio.enter_emissions_channel`.
+
+    Args:
+        signals: A collection of signals which will be monitored for emissions.
+        max_buffer_size: When the number of unhandled emissions in the channel reaches
+            this limit then ``overflow`` decides which emissions are dropped.  Ignored
+            when conflating.
+        conflate: Keep only the latest unhandled emission of each signal.  A newer
+            emission replaces the older one so a slow consumer always receives the
+            current state and the buffer holds at most one emission per signal.
+        overflow: The policy for emissions arriving while the buffer is full.  Only
+            the default may be used when conflating.
+        compact: Send :class:`qtrio.CompactEmission` objects instead of
+            :class:`qtrio.Emission` objects to reduce the cost of high rate signals.
+        multiplex: Connect all of the signals to one shared receiver object which is
+            destroyed on exit to disconnect them all at once.  This greatly reduces the
+            time to exit when watching thousands of signals.
+        transform: Called in the Qt slot with the index of the signal and the emitted
+            arguments for each emission.  Return :obj:`None` to discard the emission
+            before an emission object is created or a Trio task is woken.  Otherwise
+            return the tuple of arguments for the emission, either those passed or
+            replacements.  It must not raise.
+        threadsafe: Accept emissions from signals emitted in any thread.  The slots
+            are connected directly through one shared receiver, as when
+            multiplexing, so they run in the emitting thread, including
+            ``transform``.  Emissions are delivered to Trio in batches with one wake-up
+            for however many arrive in the meantime rather than one queued Qt event
+            each.
+        backpressure: Pause the source while the consumer falls behind.  See
+            :class:`qtrio.Backpressure`.
+
+    Returns:
+        The emissions manager with the signals connected to it.
+    """
+
+    if conflate and not isinstance(overflow, DropNewestOverflow):
+        raise ValueError(
+            "An overflow policy can not be used when conflating since the buffer holds"
+            " at most one emission per signal."
+        )
+
+    send_channel: typing.Union[trio.MemorySendChannel, _BufferedSendChannel]
+    receive_channel: typing.Union[trio.MemoryReceiveChannel, _BufferedReceiveChannel]
+    drops = _DropCounts()
+    compact_signals = tuple(signals) if compact else None
+
+    # emissions from other threads are always relayed through the shared receiver
+    multiplex = multiplex or threadsafe
+
+    if backpressure is not None and multiplex and len(backpressure.objects) == 0:
+        raise ValueError(
+            "Backpressure requires the objects to block when multiplexing or"
+            " thread safe."
+        )
+
+    connection_type: typing.Optional["QtCore.Qt.ConnectionType"] = None
+
+    if threadsafe:
+        from qts import QtCore
+
+        connection_type = QtCore.Qt.ConnectionType.DirectConnection
+
+    connections = _SuspendableConnections(connection_type=connection_type)
+    valve: typing.Optional[_BackpressureValve] = None
+
+    if backpressure is not None:
+        valve = _BackpressureValve(
+            objects=backpressure.objects, connections=connections
+        )
+        inner: _EmissionBuffer[_AnyEmission]
+
+        if conflate:
+            inner = _ConflatingBuffer()
+        else:
+            inner = _BoundedBuffer(
+                max_size=max_buffer_size, policy=overflow, drops=drops
+            )
+
+        send_channel, receive_channel = _open_buffered_channel(
+            buffer=_BackpressureBuffer(
+                inner=inner, backpressure=backpressure, valve=valve
+            )
+        )
+    elif conflate:
+        send_channel, receive_channel = _open_buffered_channel(
+            buffer=_ConflatingBuffer()
+        )
+    elif isinstance(overflow, DropNewestOverflow):
+        send_channel, receive_channel = trio.open_memory_channel[_AnyEmission](
+            max_buffer_size=max_buffer_size
+        )
+    else:
+        send_channel, receive_channel = _open_buffered_channel(
+            buffer=_BoundedBuffer(
+                max_size=max_buffer_size, policy=overflow, drops=drops
+            )
+        )
+
+    async with send_channel:
+        with contextlib.ExitStack() as stack:
+            emissions = Emissions(
+                channel=receive_channel,
+                send_channel=send_channel,
+                drops=drops,
+                valve=valve,
+            )
+
+            slot_send_channel: typing.Union[
+                trio.MemorySendChannel, _BufferedSendChannel, _ThreadSafeSender
+            ] = send_channel
+
+            if threadsafe:
+                threadsafe_sender = _ThreadSafeSender(
+                    send_channel=send_channel,
+                    drops=drops,
+                    token=trio.lowlevel.current_trio_token(),
+                )
+                # registered first so it runs after the signals are disconnected
+                stack.callback(threadsafe_sender.deliver)
+                slot_send_channel = threadsafe_sender
+
+            if multiplex:
+                multiplexed_slot = _MultiplexedEmissionsSlot(
+                    signals=tuple(signals)
+                    if compact_signals is None
+                    else compact_signals,
+                    send_channel=slot_send_channel,
+                    drops=drops,
+                    compact=compact,
+                    transform=transform,
+                )
+                stack.enter_context(
+                    _multiplexed_connections(
+                        signals=signals,
+                        slot=multiplexed_slot.slot,
+                        connection_type=connection_type,
+                    )
+                )
+            else:
+                for index, signal in enumerate(signals):
+                    slot = EmissionsChannelSlot(
+                        internal_signal=signal,
+                        send_channel=slot_send_channel,
+                        drops=drops,
+                        index=index,
+                        compact_signals=compact_signals,
+                        transform=(
+                            None
+                            if transform is None
+                            else functools.partial(transform, index)
+                        ),
+                    )
+                    connections.add(signal=signal, slot=slot.slot)
+
+                connections.connect()
+                stack.callback(connections.disconnect)
+
+            if valve is not None:
+                # runs first on exit so the source is not left paused
+                stack.callback(valve.close)
+
+            yield emissions
+
+
+@async_generator.asynccontextmanager
+async def enter_emissions_channel(
+    signals: typing.Collection["QtCore.SignalInstance"],
+    max_buffer_size: float = math.inf,
+    conflate: bool = False,
+    overflow: OverflowPolicy = DropNewestOverflow(),
+    compact: bool = False,
+    multiplex: bool = False,
+    transform: typing.Optional[_EmissionsTransform] = None,
+    threadsafe: bool = False,
+    backpressure: typing.Optional[Backpressure] = None,
+) -> typing.AsyncGenerator[Emissions, None]:
+    """Create a memory channel fed by the emissions of the signals and enter both the
+    send and receive channels' context managers.
+
+    Args:
+        signals: A collection of signals which will be monitored for emissions.
+        max_buffer_size: When the number of unhandled emissions in the channel reaches
+            this limit then ``overflow`` decides which emissions are dropped.  Ignored
+            when conflating.
+        conflate: Keep only the latest unhandled emission of each signal.  A newer
+            emission replaces the older one so a slow consumer always receives the
+            current state and the buffer holds at most one emission per signal.
+        overflow: The policy for emissions arriving while the buffer is full.  Only
+            the default may be used when conflating.
+        compact: Send :class:`qtrio.CompactEmission` objects instead of
+            :class:`qtrio.Emission` objects to reduce the cost of high rate signals.
+        multiplex: Connect all of the signals to one shared receiver object which is
+            destroyed on exit to disconnect them all at once.  This greatly reduces the
+            time to exit when watching thousands of signals.
+        transform: Called in the Qt slot with the index of the signal and the emitted
+            arguments for each emission.  Return :obj:`None` to discard the emission
+            before an emission object is created or a Trio task is woken.  Otherwise
+            return the tuple of arguments for the emission, either those passed or
+            replacements.  It must not raise.
+        threadsafe: Accept emissions from signals emitted in any thread.  The slots
+            are connected directly through one shared receiver, as when
+            multiplexing, so they run in the emitting thread, including
+            ``transform``.  Emissions are delivered to Trio in batches with one wake-up
+            for however many arrive in the meantime rather than one queued Qt event
+            each.
+        backpressure: Pause the source while the consumer falls behind.  See
+            :class:`qtrio.Backpressure`.
+
+    Returns:
+        The emissions manager.
+    """
+    async with open_emissions_channel(
+        signals=signals,
+        max_buffer_size=max_buffer_size,
+        conflate=conflate,
+        overflow=overflow,
+        compact=compact,
+        multiplex=multiplex,
+        transform=transform,
+        threadsafe=threadsafe,
+        backpressure=backpressure,
+    ) as emissions:
+        async with emissions.channel:
+            async with emissions.send_channel:
+                yield emissions
+
+
+@attr.s(auto_attribs=True, eq=False)
+class EmissionRouter:
+    """Dispatch emissions to handlers by the :attr:`qtrio.Emission.index` of their
+    signal.  This takes constant time regardless of the number of signals, unlike a
+    chain of :meth:`qtrio.Emission.is_from` checks.  Pass :attr:`signals` when opening
+    the channel so the indexes match.
+
+    .. code-block:: python
+
+        router = qtrio.EmissionRouter()
+        router.add(button.clicked, on_clicked)
+        router.add(line_edit.textChanged, on_text_changed)
+
+        async with qtrio.enter_emissions_channel(signals=router.signals) as emissions:
+            async for emission in emissions.channel:
+                router.dispatch(emission)
+    """
+
+    _signals: typing.List["QtCore.SignalInstance"] = attr.ib(factory=list, init=False)
+    _handlers: typing.List[typing.Callable[..., object]] = attr.ib(
+        factory=list, init=False
+    )
+
+    @property
+    def signals(self) -> typing.Sequence["QtCore.SignalInstance"]:
+        """The signals with handlers, in the order they were added."""
+        return self._signals
+
+    def add(
+        self, signal: "QtCore.SignalInstance", handler: typing.Callable[..., object]
+    ) -> int:
+        """Add a handler to be called with the arguments of each emission of
+        ``signal``.
+
+        Args:
+            signal: The signal to handle.
+            handler: The callable to pass the emitted arguments to.
+
+        Returns:
+            The index emissions of ``signal`` will have.
+        """
+        self._signals.append(signal)
+        self._handlers.append(handler)
+
+        return len(self._signals) - 1
+
+    def dispatch(self, emission: _AnyEmission) -> object:
+        """Call the handler for the signal the emission came from.  Emissions without
+        an index, such as those constructed directly, or whose index does not refer to
+        their signal in :attr:`signals`, such as from a channel opened with other
+        signals, are matched by comparing signals instead.
+
+        Args:
+            emission: The emission to handle.
+
+        Returns:
+            Whatever the handler returned.  Await it for async handlers.
+
+        Raises:
+            KeyError: if no handler was added for the signal.
+        """
+        index = emission.index
+
+        if index is None or not self._signal_at(index=index, emission=emission):
+            for index, signal in enumerate(self._signals):
+                if emission.is_from(signal):
+                    break
+            else:
+                raise KeyError(emission.signal)
+
+        return self._handlers[index](*emission.args)
+
+    def _signal_at(self, index: int, emission: _AnyEmission) -> bool:
+        """Check that the emission came from the signal at ``index``."""
+        if not 0 <= index < len(self._signals):
+            return False
+
+        signal = self._signals[index]
+
+        # channels opened with signals reuse the same signal instance objects
+        return emission.signal is signal or emission.is_from(signal)
+
+
+class ConcurrencyPolicy(typing_extensions.Protocol):
+    """The interface used by :class:`qtrio.EmissionsNursery` connections to handle an
+    emission arriving while :attr:`max_tasks` tasks started by the connection are still
+    running.
+    """
+
+    @property
+    def max_tasks(self) -> float:
+        """The largest number of tasks to run at once for the connection."""
+        ...
+
+    def busy(
+        self,
+        tasks: typing.Deque[trio.CancelScope],
+        queue: typing.Deque[typing.Tuple[object, ...]],
+        start: typing.Tuple[object, ...],
+    ) -> None:
+        """Handle an emission arriving while :attr:`max_tasks` tasks are running.  Doing
+        nothing drops the emission.
+
+        Args:
+            tasks: The cancel scopes of the running tasks, oldest first.  The policy may
+                cancel them.
+            queue: The pending starts, oldest first.  Each time a task finishes the
+                oldest is started.  The policy may add ``start`` or remove others.
+            start: The pending start for this emission.
+        """
+        ...
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class UnlimitedConcurrency:
+    """Start a task for every emission no matter how many are running.  This is the
+    default.
+    """
+
+    max_tasks: float = attr.ib(default=math.inf, init=False)
+
+    def busy(
+        self,
+        tasks: typing.Deque[trio.CancelScope],
+        queue: typing.Deque[typing.Tuple[object, ...]],
+        start: typing.Tuple[object, ...],
+    ) -> None:
+        """See :meth:`qtrio.ConcurrencyPolicy.busy`."""
+
+
+def _check_max_tasks(instance: object, attribute: object, value: int) -> None:
+    if value < 1:
+        raise ValueError(f"max_tasks must be at least one, got: {value!r}")
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class QueueWhileBusy:
+    """Queue emissions arriving while :attr:`max_tasks` are running and start them in
+    order as the running tasks finish.  With the default of one task the slot calls
+    are serialized.
+    """
+
+    max_tasks: int = attr.ib(default=1, validator=_check_max_tasks)
+    """The largest number of tasks to run at once."""
+
+    def busy(
+        self,
+        tasks: typing.Deque[trio.CancelScope],
+        queue: typing.Deque[typing.Tuple[object, ...]],
+        start: typing.Tuple[object, ...],
+    ) -> None:
+        """See :meth:`qtrio.ConcurrencyPolicy.busy`."""
+        queue.append(start)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DropWhileBusy:
+    """Drop emissions arriving while :attr:`max_tasks` are running, such as to ignore
+    repeated clicks while the first is handled.
+    """
+
+    max_tasks: int = attr.ib(default=1, validator=_check_max_tasks)
+    """The largest number of tasks to run at once."""
+
+    def busy(
+        self,
+        tasks: typing.Deque[trio.CancelScope],
+        queue: typing.Deque[typing.Tuple[object, ...]],
+        start: typing.Tuple[object, ...],
+    ) -> None:
+        """See :meth:`qtrio.ConcurrencyPolicy.busy`."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class CancelPrevious:
+    """Cancel the oldest running task for each emission arriving while
+    :attr:`max_tasks` are running.  The new task starts once the cancelled task has
+    finished and only the latest emissions are kept while waiting.  With the default of
+    one task the latest emission wins, such as for a search query replacing the
+    previous one.
+    """
+
+    max_tasks: int = attr.ib(default=1, validator=_check_max_tasks)
+    """The largest number of tasks to run at once."""
+
+    def busy(
+        self,
+        tasks: typing.Deque[trio.CancelScope],
+        queue: typing.Deque[typing.Tuple[object, ...]],
+        start: typing.Tuple[object, ...],
+    ) -> None:
+        """See :meth:`qtrio.ConcurrencyPolicy.busy`."""
+        for cancel_scope in tasks:
+            if not cancel_scope.cancel_called:
+                cancel_scope.cancel()
+                break
+
+        queue.append(start)
+        cancelled = sum(cancel_scope.cancel_called for cancel_scope in tasks)
+
+        # keep only as many of the latest starts as there are tasks finishing
+        while len(queue) > cancelled:
+            queue.popleft()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _ConcurrencyLimiter:
+    """Start tasks in the nursery as allowed by the :class:`ConcurrencyPolicy`."""
+
+    policy: ConcurrencyPolicy
+    nursery: trio.Nursery
+    _tasks: typing.Deque[trio.CancelScope] = attr.ib(factory=collections.deque)
+    _queue: typing.Deque[typing.Tuple[object, ...]] = attr.ib(factory=collections.deque)
+
+    def start_soon(
+        self, fn: typing.Callable[..., typing.Awaitable[object]], *args: object
+    ) -> None:
+        if isinstance(self.policy, UnlimitedConcurrency):
+            # no need to track the tasks
+            self.nursery.start_soon(fn, *args)
+        elif len(self._tasks) < self.policy.max_tasks:
+            self._start((fn, *args))
+        else:
+            self.policy.busy(tasks=self._tasks, queue=self._queue, start=(fn, *args))
+
+    def _start(self, start: typing.Tuple[object, ...]) -> None:
+        cancel_scope = trio.CancelScope()
+        self._tasks.append(cancel_scope)
+        self.nursery.start_soon(self._run, cancel_scope, *start, name=start[0])
+
+    async def _run(
+        self,
+        cancel_scope: trio.CancelScope,
+        fn: typing.Callable[..., typing.Awaitable[object]],
+        *args: object,
+    ) -> None:
+        try:
+            with cancel_scope:
+                await fn(*args)
+        finally:
+            self._tasks.remove(cancel_scope)
+
+            while len(self._queue) > 0 and len(self._tasks) < self.policy.max_tasks:
+                self._start(self._queue.popleft())
+
+
+class StarterProtocol(typing_extensions.Protocol):
+    def start(self, *args: object) -> None:
+        ...
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DirectStarter:
+    slot: typing.Callable[..., typing.Awaitable[object]]
+    nursery: trio.Nursery
+    concurrency: ConcurrencyPolicy = UnlimitedConcurrency()
+    _limiter: _ConcurrencyLimiter = attr.ib(init=False, eq=False)
+
+    @_limiter.default
+    def _limiter_default(self) -> _ConcurrencyLimiter:
+        return _ConcurrencyLimiter(policy=self.concurrency, nursery=self.nursery)
+
+    def start(self, *args: object) -> None:
+        self._limiter.start_soon(self.slot, *args)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class WrappedStarter:
+    slot: typing.Callable[..., typing.Awaitable[object]]
+    wrapper: typing.Callable[
+        [typing.Callable[..., typing.Awaitable[object]]], typing.Awaitable[object]
+    ]
+    nursery: trio.Nursery
+    concurrency: ConcurrencyPolicy = UnlimitedConcurrency()
+    _limiter: _ConcurrencyLimiter = attr.ib(init=False, eq=False)
+
+    @_limiter.default
+    def _limiter_default(self) -> _ConcurrencyLimiter:
+        return _ConcurrencyLimiter(policy=self.concurrency, nursery=self.nursery)
+
+    def start(self, *args: object) -> None:
+        self._limiter.start_soon(self.wrapper, self.slot, *args)
+
+
+@attr.s(auto_attribs=True)
+class EmissionsNursery:
+    """Holds the nursery, exit stack, and wrapper needed to support connecting signals
+    to both async and sync slots in the nursery.
+    """
+
+    nursery: trio.Nursery
+    """The Trio nursery that will handle execution of the slots."""
+    exit_stack: contextlib.ExitStack
+    """The exit stack that will manage the connections so they get disconnected."""
+    wrapper: typing.Optional[
+        typing.Callable[
+            [typing.Callable[..., typing.Awaitable[object]]],
+            typing.Awaitable[object],
+        ]
+    ] = None
+    """The wrapper for handling the slots.  This could, for example, handle exceptions
+    and present a dialog to avoid cancelling the entire nursery.
+    """
+
+    def connect(
+        self,
+        signal: "QtCore.SignalInstance",
+        slot: typing.Callable[..., typing.Awaitable[object]],
+        concurrency: ConcurrencyPolicy = UnlimitedConcurrency(),
+    ) -> None:
+        """Connect an async signal to this emissions nursery so when called the slot
+        will be run in the nursery.
+
+        Args:
+            signal: The signal to connect.
+            slot: The async callable to run for each emission.
+            concurrency: The policy limiting the number of tasks running the slot at
+                once for this connection.
+        """
+        starter: StarterProtocol
+
+        if self.wrapper is None:
+            starter = DirectStarter(
+                slot=slot, nursery=self.nursery, concurrency=concurrency
+            )
+        else:
+            starter = WrappedStarter(
+                slot=slot,
+                wrapper=self.wrapper,
+                nursery=self.nursery,
+                concurrency=concurrency,
+            )
+
+        self.exit_stack.enter_context(qtrio._qt.connection(signal, starter.start))
+
+    def connect_sync(
+        self,
+        signal: "QtCore.SignalInstance",
+        slot: typing.Callable[..., object],
+        concurrency: ConcurrencyPolicy = UnlimitedConcurrency(),
+    ) -> None:
+        """Connect to a sync slot to this emissions nursery so when called the slot will
+        be run in the nursery.
+
+        Args:
+            signal: The signal to connect.
+            slot: The callable to run for each emission.
+            concurrency: The policy limiting the number of tasks running the slot at
+                once for this connection.
+        """
+
+        async def async_slot(*args: object) -> None:
+            slot(*args)
+
+        self.connect(signal=signal, slot=async_slot, concurrency=concurrency)
+
+
+@async_generator.asynccontextmanager
+async def open_emissions_nursery(
+    until: typing.Optional["QtCore.SignalInstance"] = None,
+    wrapper: typing.Optional[typing.Callable[..., typing.Awaitable[object]]] = None,
+) -> typing.AsyncGenerator[EmissionsNursery, None]:
+    """Open a nursery for handling callbacks triggered by signal emissions.  This allows
+    a 'normal' Qt callback structure while still executing the callbacks within a Trio
+    nursery such that errors have a place to go.  Both async and sync callbacks can be
+    connected.  Sync callbacks will be wrapped in an async call to allow execution in
+    the nursery.
+
+    Arguments:
+        until: Keep the nursery open until this signal is emitted.
+        wrapper: A wrapper for the callbacks such as to process exceptions.
+
+    Returns:
+        The emissions manager.
+    """
+    async with trio.open_nursery() as nursery:
+        with contextlib.ExitStack() as exit_stack:
+            emissions_nursery = EmissionsNursery(
+                nursery=nursery,
+                exit_stack=exit_stack,
+                wrapper=wrapper,
+            )
+
+            if until is not None:
+                async with wait_signal_context(until):
+                    yield emissions_nursery
+            else:
+                yield emissions_nursery
+
+
+@async_generator.asynccontextmanager
+async def wait_signal_context(
+    signal: "QtCore.SignalInstance",
+) -> typing.AsyncGenerator[None, None]:
+    """Connect a signal during the context and wait for it on exit.  Presently no
+    mechanism is provided for retrieving the emitted arguments.
+
+    Args:
+        signal: The signal to connect to and wait for.
+    """
+    event = trio.Event()
+
+    def slot(*args: object, **kwargs: object) -> None:
+        event.set()
+
+    with qtrio._qt.connection(signal=signal, slot=slot):
+        yield
+        await event.wait()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class FirstEmission:
+    """The first matching emission of the signals passed to :func:`qtrio.wait_any`.  Do
+    not construct this class directly.
+    """
+
+    signals: typing.Sequence["QtCore.SignalInstance"]
+    """The signals being waited for."""
+    predicate: typing.Optional[
+        typing.Callable[[int, typing.Tuple[object, ...]], bool]
+    ] = None
+    """Called with the index of the signal and the emitted arguments.  Emissions are
+    ignored unless it returns :obj:`True`.  :obj:`None` to accept any emission.
+    """
+    index: typing.Optional[int] = attr.ib(default=None, init=False)
+    """The position in :attr:`signals` of the signal that was emitted.  :obj:`None`
+    until then.
+    """
+    args: typing.Tuple[object, ...] = attr.ib(default=(), init=False)
+    """The arguments emitted by the signal."""
+    _event: trio.Event = attr.ib(factory=trio.Event, init=False)
+
+    @property
+    def signal(self) -> typing.Optional["QtCore.SignalInstance"]:
+        """The signal that was emitted.  :obj:`None` until then."""
+        if self.index is None:
+            return None
+
+        return self.signals[self.index]
+
+    @property
+    def done(self) -> bool:
+        """Whether a matching emission has been received."""
+        return self.index is not None
+
+    def slot(self, index: int, *args: object) -> None:
+        if self.index is not None:
+            return
+
+        if self.predicate is not None and not self.predicate(index, args):
+            return
+
+        self.index = index
+        self.args = args
+        self._event.set()
+
+    async def wait(self) -> "FirstEmission":
+        """Wait for the first matching emission.  This happens automatically on exiting
+        the :func:`qtrio.wait_any` context but may be done earlier, such as to apply a
+        timeout.
+
+        Returns:
+            This object.
+        """
+        await self._event.wait()
+
+        return self
+
+
+@async_generator.asynccontextmanager
+async def wait_any(
+    signals: typing.Sequence["QtCore.SignalInstance"],
+    predicate: typing.Optional[
+        typing.Callable[[int, typing.Tuple[object, ...]], bool]
+    ] = None,
+) -> typing.AsyncGenerator[FirstEmission, None]:
+    """Connect the signals on entry and wait on exit for the first emission of any of
+    them.  Connecting before starting whatever will cause the emission avoids the race
+    of :func:`qtrio._core.wait_signal` and no channel or emission objects are created.
+
+    .. code-block:: python
+
+        async with qtrio.wait_any([reply.finished, reply.errorOccurred]) as first:
+            reply.start()
+
+        if first.signal == reply.errorOccurred:
+            ...
+
+    Args:
+        signals: The signals to wait for.
+        predicate: Called with the index of the signal and the emitted arguments.
+            Emissions are ignored unless it returns :obj:`True`.  :obj:`None` to accept
+            any emission.
+
+    Returns:
+        The first emission, filled in once received.
+    """
+    first = FirstEmission(signals=signals, predicate=predicate)
+
+    with contextlib.ExitStack() as stack:
+        for index, signal in enumerate(signals):
+            stack.enter_context(
+                qtrio._qt.connection(
+                    signal=signal, slot=functools.partial(first.slot, index)
+                )
+            )
+
+        yield first
+        await first.wait()
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class Outcomes:
+    """This class holds an :class:`outcome.Outcome` from each of the Trio and the Qt
+    application execution.  Do not construct instances directly.  Instead, an instance
+    will be returned from :func:`qtrio.run` or available on instances of
+    :attr:`qtrio.Runner.outcomes`.
+    """
+
+    qt: typing.Optional[outcome.Outcome] = None
+    """The Qt application :class:`outcome.Outcome`"""
+    trio: typing.Optional[outcome.Outcome] = None
+    """The Trio async function :class:`outcome.Outcome`"""
+
+    def unwrap(self) -> object:
+        """Unwrap either the Trio or Qt outcome.  First, errors are given priority over
+        success values.  Second, the Trio outcome gets priority over the Qt outcome.
+
+        Returns:
+            Whatever captured value was selected.
+
+        Raises:
+            Exception: Whatever captured exception was selected.
+            qtrio.NoOutcomesError: if no value or exception has been captured.
+        """
+
+        if self.trio is not None:
+            # highest priority to the Trio outcome, if it is an error we are done
             result = self.trio.unwrap()
 
             # since a Trio result is higher priority, we only care if Qt gave an error
@@ -474,12 +1842,34 @@ class Outcomes:
         raise qtrio.NoOutcomesError()
 
 
+class ApplicationType(enum.Enum):
+    """The type of Qt application to build when one does not already exist.  Services
+    which do not show any windows can avoid loading the GUI stack and a platform plugin
+    by using :attr:`CORE`.
+    """
+
+    CORE = "QCoreApplication"
+    """A ``QtCore.QCoreApplication`` for signals, timers, networking, and such."""
+    GUI = "QGuiApplication"
+    """A ``QtGui.QGuiApplication`` for windowing without widgets such as for QML."""
+    WIDGETS = "QApplication"
+    """A ``QtWidgets.QApplication`` for widget based GUIs."""
+
+
 def run(
     async_fn: typing.Callable[..., typing.Awaitable[object]],
     *args: object,
     done_callback: typing.Optional[typing.Callable[[Outcomes], None]] = None,
     clock: typing.Optional[trio.abc.Clock] = None,
     instruments: typing.Sequence[trio.abc.Instrument] = (),
+    batch_reenter: bool = False,
+    reenter_budget: typing.Optional[float] = None,
+    reenter_priority: typing.Optional[ReenterPriorityPolicy] = None,
+    stats: typing.Optional[ReenterStatistics] = None,
+    wakeup: typing.Optional[WakeupStrategy] = None,
+    trio_thread: bool = False,
+    application_type: ApplicationType = ApplicationType.WIDGETS,
+    frame_rate: typing.Optional[float] = None,
 ) -> object:
     """Run a Trio-flavored async function in guest mode on a Qt host application, and
     return the result.
@@ -490,12 +1880,30 @@ def run(
         done_callback: See :class:`qtrio.Runner.done_callback`.
         clock: See :class:`qtrio.Runner.clock`.
         instruments: See :class:`qtrio.Runner.instruments`.
+        batch_reenter: See :class:`qtrio.Runner.batch_reenter`.
+        reenter_budget: See :class:`qtrio.Runner.reenter_budget`.
+        reenter_priority: See :class:`qtrio.Runner.reenter_priority`.
+        stats: See :class:`qtrio.Runner.stats`.
+        wakeup: See :class:`qtrio.Runner.wakeup`.
+        trio_thread: See :class:`qtrio.Runner.trio_thread`.
+        application_type: See :class:`qtrio.Runner.application_type`.
+        frame_rate: See :class:`qtrio.Runner.frame_rate`.
 
     Returns:
         The object returned by ``async_fn``.
     """
     runner = Runner(
-        done_callback=done_callback, clock=clock, instruments=list(instruments)
+        done_callback=done_callback,
+        clock=clock,
+        instruments=list(instruments),
+        batch_reenter=batch_reenter,
+        reenter_budget=reenter_budget,
+        reenter_priority=reenter_priority,
+        stats=stats,
+        wakeup=wakeup,
+        trio_thread=trio_thread,
+        application_type=application_type,
+        frame_rate=frame_rate,
     )
     runner.run(async_fn, *args)
 
@@ -519,13 +1927,24 @@ def outcome_from_application_return_code(return_code: int) -> outcome.Outcome:
     return outcome.Error(qtrio.ReturnCodeError(return_code))
 
 
-def maybe_build_application() -> "QtGui.QGuiApplication":
+def _is_gui_application(application: "QtCore.QCoreApplication") -> bool:
+    # checked via Qt to avoid importing the GUI modules for a core application
+    return bool(application.inherits("QGuiApplication"))
+
+
+def maybe_build_application(
+    application_type: ApplicationType = ApplicationType.WIDGETS,
+) -> "QtCore.QCoreApplication":
     """Create a new Qt application object if one does not already exist.
 
+    Args:
+        application_type: The type of application to build.  An existing application
+            is returned regardless of its type.
+
     Returns:
         The Qt application object.
     """
-    from qts import QtWidgets  # noqa: F811
+    from qts import QtCore  # noqa: F811
 
     application: QtCore.QCoreApplication
 
@@ -533,44 +1952,515 @@ def maybe_build_application() -> "QtGui.QGuiApplication":
     if qts.is_pyside_5_wrapper:  # pragma: no cover
         maybe_application = typing.cast(
             typing.Optional["QtCore.QCoreApplication"],
-            QtWidgets.QApplication.instance(),
+            QtCore.QCoreApplication.instance(),
         )
     else:
-        maybe_application = QtWidgets.QApplication.instance()
+        maybe_application = QtCore.QCoreApplication.instance()
+
+    if maybe_application is not None:
+        application = maybe_application
+    elif application_type == ApplicationType.CORE:
+        application = QtCore.QCoreApplication(sys.argv[1:])
+    elif application_type == ApplicationType.GUI:
+        from qts import QtGui  # noqa: F811
+
+        application = QtGui.QGuiApplication(sys.argv[1:])
+    else:
+        from qts import QtWidgets  # noqa: F811
+
+        application = QtWidgets.QApplication(sys.argv[1:])
+
+    if _is_gui_application(application):
+        from qts import QtGui  # noqa: F811
+
+        QtGui.QGuiApplication.setQuitOnLastWindowClosed(False)
+
+    return application
+
+
+def _build_application_for(
+    instance: typing.Union["Runner", "SessionManager"]
+) -> "QtCore.QCoreApplication":
+    return maybe_build_application(application_type=instance.application_type)
+
+
+def create_reenter() -> "qtrio.qt.Reenter":
+    import qtrio.qt
+
+    return qtrio.qt.Reenter()
+
+
+def _early_quit_warning() -> None:
+    warnings.warn(
+        message="The Qt application quit early.  See https://qtrio.readthedocs.io/en/stable/lifetimes.html",
+        category=qtrio.ApplicationQuitWarning,
+    )
+
+
+@attr.s(auto_attribs=True, eq=False)
+class Histogram:
+    """A low overhead histogram of durations.  Durations are counted in buckets with
+    power of two microsecond bounds so recording is a few integer operations.  Bucket
+    ``0`` counts durations under one microsecond and bucket ``i`` counts those from
+    ``2 ** (i - 1)`` up to ``2 ** i`` microseconds.  The last bucket also collects
+    anything longer.
+    """
+
+    buckets: typing.List[int] = attr.ib(factory=lambda: [0] * 32)
+    """The count of durations recorded in each bucket."""
+    count: int = 0
+    """The total number of durations recorded."""
+    total: float = 0
+    """The sum of all recorded durations, in seconds."""
+    maximum: float = 0
+    """The longest recorded duration, in seconds."""
+
+    def record(self, duration: float) -> None:
+        """Record a duration.
+
+        Args:
+            duration: The duration, in seconds.
+        """
+        index = min(int(duration * 1_000_000).bit_length(), len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += duration
+
+        if duration > self.maximum:
+            self.maximum = duration
+
+    def mean(self) -> float:
+        """Calculate the mean of the recorded durations.
+
+        Returns:
+            The mean duration, in seconds.  ``0`` if nothing has been recorded.
+        """
+        if self.count == 0:
+            return 0
+
+        return self.total / self.count
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile, such as ``0.99`` for the 99th percentile, of the
+        recorded durations.  The estimate is the upper bound of the bucket holding the
+        quantile so it is never below the true value and is at most twice it.
+
+        Args:
+            fraction: The quantile to estimate, from ``0`` to ``1``.
+
+        Returns:
+            The estimated duration, in seconds.  ``0`` if nothing has been recorded.
+        """
+        if self.count == 0:
+            return 0
+
+        target = fraction * self.count
+        seen = 0
+
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+
+            if seen >= target and seen > 0:
+                break
+
+        return min((1 << index) / 1_000_000, self.maximum)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ReenterStatistics:
+    """Counts and timing histograms of the reenter events used by a
+    :class:`qtrio.Runner` to run Trio in the Qt host loop.  Pass an instance as
+    :attr:`qtrio.Runner.stats` to enable collection.
+    """
+
+    events_posted: int = 0
+    """The number of reenter events posted to the Qt event loop."""
+    events_dispatched: int = 0
+    """The number of reenter events handled by the Qt event loop."""
+    latency: Histogram = attr.ib(factory=Histogram)
+    """The delay from posting each event until Qt dispatched it."""
+    execution: Histogram = attr.ib(factory=Histogram)
+    """The time spent running the callbacks of each event."""
+
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+    """Protects :attr:`events_posted` since events may be posted from any thread."""
+
+    def record_posted(self) -> None:
+        """Count a posted reenter event.  This may be called from any thread."""
+        with self._lock:
+            self.events_posted += 1
+
+    def record_dispatched(self, posted: float, started: float, finished: float) -> None:
+        """Record the timing of a dispatched reenter event.  This must be called from
+        the Qt host thread.
+
+        Args:
+            posted: The :func:`time.perf_counter` timestamp when the event was posted.
+            started: The timestamp when the event's callback started running.
+            finished: The timestamp when the event's callback finished running.
+        """
+        self.events_dispatched += 1
+        self.latency.record(started - posted)
+        self.execution.record(finished - started)
+
+
+class ReenterPriorityPolicy(typing_extensions.Protocol):
+    """The interface used by :class:`qtrio.Runner` to choose the Qt event priority
+    reenter events are posted with.
+    """
+
+    def priority(self, depth: int) -> int:
+        """Choose the priority for a reenter event.
+
+        Args:
+            depth: The number of reenter callbacks waiting to be run in the Qt host
+                thread, including those to be run by the event being posted.
+
+        Returns:
+            The priority to pass to :meth:`QtCore.QCoreApplication.postEvent`.  Qt
+            uses ``1`` for high, ``0`` for normal, and ``-1`` for low priority.
+        """
+        ...
+
+
+def _event_priority_value(priority: int | QtCore.Qt.EventPriority) -> int:
+    """Convert a :class:`QtCore.Qt.EventPriority` to the integer that
+    :meth:`QtCore.QCoreApplication.postEvent` accepts.  Integers are passed through.
+    """
+    return int(getattr(priority, "value", priority))
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class FixedReenterPriority:
+    """Post all reenter events with the same priority.  For example,
+    ``QtCore.Qt.EventPriority.HighEventPriority`` for latency sensitive applications
+    or ``QtCore.Qt.EventPriority.LowEventPriority`` for background services.
+    """
+
+    value: int = attr.ib(default=0, converter=_event_priority_value)
+    """The priority to post with."""
+
+    def priority(self, depth: int) -> int:
+        """See :meth:`qtrio.ReenterPriorityPolicy.priority`."""
+        return self.value
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DepthReenterPriority:
+    """Choose the reenter event priority based on how many reenter callbacks are
+    waiting.  By default Trio is given high priority once it falls behind by
+    ``threshold`` callbacks and normal priority otherwise.
+    """
+
+    threshold: int
+    """The depth at or above which :attr:`deep` is used."""
+    shallow: int = attr.ib(default=0, converter=_event_priority_value)
+    """The priority to use while the depth is below :attr:`threshold`."""
+    deep: int = attr.ib(default=1, converter=_event_priority_value)
+    """The priority to use once the depth reaches :attr:`threshold`."""
+
+    def priority(self, depth: int) -> int:
+        """See :meth:`qtrio.ReenterPriorityPolicy.priority`."""
+        if depth >= self.threshold:
+            return self.deep
+
+        return self.shallow
+
+
+class WakeupStrategy(typing_extensions.Protocol):
+    """The interface used by :class:`qtrio.Runner` to wake the Qt host thread and run
+    reenter callbacks there.
+    """
+
+    def attach(self, runner: Runner) -> None:
+        """Prepare to wake the host for the passed runner.  This is called from the Qt
+        host thread when the runner is created so any :class:`QtCore.QObject` instances
+        created here will live in that thread.
+
+        Args:
+            runner: The runner to wake the host for.
+        """
+        ...
+
+    def post(self, fn: typing.Callable[[], object], depth: int) -> None:
+        """Arrange for ``fn`` to be called soon in the Qt host thread.  This may be
+        called from any thread and must not call ``fn`` before returning.  Callables
+        must be run in the order they were posted.
+
+        Args:
+            fn: The callable to run.
+            depth: The number of callbacks waiting, for use with
+                :attr:`qtrio.Runner.reenter_priority`.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any resources once the runner is done.  No further calls to
+        :meth:`post` will be made.
+        """
+        ...
+
+
+@attr.s(auto_attribs=True, eq=False)
+class PostEventWakeup:
+    """Post a :class:`qtrio.qt.ReenterEvent` to :attr:`qtrio.Runner.reenter` for each
+    wake-up.  This is the default strategy and the only one which supports
+    :attr:`qtrio.Runner.reenter_priority`.
+    """
+
+    _runner: typing.Optional[Runner] = attr.ib(default=None, init=False)
+
+    def attach(self, runner: Runner) -> None:
+        """See :meth:`qtrio.WakeupStrategy.attach`."""
+        self._runner = runner
+
+    def post(self, fn: typing.Callable[[], object], depth: int) -> None:
+        """See :meth:`qtrio.WakeupStrategy.post`."""
+        import qtrio.qt
+
+        runner = self._runner
+
+        if runner is None:
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
+
+        event = qtrio.qt.ReenterEvent(fn=fn, stats=runner.stats)
+
+        if runner.stats is not None:
+            runner.stats.record_posted()
+
+        if runner.reenter_priority is None:
+            runner.application.postEvent(runner.reenter, event)
+        else:
+            priority = runner.reenter_priority.priority(depth=depth)
+            runner.application.postEvent(runner.reenter, event, priority)
+
+    def close(self) -> None:
+        """See :meth:`qtrio.WakeupStrategy.close`."""
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _QueuedWakeup(abc.ABC):
+    """The shared implementation of strategies which queue the posted callables and
+    drain the queue when the host thread is woken.  Subclasses implement
+    :meth:`_wake`.
+    """
+
+    _stats: typing.Optional[ReenterStatistics] = attr.ib(default=None, init=False)
+    _queue: typing.Deque[typing.Tuple[float, typing.Callable[[], object]]] = attr.ib(
+        factory=collections.deque, init=False
+    )
+    """The posted callables along with their :func:`time.perf_counter` timestamps.
+    :meth:`collections.deque.append` and :meth:`collections.deque.popleft` are
+    thread-safe so no lock is needed.
+    """
+
+    def attach(self, runner: Runner) -> None:
+        """See :meth:`qtrio.WakeupStrategy.attach`."""
+        self._stats = runner.stats
+
+    def post(self, fn: typing.Callable[[], object], depth: int) -> None:
+        """See :meth:`qtrio.WakeupStrategy.post`."""
+        self._queue.append((time.perf_counter(), fn))
+
+        if self._stats is not None:
+            self._stats.record_posted()
+
+        self._wake()
+
+    def close(self) -> None:
+        """See :meth:`qtrio.WakeupStrategy.close`."""
+
+    @abc.abstractmethod
+    def _wake(self) -> None:
+        """Wake the host thread so it calls :meth:`_drain`."""
+
+    def _drain(self, *args: object) -> None:
+        """Run the callables posted so far.  Those posted while draining are left for
+        the wake-up they triggered.  Each wake-up may find the queue already drained.
+
+        Args:
+            args: Ignored, to accept any arguments emitted by the waking signal.
+        """
+        stats = self._stats
+
+        for _ in range(len(self._queue)):
+            posted, fn = self._queue.popleft()
+
+            try:
+                if stats is None:
+                    fn()
+                else:
+                    started = time.perf_counter()
+                    fn()
+                    stats.record_dispatched(
+                        posted=posted, started=started, finished=time.perf_counter()
+                    )
+            except Exception as e:
+                raise qtrio.InternalError("Exception while handling a wakeup") from e
+
+
+@attr.s(auto_attribs=True, eq=False)
+class SocketNotifierWakeup(_QueuedWakeup):
+    """Write a byte to a socket pair watched by a :class:`QtCore.QSocketNotifier` for
+    each wake-up.  A socket pair is used rather than a pipe or an ``eventfd`` so this
+    also works on Windows.
+    """
+
+    _receive_socket: typing.Optional[socket.socket] = attr.ib(default=None, init=False)
+    _send_socket: typing.Optional[socket.socket] = attr.ib(default=None, init=False)
+    _notifier: typing.Optional[QtCore.QSocketNotifier] = attr.ib(
+        default=None, init=False
+    )
+
+    def attach(self, runner: Runner) -> None:
+        """See :meth:`qtrio.WakeupStrategy.attach`."""
+        from qts import QtCore
+
+        super().attach(runner=runner)
+
+        self._receive_socket, self._send_socket = socket.socketpair()
+        self._receive_socket.setblocking(False)
+        self._send_socket.setblocking(False)
+
+        self._notifier = QtCore.QSocketNotifier(
+            self._receive_socket.fileno(), QtCore.QSocketNotifier.Type.Read
+        )
+        self._notifier.activated.connect(self._activated)
+
+    def close(self) -> None:
+        """See :meth:`qtrio.WakeupStrategy.close`."""
+        # The notifier is only disabled since this may be called from within its own
+        # activated signal.
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+
+        for this_socket in [self._receive_socket, self._send_socket]:
+            if this_socket is not None:
+                this_socket.close()
+
+    def _wake(self) -> None:
+        if self._send_socket is None:
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
+
+        try:
+            self._send_socket.send(b"\0")
+        except BlockingIOError:
+            # the buffer is full of unread wake-ups already
+            pass
+
+    def _activated(self, *args: object) -> None:
+        if self._receive_socket is None:  # pragma: no cover
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
+
+        # read before draining so no wake-up is lost
+        with contextlib.suppress(BlockingIOError):
+            while len(self._receive_socket.recv(4096)) > 0:
+                pass
+
+        self._drain()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class SignalWakeup(_QueuedWakeup):
+    """Emit a signal with a queued connection to the host thread for each wake-up."""
+
+    _relay: typing.Optional[qtrio.qt.WakeupRelay] = attr.ib(default=None, init=False)
+
+    def attach(self, runner: Runner) -> None:
+        """See :meth:`qtrio.WakeupStrategy.attach`."""
+        from qts import QtCore
+        import qtrio.qt
+
+        super().attach(runner=runner)
+
+        self._relay = qtrio.qt.WakeupRelay()
+        self._relay.wake.connect(self._drain, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def _wake(self) -> None:
+        if self._relay is None:
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
+
+        self._relay.wake.emit()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class TimerWakeup(_QueuedWakeup):
+    """Start a zero interval, single shot :class:`QtCore.QTimer` that drains the queue
+    for each wake-up.  Since a timer can only be started from its own thread, wake-ups
+    from other threads start it via a queued signal.
+    """
+
+    _timer: typing.Optional[QtCore.QTimer] = attr.ib(default=None, init=False)
+    _relay: typing.Optional[qtrio.qt.WakeupRelay] = attr.ib(default=None, init=False)
+    _host_thread: typing.Optional[int] = attr.ib(default=None, init=False)
+
+    def attach(self, runner: Runner) -> None:
+        """See :meth:`qtrio.WakeupStrategy.attach`."""
+        from qts import QtCore
+        import qtrio.qt
+
+        super().attach(runner=runner)
+
+        self._host_thread = threading.get_ident()
+
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._drain)
+
+        self._relay = qtrio.qt.WakeupRelay()
+        self._relay.wake.connect(
+            self._start_timer, QtCore.Qt.ConnectionType.QueuedConnection
+        )
 
-    if maybe_application is None:
-        application = QtWidgets.QApplication(sys.argv[1:])
-    else:
-        application = maybe_application
+    def close(self) -> None:
+        """See :meth:`qtrio.WakeupStrategy.close`."""
+        if self._timer is not None:
+            self._timer.stop()
 
-    application.setQuitOnLastWindowClosed(False)
+    def _wake(self) -> None:
+        if self._relay is None:
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
 
-    return application
+        if threading.get_ident() == self._host_thread:
+            self._start_timer()
+        else:
+            self._relay.wake.emit()
 
+    def _start_timer(self) -> None:
+        if self._timer is None:  # pragma: no cover
+            raise qtrio.InternalError("The wakeup strategy has not been attached.")
 
-def create_reenter() -> "qtrio.qt.Reenter":
-    import qtrio.qt
+        if not self._timer.isActive():
+            self._timer.start()
 
-    return qtrio.qt.Reenter()
 
+def _wakeup_or_default(wakeup: typing.Optional[WakeupStrategy]) -> WakeupStrategy:
+    if wakeup is None:
+        return PostEventWakeup()
 
-def _early_quit_warning() -> None:
-    warnings.warn(
-        message="The Qt application quit early.  See https://qtrio.readthedocs.io/en/stable/lifetimes.html",
-        category=qtrio.ApplicationQuitWarning,
-    )
+    return wakeup
 
 
 @attr.s(auto_attribs=True, slots=True)
 class Runner:
     """This class helps run Trio in guest mode on a Qt host application."""
 
-    application: "QtGui.QGuiApplication" = attr.ib(factory=maybe_build_application)
+    application_type: ApplicationType = attr.ib(
+        default=ApplicationType.WIDGETS, kw_only=True
+    )
+    """The type of application to build if :attr:`application` is not passed and no
+    application exists yet.
+    """
+    application: "QtCore.QCoreApplication" = attr.ib(
+        default=attr.Factory(_build_application_for, takes_self=True)
+    )
     """The Qt application object to run as the host.  If not set before calling
-    :meth:`run` the application will be created as
-    ``QtWidgets.QApplication(sys.argv[1:])`` and ``.setQuitOnLastWindowClosed(False)``
-    will be called on it to allow the application to continue throughout the lifetime of
-    the async function passed to :meth:`qtrio.Runner.run`.
+    :meth:`run` the application will be created per :attr:`application_type`, by
+    default as ``QtWidgets.QApplication(sys.argv[1:])``.  For GUI applications
+    ``.setQuitOnLastWindowClosed(False)`` will be called on it to allow the application
+    to continue throughout the lifetime of the async function passed to
+    :meth:`qtrio.Runner.run`.
     """
     quit_application: bool = True
     """When true, the :meth:`done_callback` method will quit the application when the
@@ -600,14 +2490,108 @@ class Runner:
     of the async function passed to :meth:`run` will be passed to this callback.
     """
 
+    batch_reenter: bool = False
+    """When true, the callbacks passed to :meth:`run_sync_soon_threadsafe` are collected
+    in a thread-safe queue and at most one reenter event is posted to the Qt event loop
+    at a time.  When that event is handled, the entire queue is drained.  This reduces
+    the number of events posted when Trio schedules many callbacks such as under heavy
+    I/O load.
+    """
+
+    reenter_budget: typing.Optional[float] = None
+    """The maximum time, in seconds, to spend running queued reenter callbacks before
+    yielding back to the Qt event loop.  Once the budget is spent, the remaining
+    callbacks are left queued and a new reenter event is posted so that Qt can process
+    input and paint events in between.  At least one callback is run per event.  Setting
+    a budget implies :attr:`batch_reenter`.  :obj:`None` disables the budget.
+    """
+
+    reenter_priority: typing.Optional[ReenterPriorityPolicy] = attr.ib(default=None)
+    """The policy choosing the Qt event priority for each posted reenter event, such as
+    :class:`qtrio.FixedReenterPriority` or :class:`qtrio.DepthReenterPriority`.  With
+    :attr:`batch_reenter` the depth passed to the policy is the number of queued
+    callbacks when a draining event is posted.  Otherwise it is the number of
+    outstanding reenter events.  :obj:`None` uses Qt's default priority and skips the
+    depth tracking.  Only supported with the :class:`qtrio.PostEventWakeup`
+    :attr:`wakeup` strategy.
+    """
+
+    @reenter_priority.validator
+    def _check_reenter_priority(
+        self, attribute: object, value: typing.Optional[ReenterPriorityPolicy]
+    ) -> None:
+        if value is not None and not isinstance(self.wakeup, PostEventWakeup):
+            raise ValueError(
+                "reenter_priority is only supported with the PostEventWakeup wakeup"
+                f" strategy, got: {self.wakeup!r}"
+            )
+
+    stats: typing.Optional[ReenterStatistics] = None
+    """When set, the reenter events will be counted and their dispatch latency and
+    execution time recorded here.  :obj:`None` disables collection.
+    """
+
+    wakeup: WakeupStrategy = attr.ib(default=None, converter=_wakeup_or_default)
+    """The strategy used to wake the Qt host thread to run the reenter callbacks, such
+    as :class:`qtrio.PostEventWakeup`, :class:`qtrio.SocketNotifierWakeup`,
+    :class:`qtrio.SignalWakeup`, or :class:`qtrio.TimerWakeup`.  Each instance may only
+    be used with one runner.  :obj:`None` uses a new :class:`qtrio.PostEventWakeup`.
+    """
+
+    trio_thread: bool = False
+    """When true, :meth:`run` hosts the Trio guest on the event loop of a dedicated
+    :class:`QtCore.QThread` rather than on the thread running the Qt application.  This
+    keeps async networking and processing from competing with painting.  The
+    :attr:`reenter` object is moved to that thread and :attr:`wakeup` is attached from
+    it.  Use :func:`qtrio.run_sync_in_gui_thread` to interact with widgets from Trio.  If
+    the application quits before the Trio run is done then the run is cancelled and
+    waited for.
+    """
+
+    frame_rate: typing.Optional[float] = None
+    """The rate, in frames per second, of the shared timer driving
+    :func:`qtrio.next_frame` and :func:`qtrio.frames`.  :obj:`None` uses the refresh
+    rate of the primary screen for GUI applications and 60 otherwise.
+    """
+
     outcomes: Outcomes = attr.ib(factory=Outcomes, init=False)
     """The outcomes from the Qt and Trio runs."""
     cancel_scope: trio.CancelScope = attr.ib(default=None, init=False)
     """An all encompassing cancellation scope for the Trio execution."""
+    reenter_budget_hits: int = attr.ib(default=0, init=False)
+    """The number of times :attr:`reenter_budget` was spent with callbacks remaining
+    such that they were handed back to the Qt event loop.
+    """
 
     _done: bool = attr.ib(default=False, init=False)
     """Just an indicator that the run is done.  Presently used only for a test."""
 
+    _reenter_queue: typing.Deque[typing.Callable[[], object]] = attr.ib(
+        factory=collections.deque, init=False
+    )
+    """The callbacks waiting to be run when :attr:`batch_reenter` is enabled."""
+    _reenter_lock: threading.Lock = attr.ib(factory=threading.Lock, init=False)
+    """Protects :attr:`_reenter_queue` and :attr:`_reenter_posted`."""
+    _reenter_posted: bool = attr.ib(default=False, init=False)
+    """Whether a reenter event to drain :attr:`_reenter_queue` is outstanding."""
+    _reenter_outstanding: int = attr.ib(default=0, init=False)
+    """The number of unbatched reenter events posted but not yet handled.  Only tracked
+    when :attr:`reenter_priority` is set.
+    """
+    _thread: typing.Optional[QtCore.QThread] = attr.ib(default=None, init=False)
+    """The thread hosting Trio when :attr:`trio_thread` is enabled."""
+    _gui_reenter: typing.Optional[qtrio.qt.Reenter] = attr.ib(default=None, init=False)
+    """The reenter object living in the application's thread when
+    :attr:`trio_thread` is enabled.
+    """
+
+    _cancel_requested: bool = attr.ib(default=False, init=False)
+    """Set when :meth:`_request_cancel` has been called."""
+
+    def __attrs_post_init__(self) -> None:
+        if not self.trio_thread:
+            self.wakeup.attach(runner=self)
+
     def run(
         self,
         async_fn: typing.Callable[..., typing.Awaitable[object]],
@@ -631,15 +2615,12 @@ class Runner:
         if _reenter_event_type is None:
             register_event_type()
 
-        trio.lowlevel.start_guest_run(
-            self.trio_main,
-            async_fn,
-            args,
-            run_sync_soon_threadsafe=self.run_sync_soon_threadsafe,
-            done_callback=self.trio_done,
-            clock=self.clock,
-            instruments=self.instruments,
-        )
+        if self.trio_thread:
+            self._start_trio_thread(async_fn=async_fn, args=args)
+        else:
+            self._start_guest_run(
+                async_fn=async_fn, args=args, done_callback=self.trio_done
+            )
 
         if self.quit_application:
             self.application.aboutToQuit.connect(_early_quit_warning)
@@ -647,6 +2628,9 @@ class Runner:
         if execute_application:
             return_code = qts.util.exec(self.application)
 
+            if self._thread is not None:
+                self._join_trio_thread()
+
             self.outcomes = attr.evolve(
                 self.outcomes,
                 qt=outcome_from_application_return_code(return_code),
@@ -654,6 +2638,98 @@ class Runner:
 
         return self.outcomes
 
+    def _start_guest_run(
+        self,
+        async_fn: typing.Callable[..., typing.Awaitable[object]],
+        args: typing.Tuple[object, ...],
+        done_callback: typing.Callable[[outcome.Outcome], None],
+    ) -> None:
+        trio.lowlevel.start_guest_run(
+            self.trio_main,
+            async_fn,
+            args,
+            run_sync_soon_threadsafe=self.run_sync_soon_threadsafe,
+            done_callback=done_callback,
+            clock=self.clock,
+            instruments=self.instruments,
+        )
+
+    def _start_trio_thread(
+        self,
+        async_fn: typing.Callable[..., typing.Awaitable[object]],
+        args: typing.Tuple[object, ...],
+    ) -> None:
+        """Start a :class:`qtrio.qt.EventLoopThread` and start the Trio guest run on
+        its event loop.
+        """
+        import qtrio.qt
+
+        def start() -> None:
+            self.wakeup.attach(runner=self)
+            self._start_guest_run(
+                async_fn=async_fn, args=args, done_callback=self._trio_thread_done
+            )
+
+        if self._gui_reenter is None:
+            self._gui_reenter = qtrio.qt.Reenter()
+
+        self._thread = qtrio.qt.EventLoopThread(start=start)
+        self.reenter.moveToThread(self._thread)
+        self._thread.start()
+
+    def _trio_thread_done(self, run_outcome: outcome.Outcome) -> None:
+        """Will be called in the Trio thread after the Trio guest run has finished.
+        The thread's event loop is stopped and :meth:`trio_done` is run in the
+        application's thread.
+
+        Arguments:
+            run_outcome: The outcome of the Trio guest run.
+        """
+        import qtrio.qt
+
+        if self._thread is None or self._gui_reenter is None:  # pragma: no cover
+            raise qtrio.InternalError("Trio thread done without a Trio thread.")
+
+        self.wakeup.close()
+        self._thread.quit()
+
+        event = qtrio.qt.ReenterEvent(fn=functools.partial(self.trio_done, run_outcome))
+        self.application.postEvent(self._gui_reenter, event)
+
+    def _join_trio_thread(self) -> None:
+        """Wait for the Trio thread to finish, cancelling the run first if the
+        application quit before it was done.
+        """
+        from qts import QtCore
+        import qtrio.qt
+
+        if self._thread is None or self._gui_reenter is None:  # pragma: no cover
+            raise qtrio.InternalError("Joining a Trio thread that was not started.")
+
+        if self.outcomes.trio is None:
+            self._request_cancel()
+
+        # keep running the calls posted by the Trio thread, such as those from
+        # run_sync_in_gui_thread() which wait shielded for their result
+        while not self._thread.wait(10):
+            QtCore.QCoreApplication.sendPostedEvents(self._gui_reenter)
+
+        # deliver the trio_done() posted by the Trio thread
+        QtCore.QCoreApplication.sendPostedEvents(self._gui_reenter)
+
+    def _request_cancel(self) -> None:
+        """Cancel the Trio run from any thread.  A request made before
+        :meth:`trio_main` has entered its cancel scope is applied once it does.
+        """
+        # trio_main() sets the scope before checking the flag so one of them will
+        # see the other
+        self._cancel_requested = True
+
+        cancel_scope = self.cancel_scope
+
+        if cancel_scope is not None:
+            self.run_sync_soon_threadsafe(cancel_scope.cancel)
+
     def run_sync_soon_threadsafe(self, fn: typing.Callable[[], object]) -> None:
         """Helper for the Trio guest to execute a sync function in the Qt host
         thread when called from the Trio guest thread.  This call will not block waiting
@@ -662,10 +2738,104 @@ class Runner:
         Args:
             fn: A no parameter callable.
         """
-        import qtrio.qt
+        if self.batch_reenter or self.reenter_budget is not None:
+            with self._reenter_lock:
+                self._reenter_queue.append(fn)
 
-        event = qtrio.qt.ReenterEvent(fn=fn)
-        self.application.postEvent(self.reenter, event)
+                if self._reenter_posted:
+                    return
+
+                self._reenter_posted = True
+                depth = len(self._reenter_queue)
+
+            self._post_reenter_event(fn=self._drain_reenter_queue, depth=depth)
+        elif self.reenter_priority is None:
+            self._post_reenter_event(fn=fn, depth=0)
+        else:
+            with self._reenter_lock:
+                self._reenter_outstanding += 1
+                depth = self._reenter_outstanding
+
+            self._post_reenter_event(
+                fn=functools.partial(self._run_outstanding, fn), depth=depth
+            )
+
+    def _post_reenter_event(self, fn: typing.Callable[[], object], depth: int) -> None:
+        """Hand a callable to :attr:`wakeup` to be run in the Qt host thread.
+
+        Args:
+            fn: The callable to run.
+            depth: The number of callbacks waiting, passed on to the priority policy.
+        """
+        self.wakeup.post(fn=fn, depth=depth)
+
+    def _run_outstanding(self, fn: typing.Callable[[], object]) -> None:
+        """Run an unbatched reenter callback and account for it no longer being
+        outstanding.
+        """
+        with self._reenter_lock:
+            self._reenter_outstanding -= 1
+
+        fn()
+
+    def _drain_reenter_queue(self) -> None:
+        """Run the callbacks collected in the batched reenter queue.  Callbacks queued
+        while draining will be handled by a newly posted event.  If
+        :attr:`reenter_budget` is spent, or a callback raises, then the remaining
+        callbacks are requeued ahead of those and left for a later event.
+        """
+        with self._reenter_lock:
+            batch = self._reenter_queue
+            self._reenter_queue = collections.deque()
+            self._reenter_posted = False
+
+        deadline = (
+            None
+            if self.reenter_budget is None
+            else time.perf_counter() + self.reenter_budget
+        )
+
+        while len(batch) > 0:
+            fn = batch.popleft()
+
+            try:
+                fn()
+            except BaseException:
+                self._requeue_reenter_batch(batch=batch)
+                raise
+
+            if (
+                deadline is not None
+                and len(batch) > 0
+                and time.perf_counter() >= deadline
+            ):
+                break
+        else:
+            return
+
+        self.reenter_budget_hits += 1
+        self._requeue_reenter_batch(batch=batch)
+
+    def _requeue_reenter_batch(
+        self, batch: typing.Deque[typing.Callable[[], object]]
+    ) -> None:
+        """Put callbacks left over from a drain back at the front of the batched
+        reenter queue and make sure an event is posted to run them.
+
+        Args:
+            batch: The callbacks which have not been run.
+        """
+        with self._reenter_lock:
+            batch.extend(self._reenter_queue)
+            self._reenter_queue = batch
+
+            if self._reenter_posted or len(self._reenter_queue) == 0:
+                return
+
+            self._reenter_posted = True
+            depth = len(self._reenter_queue)
+
+        self._post_reenter_event(fn=self._drain_reenter_queue, depth=depth)
 
     async def trio_main(
         self,
@@ -685,23 +2855,28 @@ class Runner:
         Returns:
             The result returned by `async_fn`.
         """
-        from qts import QtGui
-
         result: object = None
 
+        _current_runner.set(self)
+
         with trio.CancelScope() as self.cancel_scope:
+            if self._cancel_requested:
+                self.cancel_scope.cancel()
+
             with contextlib.ExitStack() as exit_stack:
-                if (
-                    isinstance(self.application, QtGui.QGuiApplication)
-                    and self.application.quitOnLastWindowClosed()
-                ):
-                    exit_stack.enter_context(
-                        qtrio._qt.connection(
-                            signal=self.application.lastWindowClosed,
-                            slot=self.cancel_scope.cancel,
-                        )
+                if _is_gui_application(self.application):
+                    gui_application = typing.cast(
+                        "QtGui.QGuiApplication", self.application
                     )
 
+                    if gui_application.quitOnLastWindowClosed():
+                        exit_stack.enter_context(
+                            qtrio._qt.connection(
+                                signal=gui_application.lastWindowClosed,
+                                slot=self.cancel_scope.cancel,
+                            )
+                        )
+
                 result = await async_fn(*args)
 
         return result
@@ -723,8 +2898,374 @@ class Runner:
         if self.done_callback is not None:
             self.done_callback(self.outcomes)
 
+        if self._thread is None:
+            self.wakeup.close()
+
         if self.quit_application:
             self.application.aboutToQuit.disconnect(_early_quit_warning)
             self.application.quit()
 
         self._done = True
+
+
+_current_runner: trio.lowlevel.RunVar = trio.lowlevel.RunVar("qtrio_runner")
+"""The :class:`qtrio.Runner` hosting the present Trio run, if any."""
+
+
+async def run_sync_in_gui_thread(fn: typing.Callable[..., T], *args: object) -> T:
+    """Run a sync function in the thread of the Qt application and return the result.
+    Widgets must only be used from that thread so this is the way to interact with them
+    when :attr:`qtrio.Runner.trio_thread` is enabled.  Otherwise Trio is already running
+    in that thread and ``fn`` is simply called.  Once ``fn`` has been handed to the Qt
+    application's thread, cancellation will wait for it to complete.
+
+    Args:
+        fn: The function to call.
+        args: Positional arguments to pass to ``fn``.
+
+    Returns:
+        The object returned by ``fn``.
+
+    Raises:
+        Exception: Whatever ``fn`` raises.
+    """
+    import qtrio.qt
+
+    await trio.lowlevel.checkpoint_if_cancelled()
+
+    runner: typing.Optional[Runner] = _current_runner.get(None)
+
+    if runner is None or runner._gui_reenter is None:
+        result = fn(*args)
+        await trio.lowlevel.cancel_shielded_checkpoint()
+        return result
+
+    token = trio.lowlevel.current_trio_token()
+    done = trio.Event()
+    captured: outcome.Outcome
+
+    def run_in_gui_thread() -> None:
+        nonlocal captured
+        captured = outcome.capture(fn, *args)
+        token.run_sync_soon(done.set)
+
+    event = qtrio.qt.ReenterEvent(fn=run_in_gui_thread)
+    runner.application.postEvent(runner._gui_reenter, event)
+
+    with trio.CancelScope(shield=True):
+        await done.wait()
+
+    return typing.cast(T, captured.unwrap())
+
+
+_default_frame_rate = 60
+"""The frame rate used when no screen refresh rate is available."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Frame:
+    """A tick of the shared frame timer.  See :func:`qtrio.next_frame`."""
+
+    number: int
+    """The count of frames since the timer was created, starting at one."""
+    time: float
+    """The :func:`trio.current_time` when the frame started."""
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _PendingFrame:
+    event: trio.Event = attr.ib(factory=trio.Event)
+    frame: typing.Optional[Frame] = None
+    waiters: int = 0
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _FrameTimer:
+    """A Qt timer shared by all tasks waiting for the next frame.  It only runs while
+    tasks are waiting so an idle application is not woken.
+    """
+
+    interval: float
+    _timer: typing.Optional["QtCore.QTimer"] = None
+    _pending: _PendingFrame = attr.ib(factory=_PendingFrame)
+    _number: int = 0
+
+    async def wait(self) -> Frame:
+        from qts import QtCore
+
+        if self._timer is None:
+            self._timer = QtCore.QTimer()
+            self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+            self._timer.setInterval(max(1, round(self.interval * 1000)))
+            self._timer.timeout.connect(self._tick)
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+        pending = self._pending
+        pending.waiters += 1
+        try:
+            await pending.event.wait()
+        finally:
+            pending.waiters -= 1
+
+        if pending.frame is None:  # pragma: no cover
+            raise qtrio.InternalError("Frame event set without a frame.")
+
+        return pending.frame
+
+    def _tick(self) -> None:
+        pending = self._pending
+
+        if pending.waiters == 0:
+            if self._timer is not None:
+                self._timer.stop()
+
+            return
+
+        self._number += 1
+        pending.frame = Frame(number=self._number, time=trio.current_time())
+        self._pending = _PendingFrame()
+        pending.event.set()
+
+
+_frame_timer: trio.lowlevel.RunVar = trio.lowlevel.RunVar("qtrio_frame_timer")
+"""The :class:`_FrameTimer` shared within the present Trio run."""
+
+
+def _get_frame_timer() -> _FrameTimer:
+    frame_timer: typing.Optional[_FrameTimer] = _frame_timer.get(None)
+
+    if frame_timer is not None:
+        return frame_timer
+
+    runner: typing.Optional[Runner] = _current_runner.get(None)
+    frame_rate = None if runner is None else runner.frame_rate
+
+    if frame_rate is None:
+        frame_rate = _default_frame_rate
+
+        if runner is not None and _is_gui_application(runner.application):
+            from qts import QtGui
+
+            screen = QtGui.QGuiApplication.primaryScreen()
+
+            if screen is not None and screen.refreshRate() > 0:
+                frame_rate = screen.refreshRate()
+
+    frame_timer = _FrameTimer(interval=1 / frame_rate)
+    _frame_timer.set(frame_timer)
+
+    return frame_timer
+
+
+async def next_frame() -> Frame:
+    """Wait for the next frame.  All tasks waiting for a frame are woken together by a
+    single timer shared within the Trio run so many widgets can be updated with one
+    wake-up and repaint per frame.  The rate is set by
+    :attr:`qtrio.Runner.frame_rate`.
+
+    Returns:
+        The frame that was waited for.
+    """
+    return await _get_frame_timer().wait()
+
+
+class _Frames:
+    def __aiter__(self) -> "_Frames":
+        return self
+
+    async def __anext__(self) -> Frame:
+        return await next_frame()
+
+
+def frames() -> typing.AsyncIterator[Frame]:
+    """Iterate over frames as from :func:`qtrio.next_frame`.  Frames which pass while
+    the body of the loop is running are skipped rather than queued.  Unlike an async
+    generator, the iterator holds no state so breaking out of the loop needs no
+    cleanup.
+
+    .. code-block:: python
+
+        async for frame in qtrio.frames():
+            label.setText(f"{model.value} at {frame.time:.2f}")
+
+    Returns:
+        An async iterator of frames.
+    """
+    return _Frames()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class Session:
+    """A single Trio run started by :meth:`qtrio.SessionManager.start`.  Each session
+    is hosted in its own thread with its own cancel scope and reenter statistics.
+    """
+
+    name: str
+    """The key routing to this session in :attr:`qtrio.SessionManager.sessions`."""
+    runner: Runner
+    """The runner hosting the session's Trio run."""
+
+    @property
+    def done(self) -> bool:
+        """Whether the session's Trio run has finished."""
+        return self.runner._done
+
+    @property
+    def outcomes(self) -> Outcomes:
+        """The outcome of the session's Trio run, once :attr:`done`."""
+        return self.runner.outcomes
+
+    @property
+    def stats(self) -> typing.Optional[ReenterStatistics]:
+        """The reenter statistics recorded for this session alone."""
+        return self.runner.stats
+
+    def cancel(self) -> None:
+        """Cancel the session's Trio run.  The other sessions are unaffected.  This may
+        be called from any thread.
+        """
+        self.runner._request_cancel()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class SessionManager:
+    """Host several concurrent and independent Trio runs on one Qt application.  Trio
+    only allows one run per thread so each session gets its own thread as with
+    :attr:`qtrio.Runner.trio_thread`.  All sessions share the one registered reenter
+    event type and a single reenter object in the application's thread.  Sessions are
+    routed by name through :attr:`sessions`.
+
+    .. code-block:: python
+
+        manager = qtrio.SessionManager()
+        manager.start("network", network_main)
+        manager.start("storage", storage_main)
+        outcomes = manager.run()
+    """
+
+    application_type: ApplicationType = attr.ib(
+        default=ApplicationType.WIDGETS, kw_only=True
+    )
+    """See :attr:`qtrio.Runner.application_type`."""
+    application: "QtCore.QCoreApplication" = attr.ib(
+        default=attr.Factory(_build_application_for, takes_self=True)
+    )
+    """The Qt application object to run as the host.  See
+    :attr:`qtrio.Runner.application`.
+    """
+    quit_application: bool = True
+    """When true, the application will be quit once all started sessions are done."""
+    collect_stats: bool = True
+    """When true, each session gets its own :class:`qtrio.ReenterStatistics` unless
+    one is passed to :meth:`start`.
+    """
+
+    sessions: typing.Dict[str, Session] = attr.ib(factory=dict, init=False)
+    """The routing table of sessions by name.  Finished sessions remain until
+    :meth:`run` returns so that their outcomes can be collected.
+    """
+    _reenter: "qtrio.qt.Reenter" = attr.ib(factory=create_reenter, init=False)
+    """The reenter object living in the application's thread shared by all sessions."""
+    _executing: bool = attr.ib(default=False, init=False)
+    """Whether :meth:`run` is presently executing the application."""
+
+    def start(
+        self,
+        name: str,
+        async_fn: typing.Callable[..., typing.Awaitable[object]],
+        *args: object,
+        stats: typing.Optional[ReenterStatistics] = None,
+        clock: typing.Optional[trio.abc.Clock] = None,
+        instruments: typing.Sequence[trio.abc.Instrument] = (),
+    ) -> Session:
+        """Start a new session running ``async_fn``.  Call this from the application's
+        thread, either before or during :meth:`run`.
+
+        Args:
+            name: The unique name to route the session by.
+            async_fn: The async function to be run by the session.
+            args: Positional arguments to pass to ``async_fn``.
+            stats: See :attr:`qtrio.Runner.stats`.
+            clock: See :attr:`qtrio.Runner.clock`.
+            instruments: See :attr:`qtrio.Runner.instruments`.
+
+        Returns:
+            The started session.
+
+        Raises:
+            qtrio.SessionNameInUseError: if a session with ``name`` already exists.
+        """
+        if name in self.sessions:
+            raise qtrio.SessionNameInUseError(name=name)
+
+        if stats is None and self.collect_stats:
+            stats = ReenterStatistics()
+
+        runner = Runner(
+            application=self.application,
+            quit_application=False,
+            clock=clock,
+            instruments=instruments,
+            done_callback=functools.partial(self._session_done, name),
+            stats=stats,
+            trio_thread=True,
+        )
+        runner._gui_reenter = self._reenter
+
+        session = Session(name=name, runner=runner)
+        self.sessions[name] = session
+
+        runner.run(async_fn, *args, execute_application=False)
+
+        return session
+
+    def cancel(self, name: str) -> None:
+        """Cancel the session routed by ``name``.
+
+        Args:
+            name: The name of the session to cancel.
+
+        Raises:
+            KeyError: if there is no session named ``name``.
+        """
+        self.sessions[name].cancel()
+
+    def run(self) -> typing.Dict[str, Outcomes]:
+        """Execute the Qt application until all sessions are done.  Any sessions still
+        running when the application quits are cancelled and waited for.
+
+        Returns:
+            The outcomes of each session by name.
+        """
+        if self.quit_application:
+            self.application.aboutToQuit.connect(_early_quit_warning)
+
+        self._executing = True
+        try:
+            return_code = qts.util.exec(self.application)
+        finally:
+            self._executing = False
+
+        for session in self.sessions.values():
+            if session.runner._thread is not None:
+                session.runner._join_trio_thread()
+
+        return {
+            name: attr.evolve(
+                session.outcomes,
+                qt=outcome_from_application_return_code(return_code),
+            )
+            for name, session in self.sessions.items()
+        }
+
+    def _session_done(self, name: str, outcomes: Outcomes) -> None:
+        if not self.quit_application or not self._executing:
+            return
+
+        if all(
+            session.done or session.name == name for session in self.sessions.values()
+        ):
+            self.application.aboutToQuit.disconnect(_early_quit_warning)
+            self.application.quit()
@@ -8,6 +8,8 @@ import typing
 if typing.TYPE_CHECKING or "sphinx_autodoc_typehints" in sys.modules:
     from qts import QtCore
 
+    import qtrio
+
 
 class QTrioException(Exception):
     """Base exception for all QTrio exceptions."""
@@ -91,6 +93,35 @@ class DialogNotActiveError(QTrioException):
     """
 
 
+class SessionNameInUseError(QTrioException):
+    """Raised when starting a session with the name of an existing session."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"A session named {name!r} already exists.")
+
+
+class WorkerProcessDiedError(QTrioException):
+    """Raised when a worker process exits while running a function, such as when it
+    crashes or is killed from outside.
+    """
+
+    def __init__(self, exit_code: typing.Optional[int]) -> None:
+        super().__init__(f"The worker process exited with code {exit_code}.")
+        self.exit_code = exit_code
+
+
+class EmissionsOverflowError(QTrioException):
+    """Raised from receiving on an emissions channel using :class:`qtrio.RaiseOverflow`
+    when an emission was dropped because the buffer was full.
+    """
+
+    def __init__(
+        self, emission: typing.Union["qtrio.Emission", "qtrio.CompactEmission"]
+    ) -> None:
+        super().__init__("An emission was dropped because the buffer was full.")
+        self.emission = emission
+
+
 class QTrioWarning(UserWarning):
     """Base warning for all QTrio warnings."""
 
@@ -0,0 +1,21 @@
+"""A pytest plugin providing QTrio fixtures.  It is registered via the ``pytest11``
+entry point so it is loaded by every pytest session where QTrio is installed.  QTrio
+and Trio are only imported once a fixture is used so the plugin costs nothing for
+projects that do not use them.
+"""
+import typing
+
+import pytest
+
+if typing.TYPE_CHECKING:
+    import qtrio.testing
+
+
+@pytest.fixture(name="qtrio_autojump_clock")
+def autojump_clock_fixture() -> "qtrio.testing.AutojumpClock":
+    """A :class:`qtrio.testing.AutojumpClock` which pytest-trio will pass to the
+    ``trio_run`` runner, such as :func:`qtrio.run`, for the test.
+    """
+    import qtrio.testing
+
+    return qtrio.testing.AutojumpClock()
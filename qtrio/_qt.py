@@ -95,7 +95,9 @@ Signal._attribute_name = qtrio._python.identifier_path(Signal)
 
 @contextlib.contextmanager
 def connection(
-    signal: "QtCore.SignalInstance", slot: typing.Callable[..., object]
+    signal: "QtCore.SignalInstance",
+    slot: typing.Callable[..., object],
+    connection_type: typing.Optional["QtCore.Qt.ConnectionType"] = None,
 ) -> typing.Generator[
     (
         "QtCore.QMetaObject.Connection"
@@ -110,12 +112,16 @@ def connection(
     Args:
         signal: The signal to connect.
         slot: The callable to connect the signal to.
+        connection_type: The type of connection to make.  :obj:`None` for the default.
     """
 
     # if you get segfault or sigsegv here, especially from pyside2<5.15.2, make
     # sure the slot isn't on a non-hashable (frozen will make it hashable) attrs
     # class.  https://bugreports.qt.io/browse/PYSIDE-1422
-    this_connection = signal.connect(slot)
+    if connection_type is None:
+        this_connection = signal.connect(slot)
+    else:
+        this_connection = signal.connect(slot, type=connection_type)
 
     import qts
 
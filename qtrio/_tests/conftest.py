@@ -1,3 +1,4 @@
+import qtrio._pytest
 import qtrio._tests.helpers
 
 pytest_plugins = "pytester"
@@ -5,3 +6,4 @@ pytest_plugins = "pytester"
 qtrio_preshow_workaround_fixture = qtrio._tests.helpers.qtrio_preshow_workaround_fixture
 qtrio_testdir_fixture = qtrio._tests.helpers.qtrio_testdir_fixture
 qtrio_optional_hold_event_fixture = qtrio._tests.helpers.optional_hold_event_fixture
+qtrio_autojump_clock_fixture = qtrio._pytest.autojump_clock_fixture
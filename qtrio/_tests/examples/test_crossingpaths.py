@@ -6,12 +6,13 @@ import trio
 
 import qtrio
 import qtrio.examples.crossingpaths
+import qtrio.testing
 
 
 async def test_main(
     qtbot: pytestqt.qtbot.QtBot,
     optional_hold_event: typing.Optional[trio.Event],
-    autojump_clock: trio.testing.MockClock,
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
 ) -> None:
     message = "test world"
 
@@ -19,8 +20,6 @@ async def test_main(
         start = functools.partial(
             qtrio.examples.crossingpaths.start_widget,
             message=message,
-            change_delay=0.01,
-            close_delay=0.01,
             hold_event=optional_hold_event,
         )
         widget: qtrio.examples.crossingpaths.Widget = await nursery.start(start)
@@ -1,8 +1,11 @@
+import functools
 import os
 import sys
+import threading
 import time
 import typing
 
+import attr
 import outcome
 import pytest
 import qts
@@ -10,6 +13,7 @@ from qts import QtCore
 from qts import QtWidgets
 import qtrio
 import qtrio._core
+import qtrio.qt
 import trio
 import trio.testing
 
@@ -573,6 +577,82 @@ async def test_wait_signal_context_waits():
     assert end - start > 0.090
 
 
+async def test_wait_any_reports_first_emission():
+    """wait_any() reports which signal was emitted first along with its arguments."""
+
+    class MyQObject(QtCore.QObject):
+        first = QtCore.Signal(int)
+        second = QtCore.Signal(str)
+
+    instance = MyQObject()
+
+    async with qtrio.wait_any([instance.first, instance.second]) as first:
+        instance.second.emit("a")
+        instance.first.emit(1)
+        instance.second.emit("b")
+
+    assert (first.index, first.signal == instance.second, first.args) == (
+        1,
+        True,
+        ("a",),
+    )
+
+
+async def test_wait_any_skips_emissions_rejected_by_predicate():
+    """Emissions are ignored unless the predicate accepts them."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    def is_even(index: int, args: typing.Tuple[object, ...]) -> bool:
+        return typing.cast(int, args[0]) % 2 == 0
+
+    async with qtrio.wait_any([instance.signal], predicate=is_even) as first:
+        instance.signal.emit(1)
+        instance.signal.emit(4)
+        instance.signal.emit(6)
+
+    assert (first.index, first.args) == (0, (4,))
+
+
+async def test_wait_any_wait_inside_the_context():
+    """The emission can be waited for inside the context, such as with a timeout."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    instance = MyQObject()
+
+    async with qtrio.wait_any([instance.signal]) as first:
+        with trio.move_on_after(0.01):
+            await first.wait()
+
+        done_before = first.done
+        instance.signal.emit()
+        await first.wait()
+
+    assert (done_before, first.done) == (False, True)
+
+
+async def test_wait_any_disconnects_on_exit():
+    """The signals are disconnected when the context is exited."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    with trio.move_on_after(0.01):
+        async with qtrio.wait_any([instance.signal]) as first:
+            pass
+
+    instance.signal.emit(1)
+
+    assert first.done is False
+
+
 def test_outcomes_unwrap_none():
     """Unwrapping an empty Outcomes raises NoOutcomesError."""
     this_outcome = qtrio.Outcomes()
@@ -1190,6 +1270,128 @@ async def test_emissions_nursery_wraps(is_async):
         result.unwrap()
 
 
+async def run_emissions_nursery_burst(
+    concurrency: qtrio.ConcurrencyPolicy, count: int = 4
+) -> typing.Tuple[typing.List[typing.Tuple[str, int]], int]:
+    """Emit ``count`` values at once to a slot connected with the ``concurrency``
+    policy.  Return the slot's start and end events along with the most tasks running
+    at once.
+    """
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    signal_host = SignalHost()
+    events: typing.List[typing.Tuple[str, int]] = []
+    running = 0
+    most_running = 0
+
+    async def slot(value: int) -> None:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+
+        try:
+            events.append(("start", value))
+            await trio.sleep(0.01)
+            events.append(("end", value))
+        finally:
+            running -= 1
+
+    async with qtrio.open_emissions_nursery() as emissions_nursery:
+        emissions_nursery.connect(
+            signal=signal_host.signal, slot=slot, concurrency=concurrency
+        )
+
+        for value in range(count):
+            signal_host.signal.emit(value)
+
+    return events, most_running
+
+
+async def test_emissions_nursery_queue_while_busy_serializes():
+    """Queued emissions run one at a time in order."""
+    events, most_running = await run_emissions_nursery_burst(
+        concurrency=qtrio.QueueWhileBusy()
+    )
+
+    assert (events, most_running) == (
+        [(kind, value) for value in range(4) for kind in ["start", "end"]],
+        1,
+    )
+
+
+async def test_emissions_nursery_queue_while_busy_limits_tasks():
+    """No more than the maximum number of tasks run at once and all of them run."""
+    events, most_running = await run_emissions_nursery_burst(
+        concurrency=qtrio.QueueWhileBusy(max_tasks=2), count=6
+    )
+
+    assert (sorted(value for kind, value in events if kind == "end"), most_running) == (
+        list(range(6)),
+        2,
+    )
+
+
+async def test_emissions_nursery_drop_while_busy():
+    """Emissions arriving while busy are dropped."""
+    events, most_running = await run_emissions_nursery_burst(
+        concurrency=qtrio.DropWhileBusy()
+    )
+
+    assert (events, most_running) == ([("start", 0), ("end", 0)], 1)
+
+
+async def test_emissions_nursery_cancel_previous():
+    """Each emission cancels the running task and only the latest pending start is
+    kept.
+    """
+    events, most_running = await run_emissions_nursery_burst(
+        concurrency=qtrio.CancelPrevious()
+    )
+
+    assert (events, most_running) == ([("start", 0), ("start", 3), ("end", 3)], 1)
+
+
+async def test_emissions_nursery_cancel_previous_wrapped():
+    """The wrapper runs inside the cancelled scope of a wrapped slot."""
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    signal_host = SignalHost()
+    wrapped: typing.List[typing.Tuple[object, ...]] = []
+    ended: typing.List[int] = []
+
+    async def wrapper(slot, *args):
+        wrapped.append(args)
+        await slot(*args)
+
+    async def slot(value: int) -> None:
+        await trio.sleep(0.01)
+        ended.append(value)
+
+    async with qtrio.open_emissions_nursery(wrapper=wrapper) as emissions_nursery:
+        emissions_nursery.connect(
+            signal=signal_host.signal, slot=slot, concurrency=qtrio.CancelPrevious()
+        )
+        signal_host.signal.emit(0)
+        await trio.sleep(0)
+        signal_host.signal.emit(1)
+
+    assert (wrapped, ended) == ([(0,), (1,)], [1])
+
+
+@pytest.mark.parametrize(
+    argnames="policy",
+    argvalues=[qtrio.QueueWhileBusy, qtrio.DropWhileBusy, qtrio.CancelPrevious],
+)
+def test_concurrency_policies_reject_zero(policy):
+    """At least one task must be allowed."""
+    with pytest.raises(ValueError):
+        policy(max_tasks=0)
+
+
 def test_run_without_executing_application(testdir):
     """Running without executing the application...  doesn't."""
 
@@ -1319,3 +1521,1606 @@ def test_warning_on_early_application_quit(testdir):
 
     result = testdir.runpython(script=test_path)
     result.stderr.re_match_lines(lines2=[r".* ApplicationQuitWarning: .*"])
+
+
+def test_run_with_batched_reenter_returns_value(testdir):
+    """:func:`qtrio.run()` with batched reenter events returns the result of the passed
+    async function.
+    """
+
+    test_file = r"""
+    import qtrio
+    import trio
+
+
+    def test():
+        async def main():
+            async with trio.open_nursery() as nursery:
+                for _ in range(10):
+                    nursery.start_soon(trio.sleep, 0.01)
+
+            return 29
+
+        result = qtrio.run(main, batch_reenter=True)
+
+        assert result == 29
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+class CountingReenter(qtrio.qt.Reenter):
+    """A reenter object that counts the events it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        self.count += 1
+        return super().event(event)
+
+
+async def test_batched_reenter_runs_callbacks_in_order():
+    """Callbacks queued with batched reenter events are all run in order."""
+
+    reenter = CountingReenter()
+    runner = qtrio.Runner(reenter=reenter, batch_reenter=True)
+    results: typing.List[int] = []
+    event = trio.Event()
+
+    for i in range(5):
+        runner.run_sync_soon_threadsafe(functools.partial(results.append, i))
+
+    runner.run_sync_soon_threadsafe(event.set)
+
+    await event.wait()
+
+    assert (results, reenter.count) == ([0, 1, 2, 3, 4], 1)
+
+
+def test_batched_reenter_runs_callbacks_after_one_raises(testdir):
+    """Callbacks queued behind one which raises are still run by a later event."""
+    test_file = r"""
+    import functools
+    import sys
+    import traceback
+
+    from qts import QtCore
+
+    import qtrio
+
+
+    def excepthook(type, value, tb):
+        traceback.print_exception(type, value, tb)
+
+
+    sys.excepthook = excepthook
+
+    qapp = QtCore.QCoreApplication([])
+    qtrio.register_event_type()
+    runner = qtrio.Runner(application=qapp, batch_reenter=True)
+    results = []
+
+
+    def fail():
+        raise Exception("failing callback")
+
+
+    runner.run_sync_soon_threadsafe(functools.partial(results.append, 1))
+    runner.run_sync_soon_threadsafe(fail)
+    runner.run_sync_soon_threadsafe(functools.partial(results.append, 2))
+
+    for _ in range(3):
+        qapp.processEvents()
+
+    print(results)
+    """
+    test_path = testdir.makepyfile(test_file)
+
+    result = testdir.runpython(test_path)
+
+    result.stderr.re_match_lines(lines2=[r"^Exception: failing callback$"])
+    result.stdout.re_match_lines(lines2=[r"^\[1, 2\]$"])
+
+
+async def test_reenter_budget_hands_remaining_callbacks_back_to_qt():
+    """A spent reenter budget leaves the remaining callbacks for later events."""
+
+    reenter = CountingReenter()
+    runner = qtrio.Runner(reenter=reenter, reenter_budget=0)
+    results: typing.List[int] = []
+    event = trio.Event()
+
+    for i in range(5):
+        runner.run_sync_soon_threadsafe(functools.partial(results.append, i))
+
+    runner.run_sync_soon_threadsafe(event.set)
+
+    await event.wait()
+
+    assert (results, reenter.count, runner.reenter_budget_hits) == (
+        [0, 1, 2, 3, 4],
+        6,
+        5,
+    )
+
+
+async def test_reenter_budget_keeps_callbacks_queued_while_draining_in_order():
+    """Callbacks queued while draining with a spent budget run after the requeued
+    callbacks.
+    """
+
+    runner = qtrio.Runner(reenter_budget=0)
+    results: typing.List[str] = []
+    event = trio.Event()
+
+    def queue_another() -> None:
+        results.append("b")
+        runner.run_sync_soon_threadsafe(functools.partial(results.append, "d"))
+        runner.run_sync_soon_threadsafe(event.set)
+
+    runner.run_sync_soon_threadsafe(functools.partial(results.append, "a"))
+    runner.run_sync_soon_threadsafe(queue_another)
+    runner.run_sync_soon_threadsafe(functools.partial(results.append, "c"))
+
+    await event.wait()
+
+    assert results == ["a", "b", "c", "d"]
+
+
+def test_fixed_reenter_priority_accepts_qt_enum():
+    """:class:`qtrio.FixedReenterPriority` converts Qt's event priority enumerator."""
+    policy = qtrio.FixedReenterPriority(QtCore.Qt.EventPriority.LowEventPriority)
+
+    assert [policy.priority(depth=depth) for depth in [1, 1000]] == [-1, -1]
+
+
+def test_depth_reenter_priority_switches_at_threshold():
+    """:class:`qtrio.DepthReenterPriority` switches priority at the threshold."""
+    policy = qtrio.DepthReenterPriority(threshold=3)
+
+    assert [policy.priority(depth=depth) for depth in [1, 2, 3, 4]] == [0, 0, 1, 1]
+
+
+@pytest.mark.parametrize("batch_reenter", [False, True], ids=["unbatched", "batched"])
+async def test_reenter_priority_orders_dispatch(batch_reenter):
+    """Reenter events posted with high priority are run before those posted earlier
+    with low priority.
+    """
+
+    low = qtrio.Runner(
+        reenter_priority=qtrio.FixedReenterPriority(-1),
+        batch_reenter=batch_reenter,
+    )
+    high = qtrio.Runner(
+        reenter_priority=qtrio.FixedReenterPriority(1),
+        batch_reenter=batch_reenter,
+    )
+    results: typing.List[str] = []
+    event = trio.Event()
+
+    low.run_sync_soon_threadsafe(functools.partial(results.append, "low"))
+    low.run_sync_soon_threadsafe(event.set)
+    high.run_sync_soon_threadsafe(functools.partial(results.append, "high"))
+
+    await event.wait()
+
+    assert results == ["high", "low"]
+
+
+async def test_reenter_priority_receives_outstanding_depth():
+    """The priority policy is passed the number of outstanding reenter events."""
+
+    @attr.s(auto_attribs=True)
+    class RecordingPriority:
+        depths: typing.List[int] = attr.ib(factory=list)
+
+        def priority(self, depth: int) -> int:
+            self.depths.append(depth)
+            return 0
+
+    policy = RecordingPriority()
+    runner = qtrio.Runner(reenter_priority=policy)
+    event = trio.Event()
+
+    for _ in range(3):
+        runner.run_sync_soon_threadsafe(lambda: None)
+
+    runner.run_sync_soon_threadsafe(event.set)
+    await event.wait()
+    runner.run_sync_soon_threadsafe(lambda: None)
+
+    assert policy.depths == [1, 2, 3, 4, 1]
+
+
+def test_histogram_buckets_by_powers_of_two_microseconds():
+    """:class:`qtrio.Histogram` counts durations in power of two microsecond buckets."""
+    histogram = qtrio.Histogram()
+
+    for duration in [0.0000005, 0.000001, 0.000003, 0.000003, 3600]:
+        histogram.record(duration)
+
+    assert (histogram.buckets[:3], histogram.buckets[-1], histogram.count) == (
+        [1, 1, 2],
+        1,
+        5,
+    )
+
+
+def test_histogram_quantile_is_bucket_upper_bound():
+    """:meth:`qtrio.Histogram.quantile` reports the upper bound of the bucket holding
+    the quantile, limited by the maximum.
+    """
+    histogram = qtrio.Histogram()
+
+    for _ in range(99):
+        histogram.record(0.000010)
+
+    histogram.record(0.001)
+
+    assert [histogram.quantile(fraction) for fraction in [0.5, 0.99, 1]] == [
+        0.000016,
+        0.000016,
+        0.001,
+    ]
+
+
+def test_histogram_empty_reports_zero():
+    """An empty :class:`qtrio.Histogram` reports zeros."""
+    histogram = qtrio.Histogram()
+
+    assert (histogram.mean(), histogram.quantile(0.99)) == (0, 0)
+
+
+@pytest.mark.parametrize("batch_reenter", [False, True], ids=["unbatched", "batched"])
+async def test_runner_stats_records_reenter_events(batch_reenter):
+    """Reenter events posted by a runner with statistics are counted and timed."""
+    stats = qtrio.ReenterStatistics()
+    runner = qtrio.Runner(stats=stats, batch_reenter=batch_reenter)
+    event = trio.Event()
+
+    def slow():
+        time.sleep(0.01)
+
+    runner.run_sync_soon_threadsafe(slow)
+    await trio.testing.wait_all_tasks_blocked(cushion=0.01)
+    runner.run_sync_soon_threadsafe(event.set)
+    await event.wait()
+
+    assert (
+        stats.events_posted,
+        stats.events_dispatched,
+        stats.latency.count,
+        stats.execution.count,
+        stats.execution.maximum >= 0.01,
+    ) == (2, 2, 2, 2, True)
+
+
+def test_reenter_event_records_posted_timestamp(qapp):
+    """:class:`qtrio.qt.ReenterEvent` records when it was created."""
+    if qtrio.registered_event_type() is None:  # pragma: no cover
+        qtrio.register_event_type()
+
+    before = time.perf_counter()
+    event = qtrio.qt.ReenterEvent(fn=lambda: None)
+    after = time.perf_counter()
+
+    assert before <= event.posted <= after
+
+
+@pytest.fixture(
+    name="wakeup_cls",
+    params=[
+        qtrio.PostEventWakeup,
+        qtrio.SocketNotifierWakeup,
+        qtrio.SignalWakeup,
+        qtrio.TimerWakeup,
+    ],
+    ids=["post event", "socket notifier", "signal", "timer"],
+)
+def wakeup_cls_fixture(request):
+    return request.param
+
+
+@pytest.mark.parametrize("batch_reenter", [False, True], ids=["unbatched", "batched"])
+async def test_wakeup_runs_callbacks_in_order(wakeup_cls, batch_reenter):
+    """Each wakeup strategy runs callbacks in the order they were posted."""
+    runner = qtrio.Runner(wakeup=wakeup_cls(), batch_reenter=batch_reenter)
+    results: typing.List[int] = []
+    event = trio.Event()
+
+    for i in range(5):
+        runner.run_sync_soon_threadsafe(functools.partial(results.append, i))
+
+    runner.run_sync_soon_threadsafe(event.set)
+    await event.wait()
+    runner.wakeup.close()
+
+    assert results == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "wakeup_cls",
+    [qtrio.SocketNotifierWakeup, qtrio.SignalWakeup, qtrio.TimerWakeup],
+    ids=["socket notifier", "signal", "timer"],
+)
+def test_reenter_priority_rejected_without_post_event_wakeup(wakeup_cls):
+    """A reenter priority policy is rejected with a strategy which can not apply it."""
+    with pytest.raises(ValueError, match="reenter_priority"):
+        qtrio.Runner(
+            wakeup=wakeup_cls(), reenter_priority=qtrio.FixedReenterPriority(1)
+        )
+
+
+async def test_wakeup_does_not_run_callbacks_synchronously(wakeup_cls):
+    """Wakeup strategies run the callbacks later rather than while posting."""
+    runner = qtrio.Runner(wakeup=wakeup_cls())
+    results: typing.List[str] = []
+    event = trio.Event()
+
+    runner.run_sync_soon_threadsafe(functools.partial(results.append, "callback"))
+    results.append("posted")
+    runner.run_sync_soon_threadsafe(event.set)
+    await event.wait()
+    runner.wakeup.close()
+
+    assert results == ["posted", "callback"]
+
+
+async def test_wakeup_runs_callbacks_from_other_threads_in_host_thread(wakeup_cls):
+    """Each wakeup strategy runs callbacks posted from another thread in the host
+    thread.
+    """
+    runner = qtrio.Runner(wakeup=wakeup_cls())
+    threads: typing.List[int] = []
+    event = trio.Event()
+
+    def post():
+        for _ in range(3):
+            runner.run_sync_soon_threadsafe(
+                lambda: threads.append(threading.get_ident())
+            )
+
+        runner.run_sync_soon_threadsafe(event.set)
+
+    await trio.to_thread.run_sync(post)
+    await event.wait()
+    runner.wakeup.close()
+
+    assert threads == [threading.get_ident()] * 3
+
+
+def test_run_with_wakeup_returns_value(testdir, wakeup_cls):
+    """:func:`qtrio.run()` works with each wakeup strategy."""
+
+    test_file = rf"""
+    import qtrio
+    import trio
+
+
+    def test():
+        async def main():
+            async with trio.open_nursery() as nursery:
+                for _ in range(10):
+                    nursery.start_soon(trio.sleep, 0.01)
+
+            await trio.to_thread.run_sync(lambda: None)
+
+            return 29
+
+        result = qtrio.run(main, wakeup=qtrio.{wakeup_cls.__name__}())
+
+        assert result == 29
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+def test_trio_thread_runs_trio_in_another_thread(testdir):
+    """With :attr:`qtrio.Runner.trio_thread` Trio runs in another thread while
+    :func:`qtrio.run_sync_in_gui_thread` and the done callback run in the main thread.
+    """
+
+    test_file = r"""
+    import threading
+
+    import qtrio
+    import trio
+
+
+    def test():
+        main_thread = threading.get_ident()
+        done_threads = []
+
+        async def main():
+            await trio.sleep(0.01)
+            await trio.to_thread.run_sync(lambda: None)
+
+            gui_thread = await qtrio.run_sync_in_gui_thread(threading.get_ident)
+
+            return threading.get_ident(), gui_thread
+
+        def done_callback(outcomes):
+            done_threads.append(threading.get_ident())
+
+        runner = qtrio.Runner(trio_thread=True, done_callback=done_callback)
+        outcomes = runner.run(main)
+
+        trio_thread, gui_thread = outcomes.unwrap()
+
+        assert (trio_thread != main_thread, gui_thread, done_threads) == (
+            True,
+            main_thread,
+            [main_thread],
+        )
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+def test_trio_thread_cancelled_on_early_application_quit(testdir):
+    """A Trio thread is cancelled and waited for if the application quits early."""
+
+    test_file = r"""
+    import outcome
+    import pytest
+    import qtrio
+    from qts import QtWidgets
+    import trio
+
+
+    def test():
+        async def main():
+            await qtrio.run_sync_in_gui_thread(QtWidgets.QApplication.quit)
+            await trio.sleep_forever()
+
+        runner = qtrio.Runner(trio_thread=True)
+
+        with pytest.warns(qtrio.ApplicationQuitWarning):
+            outcomes = runner.run(main)
+
+        assert outcomes == qtrio.Outcomes(qt=outcome.Value(0), trio=outcome.Value(None))
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+def test_trio_thread_runs_gui_calls_pending_at_application_quit(testdir):
+    """A GUI call posted by the Trio thread but not yet run when the application quits
+    is still run so the shielded wait for it completes.
+    """
+
+    test_file = r"""
+    import threading
+
+    import outcome
+    import pytest
+    import qtrio
+    from qts import QtWidgets
+    import trio
+    import trio.testing
+
+
+    def test():
+        posted = threading.Event()
+        ran = []
+
+        def quit_then_block():
+            QtWidgets.QApplication.quit()
+            posted.wait()
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(qtrio.run_sync_in_gui_thread, quit_then_block)
+                await trio.testing.wait_all_tasks_blocked()
+                nursery.start_soon(qtrio.run_sync_in_gui_thread, ran.append, True)
+                await trio.testing.wait_all_tasks_blocked()
+                posted.set()
+                await trio.sleep_forever()
+
+        runner = qtrio.Runner(trio_thread=True)
+
+        with pytest.warns(qtrio.ApplicationQuitWarning):
+            outcomes = runner.run(main)
+
+        assert (outcomes, ran) == (
+            qtrio.Outcomes(qt=outcome.Value(0), trio=outcome.Value(None)),
+            [True],
+        )
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+async def test_run_sync_in_gui_thread_without_trio_thread_calls_directly():
+    """:func:`qtrio.run_sync_in_gui_thread` calls the function in the present thread
+    when Trio is already hosted there.
+    """
+    result = await qtrio.run_sync_in_gui_thread(lambda x: (threading.get_ident(), x), 3)
+
+    assert result == (threading.get_ident(), 3)
+
+
+async def test_run_sync_in_gui_thread_raises():
+    """:func:`qtrio.run_sync_in_gui_thread` passes on exceptions."""
+
+    class LocalUniqueException(Exception):
+        pass
+
+    def fn():
+        raise LocalUniqueException()
+
+    with pytest.raises(LocalUniqueException):
+        await qtrio.run_sync_in_gui_thread(fn)
+
+
+def test_session_manager_runs_sessions_concurrently(testdir):
+    """:class:`qtrio.SessionManager` runs each session in its own thread with its own
+    statistics and returns all of the outcomes.
+    """
+
+    test_file = r"""
+    import threading
+
+    import outcome
+    import qtrio
+    import trio
+
+
+    def test():
+        both_started = threading.Barrier(2, timeout=10)
+
+        async def main(value):
+            await trio.to_thread.run_sync(both_started.wait)
+            await trio.sleep(0.01)
+
+            return value, threading.get_ident()
+
+        manager = qtrio.SessionManager()
+        first = manager.start("first", main, 1)
+        second = manager.start("second", main, 2)
+        outcomes = manager.run()
+
+        (first_value, first_thread) = outcomes["first"].unwrap()
+        (second_value, second_thread) = outcomes["second"].unwrap()
+
+        assert (
+            first_value,
+            second_value,
+            len({first_thread, second_thread, threading.get_ident()}),
+            first.done and second.done,
+            first.stats is not second.stats,
+            first.stats.events_dispatched > 0,
+            second.stats.events_dispatched > 0,
+            outcomes["first"].qt,
+        ) == (1, 2, 3, True, True, True, True, outcome.Value(0))
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+def test_session_manager_cancels_sessions_independently(testdir):
+    """Cancelling one session, even before it has started running, leaves the others
+    running.
+    """
+
+    test_file = r"""
+    import outcome
+    import qtrio
+    import trio
+
+
+    def test():
+        manager = qtrio.SessionManager()
+
+        async def forever():
+            await trio.sleep_forever()
+
+        async def canceller():
+            manager.cancel("forever")
+            await trio.sleep(0.01)
+
+            return "canceller"
+
+        early = manager.start("early", forever)
+        early.cancel()
+        manager.start("forever", forever)
+        manager.start("canceller", canceller)
+
+        outcomes = manager.run()
+
+        assert {name: outcomes.trio for name, outcomes in outcomes.items()} == {
+            "early": outcome.Value(None),
+            "forever": outcome.Value(None),
+            "canceller": outcome.Value("canceller"),
+        }
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+def test_session_manager_rejects_duplicate_names(testdir):
+    """Starting a session with the name of an existing session raises."""
+
+    test_file = r"""
+    import pytest
+    import qtrio
+    import trio
+
+
+    def test():
+        manager = qtrio.SessionManager()
+        manager.start("a", trio.sleep, 0)
+
+        with pytest.raises(qtrio.SessionNameInUseError, match="'a'"):
+            manager.start("a", trio.sleep, 0)
+
+        outcomes = manager.run()
+
+        assert list(outcomes) == ["a"]
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(
+    argnames=["application_type", "class_name", "unloaded_modules"],
+    argvalues=[
+        ["CORE", "QCoreApplication", ["QtGui", "QtWidgets"]],
+        ["GUI", "QGuiApplication", ["QtWidgets"]],
+        ["WIDGETS", "QApplication", []],
+    ],
+)
+def test_run_builds_application_type(
+    testdir, application_type, class_name, unloaded_modules
+):
+    """:func:`qtrio.run` builds the requested type of application without loading the
+    Qt modules it does not need.
+    """
+
+    test_file = rf"""
+    import sys
+
+    import qtrio
+    from qts import QtCore
+    import trio
+
+
+    def test():
+        async def main():
+            await trio.sleep(0.01)
+
+            return QtCore.QCoreApplication.instance().metaObject().className()
+
+        class_name = qtrio.run(
+            main, application_type=qtrio.ApplicationType.{application_type}
+        )
+
+        loaded = [
+            name
+            for name in {unloaded_modules!r}
+            if any(module.endswith("." + name) for module in sys.modules)
+        ]
+
+        assert (class_name, loaded) == ({class_name!r}, [])
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess("-p", "no:pytest-qt", timeout=timeout)
+    result.assert_outcomes(passed=1)
+
+
+async def test_next_frame_advances():
+    """Each frame has a greater number and time than the previous."""
+    first = await qtrio.next_frame()
+    second = await qtrio.next_frame()
+
+    assert (second.number > first.number, second.time >= first.time) == (True, True)
+
+
+async def test_next_frame_wakes_waiters_together():
+    """All tasks waiting for the next frame receive the same frame."""
+    received = []
+
+    async def wait() -> None:
+        received.append(await qtrio.next_frame())
+
+    async with trio.open_nursery() as nursery:
+        for _ in range(10):
+            nursery.start_soon(wait)
+
+    assert len({frame.number for frame in received}) == 1
+
+
+async def test_frames_iterates():
+    """:func:`qtrio.frames` yields increasing frames."""
+    numbers = []
+
+    async for frame in qtrio.frames():
+        numbers.append(frame.number)
+
+        if len(numbers) == 3:
+            break
+
+    assert numbers == sorted(set(numbers))
+
+
+async def test_frame_timer_stops_when_idle():
+    """The shared timer stops once no task is waiting for a frame."""
+    await qtrio.next_frame()
+    frame_timer = qtrio._core._get_frame_timer()
+
+    # the next tick sees no waiters and stops the timer
+    await trio.sleep(5 * frame_timer.interval)
+
+    timer = typing.cast(QtCore.QTimer, frame_timer._timer)
+
+    assert timer.isActive() is False
+
+
+def test_frame_rate_sets_timer_interval():
+    """:attr:`qtrio.Runner.frame_rate` sets the interval of the shared timer."""
+    intervals = []
+
+    async def main():
+        await qtrio.next_frame()
+        intervals.append(qtrio._core._get_frame_timer().interval)
+
+    runner = qtrio.Runner(frame_rate=20)
+    runner.run(main)
+    runner.outcomes.unwrap()
+
+    assert intervals == [pytest.approx(1 / 20)]
+
+
+async def test_emissions_channel_conflates_per_signal(emissions_channel):
+    """A conflating channel keeps only the latest emission of each signal, in the
+    order of their most recent update.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(
+        signals=[instance.signal_a, instance.signal_b], conflate=True
+    ) as emissions:
+        instance.signal_a.emit(1)
+        instance.signal_b.emit(2)
+        instance.signal_a.emit(3)
+        instance.signal_b.emit(4)
+        instance.signal_a.emit(5)
+
+        await emissions.aclose()
+
+        async with emissions.channel:
+            results = [emission async for emission in emissions.channel]
+
+    assert results == [
+        qtrio._core.Emission(signal=instance.signal_b, args=(4,)),
+        qtrio._core.Emission(signal=instance.signal_a, args=(5,)),
+    ]
+
+
+async def test_emissions_channel_conflating_wakes_receiver(emissions_channel):
+    """A receiver waiting on a conflating channel is woken by an emission."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    results = []
+
+    async with emissions_channel(signals=[instance.signal], conflate=True) as emissions:
+        async with trio.open_nursery() as nursery:
+
+            async def receive():
+                results.append(await emissions.channel.receive())
+
+            nursery.start_soon(receive)
+            await trio.testing.wait_all_tasks_blocked()
+            instance.signal.emit(7)
+
+    assert results == [qtrio._core.Emission(signal=instance.signal, args=(7,))]
+
+
+async def test_conflating_channel_closes_like_memory_channel():
+    """The conflating channels raise the same exceptions on closing as Trio's memory
+    channels.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio._core.open_emissions_channel(
+        signals=[instance.signal], conflate=True
+    ) as emissions:
+        pass
+
+    with pytest.raises(trio.EndOfChannel):
+        emissions.channel.receive_nowait()
+
+    with pytest.raises(trio.ClosedResourceError):
+        emissions.send_channel.send_nowait(None)
+
+    await emissions.channel.aclose()
+
+    with pytest.raises(trio.ClosedResourceError):
+        emissions.channel.receive_nowait()
+
+
+async def test_receive_batch_returns_buffered_emissions(emissions_channel):
+    """:meth:`qtrio.Emissions.receive_batch` returns all of the buffered emissions."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(signals=[instance.signal]) as emissions:
+        for value in range(5):
+            instance.signal.emit(value)
+
+        batch = await emissions.receive_batch()
+
+    assert [emission.args for emission in batch] == [(value,) for value in range(5)]
+
+
+async def test_receive_batch_limits_items(emissions_channel):
+    """:meth:`qtrio.Emissions.receive_batch` returns no more than ``max_items``."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(signals=[instance.signal]) as emissions:
+        for value in range(5):
+            instance.signal.emit(value)
+
+        first = await emissions.receive_batch(max_items=3)
+        second = await emissions.receive_batch(max_items=3)
+
+    assert [[emission.args for emission in batch] for batch in [first, second]] == [
+        [(0,), (1,), (2,)],
+        [(3,), (4,)],
+    ]
+
+
+async def test_receive_batch_waits_for_more(emissions_channel):
+    """:meth:`qtrio.Emissions.receive_batch` continues collecting for ``max_wait``."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(signals=[instance.signal]) as emissions:
+        async with trio.open_nursery() as nursery:
+
+            async def emit():
+                for value in range(3):
+                    instance.signal.emit(value)
+                    await trio.sleep(0.01)
+
+            nursery.start_soon(emit)
+            batch = await emissions.receive_batch(max_items=3, max_wait=10)
+
+    assert [emission.args for emission in batch] == [(0,), (1,), (2,)]
+
+
+async def test_receive_batch_rejects_zero_items(emissions_channel):
+    """:meth:`qtrio.Emissions.receive_batch` requires room for at least one item."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(signals=[instance.signal]) as emissions:
+        with pytest.raises(ValueError):
+            await emissions.receive_batch(max_items=0)
+
+
+async def test_batches_iterates_until_closed(emissions_channel):
+    """:meth:`qtrio.Emissions.batches` yields batches until the channel is closed."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(signals=[instance.signal]) as emissions:
+        for value in range(5):
+            instance.signal.emit(value)
+
+        await emissions.aclose()
+
+        batches = [
+            [emission.args for emission in batch]
+            async for batch in emissions.batches(max_items=2)
+        ]
+
+    assert batches == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+
+
+async def fill_past_buffer(
+    emissions_channel: typing.Callable[
+        ..., typing.AsyncContextManager[qtrio.Emissions]
+    ],
+    overflow: qtrio.OverflowPolicy,
+    max_buffer_size: int = 3,
+    count: int = 6,
+) -> typing.Tuple[typing.List[object], qtrio.Emissions, "QtCore.SignalInstance"]:
+    """Emit ``count`` values into a channel with room for ``max_buffer_size`` then
+    receive everything including any raised :class:`qtrio.EmissionsOverflowError`.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    results: typing.List[object] = []
+
+    async with emissions_channel(
+        signals=[instance.signal], max_buffer_size=max_buffer_size, overflow=overflow
+    ) as emissions:
+        for value in range(count):
+            instance.signal.emit(value)
+
+        await emissions.aclose()
+
+        while True:
+            try:
+                [value] = (await emissions.channel.receive()).args
+            except trio.EndOfChannel:
+                break
+            except qtrio.EmissionsOverflowError as e:
+                results.append(e)
+            else:
+                results.append(value)
+
+    return results, emissions, instance.signal
+
+
+async def test_drop_newest_overflow_counts_drops(emissions_channel):
+    """The default policy keeps the oldest emissions and counts those dropped."""
+    results, emissions, signal = await fill_past_buffer(
+        emissions_channel, overflow=qtrio.DropNewestOverflow()
+    )
+
+    assert (results, emissions.dropped(), emissions.dropped(signal)) == (
+        [0, 1, 2],
+        3,
+        3,
+    )
+
+
+async def test_drop_oldest_overflow_keeps_newest(emissions_channel):
+    """:class:`qtrio.DropOldestOverflow` keeps the most recent emissions."""
+    results, emissions, signal = await fill_past_buffer(
+        emissions_channel, overflow=qtrio.DropOldestOverflow()
+    )
+
+    assert (results, emissions.dropped(signal)) == ([3, 4, 5], 3)
+
+
+async def test_sample_overflow_keeps_every_nth(emissions_channel):
+    """:class:`qtrio.SampleOverflow` keeps every Nth overflowing emission."""
+    results, emissions, signal = await fill_past_buffer(
+        emissions_channel, overflow=qtrio.SampleOverflow(every=2), count=9
+    )
+
+    assert (results, emissions.dropped(signal)) == ([4, 6, 8], 6)
+
+
+def test_sample_overflow_rejects_zero():
+    """:class:`qtrio.SampleOverflow` requires keeping at least one of every N."""
+    with pytest.raises(ValueError):
+        qtrio.SampleOverflow(every=0)
+
+
+async def test_overflow_rejected_when_conflating(emissions_channel):
+    """An overflow policy other than the default can not be combined with conflating."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    with pytest.raises(ValueError):
+        async with emissions_channel(
+            signals=[instance.signal],
+            conflate=True,
+            overflow=qtrio.DropOldestOverflow(),
+        ):
+            pass  # pragma: no cover
+
+
+async def test_raise_overflow_raises_into_consumer(emissions_channel):
+    """:class:`qtrio.RaiseOverflow` raises from the next receive and leaves the
+    buffered emissions to be received.
+    """
+    results, emissions, signal = await fill_past_buffer(
+        emissions_channel, overflow=qtrio.RaiseOverflow(), count=4
+    )
+
+    [error, *values] = results
+
+    assert (
+        type(error),
+        typing.cast(qtrio.EmissionsOverflowError, error).emission.args,
+        values,
+        emissions.dropped(signal),
+    ) == (qtrio.EmissionsOverflowError, (3,), [0, 1, 2], 1)
+
+
+async def test_raise_overflow_during_batch_keeps_received(emissions_channel):
+    """An overflow error raised while collecting a batch is raised by the next batch
+    and the emissions already received are returned first.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(
+        signals=[instance.signal], max_buffer_size=2, overflow=qtrio.RaiseOverflow()
+    ) as emissions:
+        instance.signal.emit(0)
+
+        async def emit_while_waiting() -> None:
+            await trio.testing.wait_all_tasks_blocked()
+
+            for value in [1, 2, 3]:
+                instance.signal.emit(value)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(emit_while_waiting)
+            first = await emissions.receive_batch(max_wait=10)
+
+        with pytest.raises(qtrio.EmissionsOverflowError):
+            await emissions.receive_batch()
+
+        rest = await emissions.receive_batch()
+
+    assert ([e.args for e in first], [e.args for e in rest]) == (
+        [(0,)],
+        [(1,), (2,)],
+    )
+
+
+async def test_dropped_counts_per_signal():
+    """:meth:`qtrio.Emissions.dropped` counts each signal separately."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal()
+        signal_b = QtCore.Signal()
+
+    instance = MyQObject()
+
+    async with qtrio.enter_emissions_channel(
+        signals=[instance.signal_a, instance.signal_b],
+        max_buffer_size=1,
+        overflow=qtrio.DropOldestOverflow(),
+    ) as emissions:
+        instance.signal_a.emit()
+        instance.signal_a.emit()
+        instance.signal_b.emit()
+
+        counts = (
+            emissions.dropped(instance.signal_a),
+            emissions.dropped(instance.signal_b),
+        )
+
+    assert counts == (2, 0)
+
+
+async def test_emissions_carry_signal_index(emissions_channel):
+    """Emissions record the position of their signal in the connected signals."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal()
+        signal_b = QtCore.Signal()
+
+    instance = MyQObject()
+
+    async with emissions_channel(
+        signals=[instance.signal_a, instance.signal_b]
+    ) as emissions:
+        instance.signal_b.emit()
+        instance.signal_a.emit()
+
+        indexes = [emission.index for emission in await emissions.receive_batch()]
+
+    assert indexes == [1, 0]
+
+
+async def test_emission_router_dispatches_by_signal():
+    """:class:`qtrio.EmissionRouter` calls the handler for each emission's signal."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+    results = []
+
+    router = qtrio.EmissionRouter()
+    router.add(instance.signal_a, lambda value: results.append(("a", value)))
+    router.add(instance.signal_b, lambda value: results.append(("b", value)))
+
+    async with qtrio.enter_emissions_channel(signals=router.signals) as emissions:
+        instance.signal_a.emit(1)
+        instance.signal_b.emit(2)
+        instance.signal_a.emit(3)
+
+        for emission in await emissions.receive_batch():
+            router.dispatch(emission)
+
+    assert results == [("a", 1), ("b", 2), ("a", 3)]
+
+
+def test_emission_router_falls_back_to_comparing_signals():
+    """:class:`qtrio.EmissionRouter` compares signals for emissions without an index."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    router = qtrio.EmissionRouter()
+    router.add(instance.signal_a, lambda value: ("a", value))
+    router.add(instance.signal_b, lambda value: ("b", value))
+
+    result = router.dispatch(qtrio.Emission(signal=instance.signal_b, args=(7,)))
+
+    assert result == ("b", 7)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["default", "compact"])
+async def test_emission_router_checks_channel_signals(compact):
+    """:class:`qtrio.EmissionRouter` does not trust indexes from a channel opened with
+    other signals than its own.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+        signal_c = QtCore.Signal(int)
+
+    instance = MyQObject()
+    results = []
+
+    router = qtrio.EmissionRouter()
+    router.add(instance.signal_a, lambda value: results.append(("a", value)))
+    router.add(instance.signal_b, lambda value: results.append(("b", value)))
+
+    async with qtrio.enter_emissions_channel(
+        signals=[instance.signal_b, instance.signal_a, instance.signal_c],
+        compact=compact,
+    ) as emissions:
+        instance.signal_a.emit(1)
+        instance.signal_b.emit(2)
+        instance.signal_c.emit(3)
+
+        first, second, third = await emissions.receive_batch()
+
+    router.dispatch(first)
+    router.dispatch(second)
+
+    with pytest.raises(KeyError):
+        router.dispatch(third)
+
+    assert results == [("a", 1), ("b", 2)]
+
+
+def test_emission_router_raises_for_unknown_signal():
+    """:class:`qtrio.EmissionRouter` raises for signals it has no handler for."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    instance = MyQObject()
+    router = qtrio.EmissionRouter()
+
+    with pytest.raises(KeyError):
+        router.dispatch(qtrio.Emission(signal=instance.signal, args=()))
+
+
+async def test_compact_emissions_resolve_signal(emissions_channel):
+    """Compact emissions carry the index and arguments and look up the signal."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with emissions_channel(
+        signals=[instance.signal_a, instance.signal_b], compact=True
+    ) as emissions:
+        instance.signal_b.emit(3)
+        [emission] = await emissions.receive_batch()
+
+    assert (
+        type(emission),
+        emission.index,
+        emission.args,
+        emission.is_from(instance.signal_b),
+        emission.is_from(instance.signal_a),
+    ) == (qtrio.CompactEmission, 1, (3,), True, False)
+
+
+async def test_compact_emissions_hold_arguments_inline():
+    """A compact emission is one object smaller than an emission and its arguments."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio.enter_emissions_channel(signals=[instance.signal]) as emissions:
+        instance.signal.emit(1)
+        [emission] = await emissions.receive_batch()
+
+    async with qtrio.enter_emissions_channel(
+        signals=[instance.signal], compact=True
+    ) as emissions:
+        instance.signal.emit(1)
+        [compact] = await emissions.receive_batch()
+
+    assert sys.getsizeof(compact) < sys.getsizeof(emission) + sys.getsizeof(
+        emission.args
+    )
+
+
+async def test_compact_emissions_compare_by_signal_and_args():
+    """Compact emissions are equal when from the same signal with the same arguments."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio.enter_emissions_channel(
+        signals=[instance.signal], compact=True
+    ) as emissions:
+        for value in [1, 1, 2]:
+            instance.signal.emit(value)
+
+        first, second, third = await emissions.receive_batch()
+
+    assert (first == second, first == third, first == 1) == (True, False, False)
+
+
+async def test_compact_emissions_route():
+    """:class:`qtrio.EmissionRouter` dispatches compact emissions."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    router = qtrio.EmissionRouter()
+    router.add(instance.signal, lambda value: value * 2)
+
+    async with qtrio.enter_emissions_channel(
+        signals=router.signals, compact=True
+    ) as emissions:
+        instance.signal.emit(21)
+        [emission] = await emissions.receive_batch()
+
+    assert router.dispatch(emission) == 42
+
+
+async def test_multiplexed_emissions_identify_signals(emissions_channel):
+    """A multiplexed channel tells apart signals of the same and different objects."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    first = MyQObject()
+    second = MyQObject()
+    signals = [first.signal_a, first.signal_b, second.signal_a]
+
+    async with emissions_channel(signals=signals, multiplex=True) as emissions:
+        second.signal_a.emit(1)
+        first.signal_b.emit(2)
+        first.signal_a.emit(3)
+
+        batch = await emissions.receive_batch()
+
+    assert [(emission.index, emission.args) for emission in batch] == [
+        (2, (1,)),
+        (1, (2,)),
+        (0, (3,)),
+    ]
+    assert batch[0] == qtrio.Emission(signal=second.signal_a, args=(1,))
+
+
+async def test_multiplexed_emissions_disconnect_on_exit():
+    """Exiting a multiplexed channel disconnects all of the signals."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instances = [MyQObject() for _ in range(10)]
+
+    async with qtrio._core.open_emissions_channel(
+        signals=[instance.signal for instance in instances], multiplex=True
+    ) as emissions:
+        instances[3].signal.emit(3)
+
+    instances[4].signal.emit(4)
+
+    async with emissions.channel:
+        results = [emission.args async for emission in emissions.channel]
+
+    assert results == [(3,)]
+
+
+async def test_multiplexed_compact_emissions(emissions_channel):
+    """Multiplexed channels can send compact emissions."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instances = [MyQObject() for _ in range(3)]
+
+    async with emissions_channel(
+        signals=[instance.signal for instance in instances],
+        multiplex=True,
+        compact=True,
+    ) as emissions:
+        instances[1].signal.emit(5)
+        [emission] = await emissions.receive_batch()
+
+    assert (type(emission), emission.is_from(instances[1].signal)) == (
+        qtrio.CompactEmission,
+        True,
+    )
+
+
+@pytest.mark.parametrize(argnames="multiplex", argvalues=[False, True])
+async def test_emissions_transform_filters_and_replaces(emissions_channel, multiplex):
+    """The transform can discard emissions in the slot and replace their arguments."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+    seen = []
+
+    def transform(index, args):
+        seen.append(index)
+        [value] = args
+
+        if value % 2 == 1:
+            return None
+
+        return (value * 10,)
+
+    async with emissions_channel(
+        signals=[instance.signal_a, instance.signal_b],
+        multiplex=multiplex,
+        transform=transform,
+    ) as emissions:
+        for value in range(4):
+            instance.signal_a.emit(value)
+
+        instance.signal_b.emit(4)
+
+        batch = await emissions.receive_batch()
+
+    assert (seen, [(emission.index, emission.args) for emission in batch]) == (
+        [0, 0, 0, 0, 1],
+        [(0, (0,)), (0, (20,)), (1, (40,))],
+    )
+
+
+async def test_emissions_transform_rejections_do_not_wake():
+    """Emissions discarded by the transform never reach the channel."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio.enter_emissions_channel(
+        signals=[instance.signal], transform=lambda index, args: None
+    ) as emissions:
+        instance.signal.emit(1)
+
+        with pytest.raises(trio.WouldBlock):
+            emissions.channel.receive_nowait()
+
+
+@pytest.mark.parametrize(argnames="multiplex", argvalues=[False, True])
+async def test_threadsafe_emissions_from_threads(emissions_channel, multiplex):
+    """A thread safe channel receives emissions from several threads, in order for
+    each thread, with the slots run in the emitting threads.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instances = [MyQObject() for _ in range(3)]
+    # PySide6 6.12 releases a reference to True for each emit() so keep this modest
+    count = 200
+    slot_threads = set()
+
+    def transform(index, args):
+        slot_threads.add(threading.get_ident())
+        return args
+
+    def emit(instance: MyQObject) -> None:
+        for value in range(count):
+            instance.signal.emit(value)
+
+    async with emissions_channel(
+        signals=[instance.signal for instance in instances],
+        threadsafe=True,
+        multiplex=multiplex,
+        transform=transform,
+    ) as emissions:
+        threads = [
+            threading.Thread(target=emit, args=(instance,)) for instance in instances
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        received: typing.Dict[int, typing.List[object]] = {
+            index: [] for index in range(len(instances))
+        }
+
+        async for batch in emissions.batches():
+            for emission in batch:
+                received[typing.cast(int, emission.index)].extend(emission.args)
+
+            if sum(len(values) for values in received.values()) == 3 * count:
+                break
+
+        for thread in threads:
+            thread.join()
+
+    assert (received, threading.get_ident() in slot_threads) == (
+        {index: list(range(count)) for index in range(len(instances))},
+        False,
+    )
+
+
+async def test_threadsafe_emissions_delivered_on_exit():
+    """Emissions pending delivery when the channel is exited are still sent."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio._core.open_emissions_channel(
+        signals=[instance.signal], threadsafe=True
+    ) as emissions:
+        instance.signal.emit(1)
+
+    async with emissions.channel:
+        results = [emission.args async for emission in emissions.channel]
+
+    assert results == [(1,)]
+
+
+@pytest.mark.parametrize(argnames="block", argvalues=[False, True])
+async def test_backpressure_pauses_and_resumes(emissions_channel, block):
+    """The source is paused at the high water mark, losing further emissions, and
+    resumed once the buffer is drained to the low water mark.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    backpressure = qtrio.Backpressure(
+        high_water=3, low_water=1, objects=[instance] if block else []
+    )
+
+    async with emissions_channel(
+        signals=[instance.signal], backpressure=backpressure
+    ) as emissions:
+        for value in range(6):
+            instance.signal.emit(value)
+
+        paused = (emissions.paused, instance.signalsBlocked())
+        received = [emissions.channel.receive_nowait().args for _ in range(2)]
+        resumed = (emissions.paused, instance.signalsBlocked())
+        instance.signal.emit(6)
+        received.extend(emissions.channel.receive_nowait().args for _ in range(2))
+
+        counts = (emissions.pauses, emissions.resumes, emissions.dropped())
+
+    assert (paused, resumed, received, counts) == (
+        (True, block),
+        (False, False),
+        [(0,), (1,), (2,), (6,)],
+        (1, 1, 0),
+    )
+
+
+@pytest.mark.parametrize(argnames="block", argvalues=[False, True])
+async def test_backpressure_exit_while_paused(block):
+    """Exiting while paused leaves the source unblocked and disconnected."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    backpressure = qtrio.Backpressure(high_water=1, objects=[instance] if block else [])
+
+    async with qtrio._core.open_emissions_channel(
+        signals=[instance.signal], backpressure=backpressure
+    ) as emissions:
+        instance.signal.emit(0)
+        paused = emissions.paused
+
+    async with emissions.channel:
+        first = emissions.channel.receive_nowait().args
+        instance.signal.emit(1)
+        results = [emission.args async for emission in emissions.channel]
+
+    assert (paused, instance.signalsBlocked(), first, results, emissions.resumes) == (
+        True,
+        False,
+        (0,),
+        [],
+        0,
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["high_water", "low_water"], argvalues=[[0, 0], [2, 2], [2, -1]]
+)
+def test_backpressure_rejects_invalid_marks(high_water, low_water):
+    """The high water mark must be positive and above the low water mark."""
+    with pytest.raises(ValueError):
+        qtrio.Backpressure(high_water=high_water, low_water=low_water)
+
+
+async def test_backpressure_multiplexed_requires_objects():
+    """Multiplexed connections can not be suspended so objects must be given."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    instance = MyQObject()
+
+    with pytest.raises(ValueError):
+        async with qtrio.enter_emissions_channel(
+            signals=[instance.signal],
+            multiplex=True,
+            backpressure=qtrio.Backpressure(high_water=1),
+        ):
+            pass  # pragma: no cover
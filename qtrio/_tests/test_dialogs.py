@@ -387,6 +387,29 @@ async def test_progress_dialog_cancel_cancels_context(
     assert cancelled
 
 
+async def test_progress_dialog_follow_sets_value(
+    qtbot: pytestqt.qtbot.QtBot, optional_parent: typing.Optional[QtWidgets.QWidget]
+) -> None:
+    dialog = qtrio.dialogs.create_progress_dialog(
+        maximum=10,
+        parent=optional_parent,
+    )
+
+    values = []
+
+    async def progress() -> typing.AsyncIterator[int]:
+        for value in [1, 4, 9]:
+            yield value
+            assert dialog.dialog is not None
+            values.append(dialog.dialog.value())
+
+    with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+        async with dialog.manage():
+            await dialog.follow(progress())
+
+    assert values == [1, 4, 9]
+
+
 def test_dialog_button_box_buttons_by_role_no_buttons(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
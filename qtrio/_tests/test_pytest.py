@@ -34,3 +34,32 @@ def test_assertion_pass_passes(testdir):
 
     result = testdir.runpytest_subprocess(timeout=timeout)
     result.assert_outcomes(passed=1)
+
+
+def test_plugin_does_not_import_trio(testdir):
+    """Loading the QTrio pytest plugin leaves QTrio's testing module and Trio unloaded
+    until a fixture is used.
+    """
+
+    test_file = r"""
+    import sys
+
+    def test():
+        assert [
+            module for module in ["qtrio.testing", "trio"] if module in sys.modules
+        ] == []
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(
+        "-p",
+        "qtrio._pytest",
+        "-p",
+        "no:pytest-qt",
+        "-p",
+        "no:trio",
+        "-p",
+        "no:anyio",
+        timeout=timeout,
+    )
+    result.assert_outcomes(passed=1)
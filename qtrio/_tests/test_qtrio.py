@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_importing_qtrio_does_not_import_qt(testdir):
     test_file = r"""
     import sys
@@ -44,3 +47,62 @@ def test_importing_qtrio_does_not_import_qt_wrappers(testdir):
 
     result = testdir.runpytest_subprocess("-p", "no:pytest-qt")
     result.assert_outcomes(passed=1)
+
+
+def test_importing_qtrio_does_not_import_core(testdir):
+    test_file = r"""
+    import sys
+
+    def test():
+        before = set(sys.modules)
+
+        import qtrio
+
+        lazy_modules = ['qtrio._core', 'qtrio._qt', 'trio', 'attr', 'qts']
+        imported = [
+            module
+            for module in lazy_modules
+            if module in sys.modules and module not in before
+        ]
+
+        assert imported == [], "only the exceptions should be loaded by import qtrio"
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess("-p", "no:pytest-qt", "-p", "no:trio")
+    result.assert_outcomes(passed=1)
+
+
+def test_lazy_attribute_loads_on_access():
+    import qtrio
+    import qtrio._core
+
+    assert qtrio.Runner is qtrio._core.Runner
+
+
+def test_lazy_submodule_loads_on_access(testdir):
+    """Private submodules remain reachable as attributes after only ``import qtrio``."""
+    test_file = r"""
+    import qtrio
+
+    def test():
+        assert qtrio._core.Runner is qtrio.Runner
+        assert qtrio._qt.Signal is qtrio.Signal
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess("-p", "no:pytest-qt", "-p", "no:trio")
+    result.assert_outcomes(passed=1)
+
+
+def test_lazy_attribute_in_dir():
+    import qtrio
+
+    assert {"Runner", "Signal", "InternalError"} <= set(dir(qtrio))
+
+
+def test_missing_attribute_raises():
+    import qtrio
+
+    with pytest.raises(AttributeError, match="no attribute 'NotAThing'"):
+        qtrio.NotAThing
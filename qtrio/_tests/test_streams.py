@@ -0,0 +1,192 @@
+import typing
+
+from qts import QtCore
+import pytest
+import trio
+
+import qtrio
+import qtrio.streams
+import qtrio.testing
+
+
+Schedule = typing.Sequence[typing.Tuple[float, object]]
+
+
+async def collect(
+    schedule: Schedule,
+    wrap: typing.Callable[[trio.abc.ReceiveChannel[object]], trio.abc.ReceiveChannel],
+    close_at: float = 0,
+) -> typing.List[typing.Tuple[float, object]]:
+    """Send each value at its time, relative to the start, then close the channel at
+    ``close_at`` or after the last value.  Return the values received through the
+    operator along with when they arrived.
+    """
+    send_channel, receive_channel = trio.open_memory_channel[object](100)
+    start = trio.current_time()
+    received = []
+
+    async def send() -> None:
+        async with send_channel:
+            for time, value in schedule:
+                await trio.sleep_until(start + time)
+                await send_channel.send(value)
+
+            await trio.sleep_until(start + close_at)
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(send)
+
+        async with wrap(receive_channel) as channel:
+            async for value in channel:
+                received.append((round(trio.current_time() - start, 6), value))
+
+    return received
+
+
+async def test_debounce_flushes_when_the_channel_ends(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """A held value is delivered as soon as the channel ends."""
+    received = await collect(
+        schedule=[(0, "a"), (1, "ab")],
+        wrap=lambda channel: qtrio.streams.debounce(channel, interval=3),
+        close_at=2,
+    )
+
+    assert received == [(2, "ab")]
+
+
+async def test_debounce_delivers_after_quiet(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Only values followed by a quiet interval are delivered."""
+    received = await collect(
+        schedule=[(0, "a"), (1, "ab"), (2, "abc"), (10, "abcd")],
+        wrap=lambda channel: qtrio.streams.debounce(channel, interval=3),
+    )
+
+    assert received == [(5, "abc"), (10, "abcd")]
+
+
+async def test_throttle_leading_and_trailing(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """The first value is delivered immediately and the latest of each interval when
+    it ends.
+    """
+    received = await collect(
+        schedule=[(0, 1), (1, 2), (2, 3), (20, 4)],
+        wrap=lambda channel: qtrio.streams.throttle(channel, interval=5),
+    )
+
+    assert received == [(0, 1), (5, 3), (20, 4)]
+
+
+async def test_throttle_without_trailing(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Values received during an interval are discarded when not trailing."""
+    received = await collect(
+        schedule=[(0, 1), (1, 2), (2, 3), (6, 4), (7, 5)],
+        wrap=lambda channel: qtrio.streams.throttle(
+            channel, interval=5, trailing=False
+        ),
+    )
+
+    assert received == [(0, 1), (6, 4)]
+
+
+async def test_sample_delivers_latest_per_tick(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """The latest value is delivered at each tick and ticks without one are skipped."""
+    received = await collect(
+        schedule=[(0, 1), (1, 2), (3, 3), (4, 4), (21, 5)],
+        wrap=lambda channel: qtrio.streams.sample(channel, interval=2.5),
+        close_at=30,
+    )
+
+    assert received == [(2.5, 2), (5, 4), (22.5, 5)]
+
+
+async def test_buffer_by_count(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Lists are delivered once full and the remainder when the channel ends."""
+    received = await collect(
+        schedule=[(0, 1), (0, 2), (0, 3), (0, 4), (0, 5)],
+        wrap=lambda channel: qtrio.streams.buffer(channel, max_items=2),
+    )
+
+    assert [value for _, value in received] == [[1, 2], [3, 4], [5]]
+
+
+async def test_buffer_by_time(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Lists are delivered an interval after their first value."""
+    received = await collect(
+        schedule=[(0, 1), (1, 2), (4, 3), (10, 4)],
+        wrap=lambda channel: qtrio.streams.buffer(channel, interval=3),
+        close_at=30,
+    )
+
+    assert received == [(3, [1, 2]), (7, [3]), (13, [4])]
+
+
+@pytest.mark.parametrize(
+    argnames=["interval", "max_items"],
+    argvalues=[[float("inf"), float("inf")], [0, 5], [1, 0]],
+)
+def test_buffer_rejects_invalid_limits(interval: float, max_items: float) -> None:
+    """Without a finite limit or with non-positive limits a ValueError is raised."""
+    send_channel, receive_channel = trio.open_memory_channel[object](0)
+
+    with pytest.raises(ValueError):
+        qtrio.streams.buffer(receive_channel, interval=interval, max_items=max_items)
+
+
+async def test_distinct_until_changed_skips_repeats() -> None:
+    """Values equal to the one before are skipped."""
+    received = await collect(
+        schedule=[(0, 1), (0, 1), (0, 2), (0, 1), (0, 1)],
+        wrap=qtrio.streams.distinct_until_changed,
+    )
+
+    assert [value for _, value in received] == [1, 2, 1]
+
+
+async def test_distinct_until_changed_compares_emissions() -> None:
+    """Emissions of equal arguments from the same signal are repeats."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    async with qtrio.enter_emissions_channel(signals=[instance.signal]) as emissions:
+        for value in [1, 1, 2, 2, 1]:
+            instance.signal.emit(value)
+
+        async with emissions.send_channel:
+            pass
+
+        channel = qtrio.streams.distinct_until_changed(emissions.channel)
+        received = [emission.args async for emission in channel]
+
+    assert received == [(1,), (2,), (1,)]
+
+
+async def test_operators_compose(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Operators accept each other as their channel."""
+    received = await collect(
+        schedule=[(0, "a"), (1, "a"), (2, "ab"), (10, "ab"), (11, "abc")],
+        wrap=lambda channel: qtrio.streams.debounce(
+            qtrio.streams.distinct_until_changed(channel), interval=3
+        ),
+        close_at=30,
+    )
+
+    assert received == [(5, "ab"), (14, "abc")]
@@ -0,0 +1,144 @@
+import time
+import typing
+
+from qts import QtCore
+import trio
+
+import qtrio
+import qtrio.testing
+
+
+async def test_autojump_clock_jumps_when_idle(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """Sleeping is skipped once Trio and Qt are both idle."""
+    start = time.monotonic()
+    virtual_start = trio.current_time()
+
+    await trio.sleep(1000)
+
+    assert (
+        time.monotonic() - start < 10,
+        trio.current_time() - virtual_start >= 1000,
+        qtrio_autojump_clock.jumps >= 1,
+    ) == (True, True, True)
+
+
+async def test_autojump_clock_waits_for_qt_events(
+    qtrio_autojump_clock: qtrio.testing.AutojumpClock,
+) -> None:
+    """The clock does not jump while Qt still has events to process which will wake
+    Trio.
+    """
+    done = trio.Event()
+    remaining = 100
+
+    def hop() -> None:
+        nonlocal remaining
+        remaining -= 1
+
+        if remaining > 0:
+            QtCore.QTimer.singleShot(0, hop)
+        else:
+            done.set()
+
+    QtCore.QTimer.singleShot(0, hop)
+
+    with trio.move_on_after(1) as cancel_scope:
+        await done.wait()
+
+    assert (cancel_scope.cancelled_caught, remaining) == (False, 0)
+
+
+def test_autojump_clock_in_runner() -> None:
+    """The clock can be passed directly to a runner."""
+    clock = qtrio.testing.AutojumpClock()
+
+    async def main() -> float:
+        start = trio.current_time()
+        await trio.sleep(60)
+
+        return trio.current_time() - start
+
+    runner = qtrio.Runner(clock=clock)
+    outcomes = runner.run(main)
+
+    elapsed = typing.cast(float, outcomes.unwrap())
+
+    assert elapsed >= 60
+
+
+class RecordingAutojumpClock(qtrio.testing.AutojumpClock):
+    """Count the times the clock is told Qt is about to block."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.idle_calls = 0
+
+    def _qt_idle(self) -> None:
+        self.idle_calls += 1
+        super()._qt_idle()
+
+
+def test_autojump_clock_does_not_jump_after_trio_wakes() -> None:
+    """A deadline noted while Trio was idle is not jumped to once a signal emission
+    has made a task runnable again before Qt blocks.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    class HeldAutojumpClock(RecordingAutojumpClock):
+        """Ignore Qt blocking until released so Trio is woken by the emission first."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.held = True
+
+        def _qt_idle(self) -> None:
+            if not self.held:
+                super()._qt_idle()
+
+    clock = HeldAutojumpClock()
+    instance = MyQObject()
+
+    async def main() -> float:
+        async with qtrio.enter_emissions_channel(
+            signals=[instance.signal]
+        ) as emissions:
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(trio.sleep, 1000)
+
+                # emit once Trio has gone idle waiting for the sleep to end
+                QtCore.QTimer.singleShot(100, instance.signal.emit)
+                await emissions.channel.receive()
+
+                start = trio.current_time()
+                clock.held = False
+                QtCore.QAbstractEventDispatcher.instance().aboutToBlock.emit()
+                elapsed = trio.current_time() - start
+
+                nursery.cancel_scope.cancel()
+
+        return elapsed
+
+    outcomes = qtrio.Runner(clock=clock).run(main)
+
+    assert (outcomes.unwrap(), clock.jumps) == (0, 0)
+
+
+def test_autojump_clock_disconnects_after_run() -> None:
+    """The clock stops watching the Qt event dispatcher when each run ends."""
+    clocks = [RecordingAutojumpClock() for _ in range(3)]
+
+    async def main() -> None:
+        await trio.sleep(1)
+
+    for clock in clocks:
+        qtrio.Runner(clock=clock).run(main)
+        clock.idle_calls = 0
+
+    dispatcher = QtCore.QAbstractEventDispatcher.instance()
+    dispatcher.aboutToBlock.emit()
+
+    assert [clock.idle_calls for clock in clocks] == [0, 0, 0]
@@ -0,0 +1,140 @@
+import os
+import time
+
+import pytest
+import trio
+
+import qtrio
+import qtrio.to_process
+
+
+class LocalUniqueException(Exception):
+    pass
+
+
+def add(a, b):
+    return a + b, os.getpid()
+
+
+def raise_unique():
+    raise LocalUniqueException()
+
+
+def count_to(n: int) -> str:
+    for i in range(n):
+        qtrio.to_process.report_progress(i)
+
+    return "done"
+
+
+def started_then_sleep():
+    qtrio.to_process.report_progress("started")
+    time.sleep(60)
+
+
+def exit_with(code):
+    os._exit(code)
+
+
+@pytest.fixture(name="pool")
+def pool_fixture():
+    pool = qtrio.to_process.ProcessPool(max_workers=2)
+
+    yield pool
+
+    pool.close()
+
+
+async def test_run_sync_returns_result_from_another_process(pool):
+    """:meth:`qtrio.to_process.ProcessPool.run_sync` runs the function in another
+    process and returns the result.
+    """
+    result, pid = await pool.run_sync(add, 1, 2)
+
+    assert (result, pid != os.getpid()) == (3, True)
+
+
+async def test_run_sync_reuses_workers(pool):
+    """Worker processes persist between jobs."""
+    _, first_pid = await pool.run_sync(add, 1, 2)
+    _, second_pid = await pool.run_sync(add, 1, 2)
+
+    assert first_pid == second_pid
+
+
+async def test_run_sync_raises(pool):
+    """Exceptions raised by the function are raised by
+    :meth:`qtrio.to_process.ProcessPool.run_sync`.
+    """
+    with pytest.raises(LocalUniqueException):
+        await pool.run_sync(raise_unique)
+
+
+async def test_job_iterates_progress(pool):
+    """Values passed to :func:`qtrio.to_process.report_progress` are yielded by the
+    job followed by the result.
+    """
+    async with pool.open_job(count_to, 5) as job:
+        progress = [value async for value in job]
+
+    assert (progress, await job.wait()) == ([0, 1, 2, 3, 4], "done")
+
+
+async def test_cancellation_kills_the_worker(pool):
+    """Cancelling a job kills the worker rather than waiting for it and a new worker is
+    started for the next job.
+    """
+    start = trio.current_time()
+
+    with trio.move_on_after(60) as cancel_scope:
+        async with pool.open_job(started_then_sleep) as job:
+            async for progress in job:
+                assert progress == "started"
+                cancel_scope.cancel()
+
+    elapsed = trio.current_time() - start
+    result, _ = await pool.run_sync(add, 1, 2)
+
+    assert (cancel_scope.cancelled_caught, elapsed < 30, result) == (True, True, 3)
+
+
+async def test_leaving_job_early_kills_the_worker(pool):
+    """Exiting the job context before the function is done kills the worker."""
+
+    async with pool.open_job(started_then_sleep) as job:
+        async for progress in job:
+            break
+
+    assert job.done is False
+
+    with pytest.raises(qtrio.WorkerProcessDiedError):
+        await job.wait()
+
+
+async def test_worker_exit_raises(pool):
+    """A worker process exiting while running a function raises
+    :class:`qtrio.WorkerProcessDiedError`.
+    """
+    with pytest.raises(qtrio.WorkerProcessDiedError) as exception_info:
+        await pool.run_sync(exit_with, 3)
+
+    result, _ = await pool.run_sync(add, 1, 2)
+
+    assert (exception_info.value.exit_code, result) == (3, 3)
+
+
+def test_report_progress_outside_a_worker_does_nothing():
+    """Functions reporting progress can still be called directly."""
+    assert count_to(3) == "done"
+
+
+async def test_module_run_sync_uses_default_pool():
+    """:func:`qtrio.to_process.run_sync` uses the default pool."""
+    result, pid = await qtrio.to_process.run_sync(add, 1, 2)
+
+    assert (result, pid != os.getpid()) == (3, True)
+
+
+def test_default_pool_is_persistent():
+    """The same default pool is returned each time."""
+    assert qtrio.to_process.default_pool() is qtrio.to_process.default_pool()
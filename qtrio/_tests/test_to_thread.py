@@ -0,0 +1,180 @@
+import functools
+import gc
+import threading
+import typing
+
+import pytest
+from qts import QtCore
+import trio
+import trio.testing
+
+import qtrio
+import qtrio.to_thread
+
+
+@pytest.fixture(name="pool")
+def pool_fixture():
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+
+    yield pool
+
+    pool.waitForDone()
+
+
+async def test_run_sync_returns_result_from_another_thread(pool):
+    """:func:`qtrio.to_thread.run_sync` runs the function in a pool thread and returns
+    the result.
+    """
+
+    def fn(a, b):
+        return a + b, threading.get_ident()
+
+    result, thread = await qtrio.to_thread.run_sync(fn, 1, 2, pool=pool)
+
+    assert (result, thread != threading.get_ident()) == (3, True)
+
+
+async def test_run_sync_raises(pool):
+    """:func:`qtrio.to_thread.run_sync` passes on exceptions."""
+
+    class LocalUniqueException(Exception):
+        pass
+
+    def fn():
+        raise LocalUniqueException()
+
+    with pytest.raises(LocalUniqueException):
+        await qtrio.to_thread.run_sync(fn, pool=pool)
+
+
+async def test_run_sync_uses_global_pool_by_default():
+    """Without a pool specified, Qt's global pool is used."""
+
+    stats = qtrio.to_thread.statistics()
+    submitted = stats.submitted
+
+    await qtrio.to_thread.run_sync(lambda: None)
+
+    assert stats.submitted == submitted + 1
+
+
+async def test_global_pool_statistics_persist_without_references():
+    """The global pool's statistics are kept while nothing else references the pool's
+    wrapper.
+    """
+
+    submitted = qtrio.to_thread.statistics().submitted
+    gc.collect()
+
+    await qtrio.to_thread.run_sync(lambda: None)
+    gc.collect()
+
+    assert qtrio.to_thread.statistics().submitted == submitted + 1
+
+
+async def test_run_sync_cancelled_before_start(pool):
+    """Work still waiting for a thread is removed from the pool when cancelled."""
+
+    release = threading.Event()
+    ran: typing.List[bool] = []
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(
+            functools.partial(qtrio.to_thread.run_sync, pool=pool), release.wait
+        )
+        await trio.testing.wait_all_tasks_blocked()
+
+        with trio.move_on_after(0.05):
+            await qtrio.to_thread.run_sync(ran.append, True, pool=pool)
+
+        release.set()
+
+    stats = qtrio.to_thread.statistics(pool)
+
+    assert (ran, stats.cancelled, stats.completed, stats.queued, stats.running) == (
+        [],
+        1,
+        1,
+        0,
+        0,
+    )
+
+
+async def test_run_sync_already_cancelled(pool):
+    """Nothing is submitted when already cancelled."""
+
+    ran: typing.List[bool] = []
+
+    with trio.CancelScope() as cancel_scope:
+        cancel_scope.cancel()
+        await qtrio.to_thread.run_sync(ran.append, True, pool=pool)
+
+    assert (ran, qtrio.to_thread.statistics(pool).submitted) == ([], 0)
+
+
+async def test_run_sync_cancelled_after_start_waits(pool):
+    """Once started, cancellation waits for the function to finish."""
+
+    started = threading.Event()
+    release = threading.Event()
+    finished = []
+
+    def blocking():
+        started.set()
+        release.wait()
+        finished.append(True)
+
+    with trio.CancelScope() as cancel_scope:
+
+        async def cancel_once_started():
+            await trio.to_thread.run_sync(started.wait)
+            cancel_scope.cancel()
+            release.set()
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(cancel_once_started)
+            await qtrio.to_thread.run_sync(blocking, pool=pool)
+
+    assert finished == [True]
+
+
+async def test_statistics_track_queue_depth(pool):
+    """The largest queue depth and counts of submitted work are recorded."""
+
+    release = threading.Event()
+
+    async with trio.open_nursery() as nursery:
+        for _ in range(3):
+            nursery.start_soon(
+                functools.partial(qtrio.to_thread.run_sync, pool=pool), release.wait
+            )
+
+        await trio.testing.wait_all_tasks_blocked()
+        stats = qtrio.to_thread.statistics(pool)
+        during = (stats.queued + stats.running, stats.submitted)
+        release.set()
+
+    assert (during, stats.max_queued >= 2, stats.completed, stats.queued) == (
+        (3, 3),
+        True,
+        3,
+        0,
+    )
+
+
+def test_statistics_are_per_pool(pool):
+    """Each pool has its own statistics."""
+
+    assert qtrio.to_thread.statistics(pool) is not qtrio.to_thread.statistics()
+
+
+def test_run_sync_without_qtrio(pool):
+    """Results are delivered via the Trio token when not run by QTrio."""
+
+    result = trio.run(
+        functools.partial(qtrio.to_thread.run_sync, pool=pool),
+        threading.get_ident,
+    )
+
+    assert result != threading.get_ident()
@@ -690,6 +690,19 @@ class ProgressDialog:
             if self.dialog.wasCanceled():
                 raise qtrio.UserCancelledError()
 
+    async def follow(self, progress: typing.AsyncIterable[int]) -> None:
+        """Set the dialog's value to each progress value as it arrives, such as from a
+        :class:`qtrio.to_process.Job`.  Use this while the dialog is being managed.
+
+        Arguments:
+            progress: The values to show.
+        """
+        async for value in progress:
+            if self.dialog is None:  # pragma: no cover
+                raise qtrio.DialogNotActiveError()
+
+            self.dialog.setValue(value)
+
 
 def create_progress_dialog(
     title: str = "",
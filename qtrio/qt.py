@@ -1,3 +1,5 @@
+import time
+import types
 import typing
 
 from qts import QtCore
@@ -6,9 +8,17 @@ import qtrio._core
 
 
 class ReenterEvent(QtCore.QEvent):
-    """A proper ``ReenterEvent`` for reentering into the Qt host loop."""
+    """A proper ``ReenterEvent`` for reentering into the Qt host loop.  The
+    :func:`time.perf_counter` timestamp of its creation is stored as ``posted`` for
+    measuring the dispatch latency.  If ``stats`` is passed then the handling of the
+    event will be recorded there.
+    """
 
-    def __init__(self, fn: typing.Callable[[], object]):
+    def __init__(
+        self,
+        fn: typing.Callable[[], object],
+        stats: typing.Optional[qtrio._core.ReenterStatistics] = None,
+    ):
         if qtrio._core._reenter_event_type is None:
             message = (
                 "The reenter event type must be registered before creating a reenter"
@@ -18,6 +28,8 @@ class ReenterEvent(QtCore.QEvent):
 
         super().__init__(qtrio._core._reenter_event_type)
         self.fn = fn
+        self.stats = stats
+        self.posted = time.perf_counter()
 
 
 class Reenter(QtCore.QObject):
@@ -26,9 +38,85 @@ class Reenter(QtCore.QObject):
     def event(self, event: QtCore.QEvent) -> bool:
         """Qt calls this when the object receives an event."""
 
+        if event.type() != qtrio._core._reenter_event_type:
+            # such as the thread change event sent when moved to another thread
+            return bool(super().event(event))
+
         try:
-            reenter_event = typing.cast(Reenter, event)
-            reenter_event.fn()
+            reenter_event = typing.cast(ReenterEvent, event)
+            stats = reenter_event.stats
+
+            if stats is None:
+                reenter_event.fn()
+            else:
+                started = time.perf_counter()
+                reenter_event.fn()
+                stats.record_dispatched(
+                    posted=reenter_event.posted,
+                    started=started,
+                    finished=time.perf_counter(),
+                )
+
             return True
         except Exception as e:
             raise qtrio.InternalError("Exception while handling a reenter event") from e
+
+
+class WakeupRelay(QtCore.QObject):
+    """A ``QtCore.QObject`` hosting the signal used to reach the Qt host thread by
+    :class:`qtrio.SignalWakeup` and :class:`qtrio.TimerWakeup`.
+    """
+
+    wake = QtCore.Signal()
+
+
+class EventLoopThread(QtCore.QThread):
+    """A ``QtCore.QThread`` which calls ``start`` and then runs its event loop, both
+    from within Python.  Keeping a Python frame active for the life of the thread
+    preserves thread local state, such as Trio's run context, between the callbacks
+    Qt makes into Python from the thread.
+    """
+
+    def __init__(self, start: typing.Callable[[], object]):
+        super().__init__()
+        self._start = start
+
+    def run(self) -> None:
+        """Qt calls this in the new thread."""
+        self._start()
+        self.exec()
+
+
+class EmissionsReceiver(QtCore.QObject):
+    """A ``QtCore.QObject`` receiving the emissions of many signals for a multiplexed
+    emissions channel.  Each signal is connected to a method bound to this object so
+    when it is destroyed Qt disconnects all of them at once.  Disconnecting each signal
+    individually takes time growing faster than linearly with the number of
+    connections in some wrappers.
+    """
+
+    def __init__(self, slot: typing.Callable[[int, typing.Tuple[object, ...]], None]):
+        super().__init__()
+        self._slot = slot
+
+    def add(
+        self,
+        signal: "QtCore.SignalInstance",
+        index: int,
+        connection_type: typing.Optional[QtCore.Qt.ConnectionType] = None,
+    ) -> None:
+        """Connect ``signal`` so its emissions are passed to ``slot`` along with
+        ``index``.  The default connection type is used if ``connection_type`` is
+        :obj:`None`.
+        """
+        slot = self._slot
+
+        def receive(self: EmissionsReceiver, *args: object) -> None:
+            slot(index, args)
+
+        method = types.MethodType(receive, self)
+
+        if connection_type is None:
+            signal.connect(method)
+        else:
+            signal.connect(method, type=connection_type)
@@ -0,0 +1,307 @@
+"""Time-based operators for receive channels such as :attr:`qtrio.Emissions.channel`.
+Each operator wraps a channel and is itself a :class:`trio.abc.ReceiveChannel` so they
+can be composed.  Timing is done with Trio deadlines in the receiving task rather than
+with extra tasks or Qt timers so any number of operators share Trio's single timer.
+Closing an operator closes the channel it wraps.
+"""
+import math
+import typing
+
+import trio
+import trio.abc
+
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
+
+class _Empty:
+    """Marks that no value is held since :obj:`None` is a valid value."""
+
+
+_empty = _Empty()
+
+
+def _check_interval(interval: float) -> None:
+    if not interval > 0:
+        raise ValueError(f"interval must be greater than zero, got: {interval!r}")
+
+
+class _Operator(trio.abc.ReceiveChannel[U], typing.Generic[T, U]):
+    def __init__(self, source: trio.abc.ReceiveChannel[T]) -> None:
+        self._source = source
+
+    async def aclose(self) -> None:
+        await self._source.aclose()
+
+
+class _Holding(_Operator[T, U]):
+    """Hold the latest value received until it is delivered."""
+
+    def __init__(self, source: trio.abc.ReceiveChannel[T]) -> None:
+        super().__init__(source=source)
+        self._pending: typing.Union[T, _Empty] = _empty
+
+    def _take(self) -> T:
+        value = typing.cast(T, self._pending)
+        self._pending = _empty
+
+        return value
+
+
+class _Debounce(_Holding[T, T]):
+    def __init__(self, source: trio.abc.ReceiveChannel[T], interval: float) -> None:
+        super().__init__(source=source)
+        self._interval = interval
+        self._deadline = math.inf
+        self._ended = False
+
+    def _hold(self, value: T) -> None:
+        self._pending = value
+        self._deadline = trio.current_time() + self._interval
+
+    async def receive(self) -> T:
+        if self._pending is _empty:
+            self._hold(await self._source.receive())
+
+        while not self._ended:
+            with trio.move_on_at(self._deadline) as cancel_scope:
+                try:
+                    self._hold(await self._source.receive())
+                except trio.EndOfChannel:
+                    self._ended = True
+
+            if cancel_scope.cancelled_caught:
+                break
+
+        return self._take()
+
+
+def debounce(
+    channel: trio.abc.ReceiveChannel[T], interval: float
+) -> trio.abc.ReceiveChannel[T]:
+    """Receive a value only once ``channel`` has been quiet for ``interval`` seconds.
+    Values received before then are replaced by newer ones.  Use this for search as you
+    type where only the text present once typing pauses matters.
+
+    Args:
+        channel: The channel to receive from.
+        interval: The quiet time in seconds.
+
+    Returns:
+        A channel of the values which were followed by a quiet period.  A held value is
+        delivered immediately when ``channel`` ends.
+    """
+    _check_interval(interval=interval)
+
+    return _Debounce(source=channel, interval=interval)
+
+
+class _Throttle(_Holding[T, T]):
+    def __init__(
+        self, source: trio.abc.ReceiveChannel[T], interval: float, trailing: bool
+    ) -> None:
+        super().__init__(source=source)
+        self._interval = interval
+        self._trailing = trailing
+        self._window_end = -math.inf
+
+    def _deliver(self, value: T) -> T:
+        self._window_end = trio.current_time() + self._interval
+
+        return value
+
+    async def receive(self) -> T:
+        while True:
+            if trio.current_time() >= self._window_end:
+                if self._pending is not _empty:
+                    return self._deliver(self._take())
+
+                return self._deliver(await self._source.receive())
+
+            with trio.move_on_at(self._window_end):
+                try:
+                    value = await self._source.receive()
+                except trio.EndOfChannel:
+                    if self._pending is _empty:
+                        raise
+
+                    return self._take()
+
+                if self._trailing:
+                    self._pending = value
+
+
+def throttle(
+    channel: trio.abc.ReceiveChannel[T], interval: float, trailing: bool = True
+) -> trio.abc.ReceiveChannel[T]:
+    """Receive at most one value per ``interval`` seconds.  A value arriving after a
+    quiet period is delivered immediately and starts a new interval.  Use this for
+    resize handling where work should keep up with the user without running for every
+    emission.
+
+    Args:
+        channel: The channel to receive from.
+        interval: The minimum time in seconds between delivered values.
+        trailing: If :obj:`True`, the latest value received during an interval is
+            delivered when it ends so the final value is never lost.  Otherwise values
+            received during an interval are discarded.
+
+    Returns:
+        A channel of the throttled values.
+    """
+    _check_interval(interval=interval)
+
+    return _Throttle(source=channel, interval=interval, trailing=trailing)
+
+
+class _Sample(_Holding[T, T]):
+    def __init__(self, source: trio.abc.ReceiveChannel[T], interval: float) -> None:
+        super().__init__(source=source)
+        self._interval = interval
+        self._next_tick: typing.Optional[float] = None
+
+    def _advance(self) -> float:
+        now = trio.current_time()
+
+        if self._next_tick is None:
+            self._next_tick = now + self._interval
+        elif self._next_tick <= now:
+            # skip the ticks missed while idle, keeping their phase
+            missed = math.floor((now - self._next_tick) / self._interval) + 1
+            self._next_tick += missed * self._interval
+
+        return self._next_tick
+
+    async def receive(self) -> T:
+        if self._pending is _empty:
+            # nothing to deliver so wait without waking for each tick
+            self._pending = await self._source.receive()
+
+        with trio.move_on_at(self._advance()):
+            while True:
+                try:
+                    self._pending = await self._source.receive()
+                except trio.EndOfChannel:
+                    break
+
+        return self._take()
+
+
+def sample(
+    channel: trio.abc.ReceiveChannel[T], interval: float
+) -> trio.abc.ReceiveChannel[T]:
+    """Receive the latest value once every ``interval`` seconds.  Ticks with no new
+    value are skipped.  Use this to refresh a display at a steady rate from a source
+    updating faster than it can be shown.
+
+    Args:
+        channel: The channel to receive from.
+        interval: The time in seconds between ticks.
+
+    Returns:
+        A channel of the sampled values.  A held value is delivered immediately when
+        ``channel`` ends.
+    """
+    _check_interval(interval=interval)
+
+    return _Sample(source=channel, interval=interval)
+
+
+class _Buffer(_Operator[T, typing.List[T]]):
+    def __init__(
+        self, source: trio.abc.ReceiveChannel[T], interval: float, max_items: float
+    ) -> None:
+        super().__init__(source=source)
+        self._interval = interval
+        self._max_items = max_items
+        self._batch: typing.List[T] = []
+        self._deadline = math.inf
+
+    async def receive(self) -> typing.List[T]:
+        if len(self._batch) == 0:
+            self._batch.append(await self._source.receive())
+            self._deadline = trio.current_time() + self._interval
+
+        with trio.move_on_at(self._deadline):
+            while len(self._batch) < self._max_items:
+                try:
+                    self._batch.append(await self._source.receive())
+                except trio.EndOfChannel:
+                    break
+
+        batch = self._batch
+        self._batch = []
+
+        return batch
+
+
+def buffer(
+    channel: trio.abc.ReceiveChannel[T],
+    interval: float = math.inf,
+    max_items: float = math.inf,
+) -> trio.abc.ReceiveChannel[typing.List[T]]:
+    """Receive values in lists collected over time or up to a count.  A list is
+    delivered ``interval`` seconds after its first value arrived or once it holds
+    ``max_items`` values, whichever comes first.  At least one limit must be given.
+
+    Args:
+        channel: The channel to receive from.
+        interval: The longest time in seconds to collect a list for.
+        max_items: The largest number of values in a list.
+
+    Returns:
+        A channel of non-empty lists of values.  A partial list is delivered
+        immediately when ``channel`` ends.
+    """
+    if interval == math.inf and max_items == math.inf:
+        raise ValueError("At least one of interval and max_items must be finite.")
+
+    if interval != math.inf:
+        _check_interval(interval=interval)
+
+    if max_items < 1:
+        raise ValueError(f"max_items must be at least one, got: {max_items!r}")
+
+    return _Buffer(source=channel, interval=interval, max_items=max_items)
+
+
+class _DistinctUntilChanged(_Operator[T, T]):
+    def __init__(
+        self,
+        source: trio.abc.ReceiveChannel[T],
+        key: typing.Optional[typing.Callable[[T], object]],
+    ) -> None:
+        super().__init__(source=source)
+        self._key = key
+        self._last: object = _empty
+
+    async def receive(self) -> T:
+        while True:
+            value = await self._source.receive()
+            key = value if self._key is None else self._key(value)
+
+            if self._last is not _empty and key == self._last:
+                continue
+
+            self._last = key
+
+            return value
+
+
+def distinct_until_changed(
+    channel: trio.abc.ReceiveChannel[T],
+    key: typing.Optional[typing.Callable[[T], object]] = None,
+) -> trio.abc.ReceiveChannel[T]:
+    """Skip values equal to the one before.  Emissions are equal when they are from
+    the same signal with equal arguments.
+
+    Args:
+        channel: The channel to receive from.
+        key: Called with each value to get what is compared.  :obj:`None` to compare
+            the values themselves.
+
+    Returns:
+        A channel of the values which differ from the one before.
+    """
+    return _DistinctUntilChanged(source=channel, key=key)
@@ -0,0 +1,111 @@
+"""Tools for testing QTrio applications."""
+import math
+import typing
+
+import trio
+import trio.abc
+import trio.testing
+
+if typing.TYPE_CHECKING:
+    from qts import QtCore
+
+
+class _AutojumpInstrument(trio.abc.Instrument):
+    """Keep an :class:`AutojumpClock` in step with the run it is attached to."""
+
+    def __init__(self, clock: "AutojumpClock") -> None:
+        self._clock = clock
+
+    def after_io_wait(self, timeout: float) -> None:
+        # Trio is running again so it may no longer be idle until the deadline
+        self._clock._idle_deadline = None
+
+    def after_run(self) -> None:
+        self._clock._disconnect()
+
+
+class AutojumpClock(trio.abc.Clock):
+    """A clock like :class:`trio.testing.MockClock` which jumps ahead to the next Trio
+    deadline only once both Trio and the Qt event loop hosting it are idle.  Trio's own
+    autojumping considers only Trio and so can jump while Qt still has events to
+    deliver that would have woken a Trio task.  Here Trio being idle is observed via
+    :meth:`deadline_to_sleep_time` and Qt being idle via the event dispatcher's
+    ``aboutToBlock`` signal.  Qt timers run in real time and do not hold off a jump.
+
+    Pass an instance as :attr:`qtrio.Runner.clock` or use the
+    ``qtrio_autojump_clock`` pytest fixture.
+    """
+
+    def __init__(self) -> None:
+        self._clock = trio.testing.MockClock()
+        self._idle_deadline: typing.Optional[float] = None
+        self._token: typing.Optional[trio.lowlevel.TrioToken] = None
+        self._dispatcher: typing.Optional["QtCore.QAbstractEventDispatcher"] = None
+        self.jumps = 0
+        """The number of times the clock has jumped."""
+
+    def start_clock(self) -> None:
+        """See :meth:`trio.abc.Clock.start_clock`."""
+        self._clock.start_clock()
+
+    def current_time(self) -> float:
+        """See :meth:`trio.abc.Clock.current_time`."""
+        return self._clock.current_time()
+
+    def deadline_to_sleep_time(self, deadline: float) -> float:
+        """Trio calls this when it has no runnable tasks.  The deadline is remembered
+        so the clock can jump to it once Qt is idle too.  It is forgotten as soon as
+        Trio runs again.
+        """
+        self._idle_deadline = deadline
+
+        if self._dispatcher is None:
+            self._connect()
+
+        return self._clock.deadline_to_sleep_time(deadline)
+
+    def jump(self, seconds: float) -> None:
+        """Manually advance the clock.  See :meth:`trio.testing.MockClock.jump`.
+
+        Args:
+            seconds: The number of seconds to jump the clock forward.
+        """
+        self._clock.jump(seconds)
+
+    def _connect(self) -> None:
+        from qts import QtCore
+
+        # the dispatcher of the thread hosting Trio, normally the application's thread
+        dispatcher = QtCore.QAbstractEventDispatcher.instance()
+
+        if dispatcher is None:  # pragma: no cover
+            return
+
+        self._token = trio.lowlevel.current_trio_token()
+        self._dispatcher = dispatcher
+        dispatcher.aboutToBlock.connect(self._qt_idle)
+        trio.lowlevel.add_instrument(_AutojumpInstrument(clock=self))
+
+    def _disconnect(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.aboutToBlock.disconnect(self._qt_idle)
+            self._dispatcher = None
+            self._token = None
+
+    def _qt_idle(self) -> None:
+        deadline = self._idle_deadline
+        self._idle_deadline = None
+
+        if deadline is None or self._token is None or deadline == math.inf:
+            return
+
+        jump = deadline - self.current_time()
+
+        if jump <= 0:
+            return
+
+        self.jump(jump)
+        self.jumps += 1
+
+        # wake Trio from waiting for I/O so it sees the expired deadline
+        self._token.run_sync_soon(lambda: None)
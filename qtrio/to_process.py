@@ -0,0 +1,352 @@
+"""Run CPU heavy sync functions in a persistent pool of worker processes from Trio."""
+import atexit
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.context
+import os
+import threading
+import typing
+
+import async_generator
+import attr
+import outcome
+import trio
+
+import qtrio
+
+
+T = typing.TypeVar("T")
+
+_connection: typing.Optional[multiprocessing.connection.Connection] = None
+"""The connection to the pool, set only in worker processes."""
+
+
+def report_progress(value: object) -> None:
+    """Report progress from a function running in a worker process.  The value will be
+    yielded when iterating over the :class:`qtrio.to_process.Job`.  When not called
+    from a worker process, such as when the function is run directly, this does
+    nothing.
+
+    Args:
+        value: The picklable progress to report.
+    """
+    if _connection is not None:
+        _connection.send(("progress", value))
+
+
+def _worker_main(connection: multiprocessing.connection.Connection) -> None:
+    global _connection
+
+    _connection = connection
+
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+
+        if message is None:
+            return
+
+        fn, args = message
+        result = outcome.capture(fn, *args)
+
+        try:
+            connection.send(("result", result))
+        except Exception as e:
+            # such as when the result can not be pickled
+            connection.send(("result", outcome.Error(e)))
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _Worker:
+    process: multiprocessing.process.BaseProcess
+    connection: multiprocessing.connection.Connection
+    dead: bool = False
+
+    def kill(self) -> None:
+        # the connection is left for the receiving thread to see the end of
+        self.dead = True
+        self.process.kill()
+
+    def stop(self, timeout: float) -> None:
+        if not self.dead:
+            try:
+                self.connection.send(None)
+            except OSError:  # pragma: no cover
+                pass
+
+            self.process.join(timeout)
+
+        if self.process.is_alive():  # pragma: no cover
+            self.process.kill()
+            self.process.join()
+
+        self.connection.close()
+
+    async def receive(self) -> typing.Tuple[str, object]:
+        """Receive the next message from the worker.  If cancelled, the worker is
+        killed rather than waiting for the function it is running to finish.
+
+        Raises:
+            qtrio.WorkerProcessDiedError: if the worker exited unexpectedly.
+        """
+        task = trio.lowlevel.current_task()
+        token = trio.lowlevel.current_trio_token()
+        abandoned = False
+
+        def reschedule(result: outcome.Outcome) -> None:
+            if not abandoned:
+                trio.lowlevel.reschedule(task, result)
+
+        def deliver(result: outcome.Outcome) -> None:
+            try:
+                token.run_sync_soon(reschedule, result)
+            except trio.RunFinishedError:  # pragma: no cover
+                pass
+
+        trio.lowlevel.start_thread_soon(self.connection.recv, deliver)
+
+        def abort(raise_cancel: object) -> trio.lowlevel.Abort:
+            nonlocal abandoned
+            abandoned = True
+            self.kill()
+
+            return trio.lowlevel.Abort.SUCCEEDED
+
+        try:
+            message = await trio.lowlevel.wait_task_rescheduled(abort)
+        except (EOFError, OSError) as e:
+            self.dead = True
+            # the pipe closing means the process is exiting, collect the exit code
+            await trio.to_thread.run_sync(self.process.join, 5)
+            raise qtrio.WorkerProcessDiedError(exit_code=self.process.exitcode) from e
+
+        return typing.cast(typing.Tuple[str, object], message)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class Job(typing.Generic[T]):
+    """A function running in a worker process.  Iterate over the job to receive the
+    values passed to :func:`qtrio.to_process.report_progress` as they arrive.  The
+    iteration ends when the function returns.  Created by
+    :meth:`qtrio.to_process.ProcessPool.open_job`.
+    """
+
+    _worker: _Worker
+    _outcome: typing.Optional[outcome.Outcome] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the function has finished running."""
+        return self._outcome is not None
+
+    def __aiter__(self) -> "Job[T]":
+        return self
+
+    async def __anext__(self) -> typing.Any:
+        if self._outcome is not None:
+            raise StopAsyncIteration()
+
+        kind, value = await self._worker.receive()
+
+        if kind == "progress":
+            return value
+
+        self._outcome = typing.cast(outcome.Outcome, value)
+        raise StopAsyncIteration()
+
+    async def wait(self) -> T:
+        """Wait for the function to finish, discarding any further progress.
+
+        Returns:
+            The object returned by the function.
+
+        Raises:
+            Exception: Whatever the function raised.
+            qtrio.WorkerProcessDiedError: if the worker process exited unexpectedly.
+        """
+        async for _ in self:
+            pass
+
+        if self._outcome is None:  # pragma: no cover
+            raise qtrio.InternalError("Job finished without an outcome.")
+
+        return typing.cast(T, self._outcome.unwrap())
+
+
+def _default_context() -> multiprocessing.context.BaseContext:
+    # forking a process with Qt and Trio threads running is not safe
+    return multiprocessing.get_context("spawn")
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ProcessPool:
+    """A pool of worker processes which persist between jobs to avoid the cost of
+    starting a new process each time.  Workers are started as needed up to
+    :attr:`max_workers`.  Functions, their arguments, their results, and their
+    progress must all be picklable.
+    """
+
+    max_workers: int = attr.ib(factory=lambda: os.cpu_count() or 1)
+    """The largest number of worker processes to run at once."""
+    context: multiprocessing.context.BaseContext = attr.ib(factory=_default_context)
+    """The :mod:`multiprocessing` context used to start the workers."""
+
+    _idle: typing.List[_Worker] = attr.ib(factory=list, init=False)
+    _workers: typing.Set[_Worker] = attr.ib(factory=set, init=False)
+    _limiter: trio.Semaphore = attr.ib(init=False)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False)
+
+    @_limiter.default
+    def _limiter_default(self) -> trio.Semaphore:
+        return trio.Semaphore(self.max_workers)
+
+    def _start_worker(self) -> _Worker:
+        connection, child_connection = self.context.Pipe()
+        process = self.context.Process(  # type: ignore[attr-defined]
+            target=_worker_main, args=(child_connection,), daemon=True
+        )
+        process.start()
+        child_connection.close()
+
+        worker = _Worker(process=process, connection=connection)
+
+        with self._lock:
+            self._workers.add(worker)
+
+        return worker
+
+    async def _acquire_worker(self) -> _Worker:
+        with self._lock:
+            while len(self._idle) > 0:
+                worker = self._idle.pop()
+
+                if worker.process.is_alive():
+                    return worker
+
+                self._workers.discard(worker)
+
+        return await trio.to_thread.run_sync(self._start_worker)
+
+    def _release_worker(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker.dead:
+                self._workers.discard(worker)
+            else:
+                self._idle.append(worker)
+
+    @async_generator.asynccontextmanager
+    async def open_job(
+        self, fn: typing.Callable[..., T], *args: object
+    ) -> typing.AsyncIterator[Job[T]]:
+        """Start running ``fn`` in a worker process.  Waits for a worker to be
+        available if :attr:`max_workers` are already busy.  If the context is exited
+        before the job is done, such as by cancellation, the worker is killed.
+
+        .. code-block:: python
+
+            async with pool.open_job(fn, path) as job:
+                async for progress in job:
+                    print(progress)
+
+            result = await job.wait()
+
+        Args:
+            fn: The picklable function to call.
+            args: Picklable positional arguments to pass to ``fn``.
+
+        Yields:
+            The running job.
+        """
+        async with self._limiter:
+            worker = await self._acquire_worker()
+
+            try:
+                await trio.to_thread.run_sync(worker.connection.send, (fn, args))
+                job: Job[T] = Job(worker=worker)
+
+                yield job
+
+                if not job.done:
+                    worker.kill()
+            except BaseException:
+                worker.kill()
+                raise
+            finally:
+                self._release_worker(worker)
+
+    async def run_sync(self, fn: typing.Callable[..., T], *args: object) -> T:
+        """Run ``fn`` in a worker process and return the result.  Progress is
+        discarded.  If cancelled, the worker is killed.
+
+        Args:
+            fn: The picklable function to call.
+            args: Picklable positional arguments to pass to ``fn``.
+
+        Returns:
+            The object returned by ``fn``.
+
+        Raises:
+            Exception: Whatever ``fn`` raises.
+            qtrio.WorkerProcessDiedError: if the worker process exited unexpectedly.
+        """
+        job: Job[T]
+
+        async with self.open_job(fn, *args) as job:
+            return await job.wait()
+
+    def close(self, timeout: float = 5) -> None:
+        """Stop all of the workers.  Idle workers are asked to exit and busy workers
+        are killed.
+
+        Args:
+            timeout: The time in seconds to wait for each idle worker to exit before
+                killing it.
+        """
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+            self._idle.clear()
+
+        for worker in workers:
+            worker.stop(timeout=timeout)
+
+
+_default_pool: typing.Optional[ProcessPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool() -> ProcessPool:
+    """Get the process pool used by :func:`qtrio.to_process.run_sync` and
+    :func:`qtrio.to_process.open_job`.  It is created on first use and closed when
+    the interpreter exits.
+
+    Returns:
+        The default process pool.
+    """
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ProcessPool()
+            atexit.register(_default_pool.close)
+
+        return _default_pool
+
+
+async def run_sync(fn: typing.Callable[..., T], *args: object) -> T:
+    """Run ``fn`` in a worker process of the :func:`qtrio.to_process.default_pool`.
+    See :meth:`qtrio.to_process.ProcessPool.run_sync`.
+    """
+    return await default_pool().run_sync(fn, *args)
+
+
+def open_job(
+    fn: typing.Callable[..., T], *args: object
+) -> typing.AsyncContextManager[Job[T]]:
+    """Start running ``fn`` in a worker process of the
+    :func:`qtrio.to_process.default_pool`.  See
+    :meth:`qtrio.to_process.ProcessPool.open_job`.
+    """
+    return default_pool().open_job(fn, *args)
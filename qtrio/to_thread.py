@@ -0,0 +1,182 @@
+"""Run sync functions in Qt's thread pool from Trio."""
+import threading
+import typing
+import weakref
+
+import attr
+import outcome
+from qts import QtCore
+import trio
+
+import qtrio._core
+
+
+T = typing.TypeVar("T")
+
+
+@attr.s(auto_attribs=True, eq=False)
+class PoolStatistics:
+    """Counts of the work submitted to a ``QtCore.QThreadPool`` via
+    :func:`qtrio.to_thread.run_sync`.  Work submitted directly by Qt or other code is
+    not included.  Use :func:`qtrio.to_thread.statistics` to get the instance for a
+    pool.
+    """
+
+    submitted: int = 0
+    """The total number of functions submitted."""
+    queued: int = 0
+    """The number of submitted functions waiting for a thread."""
+    running: int = 0
+    """The number of submitted functions presently running."""
+    completed: int = 0
+    """The total number of functions which have finished running."""
+    cancelled: int = 0
+    """The total number of functions cancelled before they started."""
+    max_queued: int = 0
+    """The largest value :attr:`queued` has reached."""
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    def _submit(self) -> None:
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+    def _start(self) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+
+    def _complete(self) -> None:
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+
+    def _cancel(self) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.cancelled += 1
+
+
+_statistics: "weakref.WeakKeyDictionary[QtCore.QThreadPool, PoolStatistics]" = (
+    weakref.WeakKeyDictionary()
+)
+_statistics_lock = threading.Lock()
+_global_pool: typing.Optional[QtCore.QThreadPool] = None
+"""A strong reference to the wrapper of Qt's global pool.  Some wrappers, such as
+PySide6, otherwise create a new wrapper each time the previous one is collected which
+would drop its entry from :data:`_statistics`.
+"""
+
+
+def _pool_or_global(pool: typing.Optional[QtCore.QThreadPool]) -> QtCore.QThreadPool:
+    global _global_pool
+
+    if _global_pool is None:
+        # held before looking at the passed pool so that, if it is the global pool,
+        # the wrapper passed is the one held
+        _global_pool = QtCore.QThreadPool.globalInstance()
+
+    if pool is None:
+        pool = _global_pool
+
+        if pool is None:  # pragma: no cover
+            raise qtrio.InternalError("Qt's global thread pool is not available.")
+
+    return pool
+
+
+def statistics(pool: typing.Optional[QtCore.QThreadPool] = None) -> PoolStatistics:
+    """Get the statistics of the work submitted to ``pool`` by
+    :func:`qtrio.to_thread.run_sync`.
+
+    Args:
+        pool: The pool to get the statistics of.  :obj:`None` for Qt's global pool.
+
+    Returns:
+        The live statistics object for the pool.
+    """
+    pool = _pool_or_global(pool)
+
+    with _statistics_lock:
+        return _statistics.setdefault(pool, PoolStatistics())
+
+
+class _Runnable(QtCore.QRunnable):
+    def __init__(
+        self,
+        fn: typing.Callable[[], object],
+        deliver: typing.Callable[[outcome.Outcome], None],
+        stats: PoolStatistics,
+    ) -> None:
+        super().__init__()
+        # the Python object is kept alive by the waiting task, not by Qt
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.deliver = deliver
+        self.stats = stats
+
+    def run(self) -> None:
+        self.stats._start()
+        result = outcome.capture(self.fn)
+        self.stats._complete()
+        self.deliver(result)
+
+
+async def run_sync(
+    fn: typing.Callable[..., T],
+    *args: object,
+    pool: typing.Optional[QtCore.QThreadPool] = None,
+) -> T:
+    """Run a sync function in a thread from a ``QtCore.QThreadPool`` and return the
+    result.  This is an alternative to :func:`trio.to_thread.run_sync` which shares
+    Qt's bounded pool rather than creating additional threads.  When run by QTrio the
+    result is delivered via the same reenter path used by :class:`qtrio.Runner` to run
+    Trio itself.
+
+    If cancelled while ``fn`` is still waiting for a thread then it is removed from the
+    pool's queue and :exc:`trio.Cancelled` is raised.  Once ``fn`` has started,
+    cancellation waits for it to complete.
+
+    Args:
+        fn: The function to call.
+        args: Positional arguments to pass to ``fn``.
+        pool: The pool to run ``fn`` in.  :obj:`None` for Qt's global pool.
+
+    Returns:
+        The object returned by ``fn``.
+
+    Raises:
+        Exception: Whatever ``fn`` raises.
+    """
+    await trio.lowlevel.checkpoint_if_cancelled()
+
+    pool = _pool_or_global(pool)
+    stats = statistics(pool)
+    task = trio.lowlevel.current_task()
+    runner: typing.Optional[qtrio._core.Runner] = qtrio._core._current_runner.get(None)
+
+    run_sync_soon_threadsafe: typing.Callable[[typing.Callable[[], object]], None]
+
+    if runner is None:
+        run_sync_soon_threadsafe = trio.lowlevel.current_trio_token().run_sync_soon
+    else:
+        run_sync_soon_threadsafe = runner.run_sync_soon_threadsafe
+
+    def deliver(result: outcome.Outcome) -> None:
+        run_sync_soon_threadsafe(lambda: trio.lowlevel.reschedule(task, result))
+
+    runnable = _Runnable(fn=lambda: fn(*args), deliver=deliver, stats=stats)
+    stats._submit()
+    pool.start(runnable)
+
+    def abort(raise_cancel: object) -> trio.lowlevel.Abort:
+        if pool.tryTake(runnable):
+            stats._cancel()
+            return trio.lowlevel.Abort.SUCCEEDED
+
+        return trio.lowlevel.Abort.FAILED
+
+    result = await trio.lowlevel.wait_task_rescheduled(abort)
+
+    return typing.cast(T, result)